@@ -1,25 +1,34 @@
 """sec2md: Convert SEC filings to high-quality Markdown."""
 
-from sec2md.core import convert_to_markdown, parse_filing
+from sec2md.core import convert_to_markdown, parse_filing, load_filing
 from sec2md.utils import flatten_note
-from sec2md.sections import extract_sections, get_section
-from sec2md.chunking import chunk_pages, chunk_section, merge_text_blocks, chunk_text_block
+from sec2md.sections import extract_sections, iter_sections, get_section
+from sec2md.chunking import chunk_pages, chunk_section, chunk_filing, merge_text_blocks, chunk_text_block
 from sec2md.visualize import highlight_html
 from sec2md.models import Page, Section, Item10K, Item10Q, Item8K, Item13D, Item13G, FilingType, Element, TextBlock, Exhibit
 from sec2md.chunker.chunk import Chunk
 from sec2md.chunker.chunker import Chunker
 from sec2md.parser import Parser
 from sec2md.section_extractor import SectionExtractor
+from sec2md.cache import TableCache, ParseCache, ParsedFiling
+from sec2md.markdown_table import TableFormat
+from sec2md.xbrl import FactTable
+from sec2md.element_index import ElementIndex
+from sec2md.quote_index import QuoteIndex
+from sec2md.cross_references import CrossReferenceGraph
 
 __version__ = "0.1.22"
 __all__ = [
     "convert_to_markdown",
     "parse_filing",
+    "load_filing",
     "flatten_note",
     "extract_sections",
+    "iter_sections",
     "get_section",
     "chunk_pages",
     "chunk_section",
+    "chunk_filing",
     "merge_text_blocks",
     "chunk_text_block",
     "highlight_html",
@@ -38,4 +47,12 @@ __all__ = [
     "Chunker",
     "Parser",
     "SectionExtractor",
+    "TableCache",
+    "ParseCache",
+    "ParsedFiling",
+    "TableFormat",
+    "FactTable",
+    "ElementIndex",
+    "QuoteIndex",
+    "CrossReferenceGraph",
 ]
@@ -2,152 +2,153 @@ from __future__ import annotations
 
 import re
 from bs4 import Tag
-from collections import defaultdict
-from typing import List, Optional, Tuple, Dict
+from dataclasses import dataclass
+from typing import List, Optional, Tuple, Dict, Sequence, Union
 
-from sec2md.utils import NUMERIC_RE, median, clean_text
+from sec2md.layout import PositionedBox, is_spacer
+from sec2md.utils import NUMERIC_RE, median
 
 
-class AbsolutelyPositionedTableParser:
-    """Parser for pseudo-tables built from position:absolute divs in some SEC filings."""
+@dataclass
+class _GridLayout:
+    """Boxes kept after caption filtering, with row and column ids (ascending with y and x)."""
+    elements: List[Tuple[float, float, PositionedBox]]
+    row_ids: List[int]
+    col_ids: List[int]
+    n_rows: int
+    n_cols: int
 
-    def __init__(self, elements: List[Tag]):
-        self.elements = elements
-        self.positioned_elements = self._extract_positions()
 
-    def _get_position(self, el: Tag) -> Optional[Tuple[float, float]]:
-        """Extract (left, top) position from element style."""
-        if not isinstance(el, Tag):
-            return None
-        style = el.get("style", "")
-        left_match = re.search(r'left:\s*(\d+(?:\.\d+)?)px', style)
-        top_match = re.search(r'top:\s*(\d+(?:\.\d+)?)px', style)
-        if left_match and top_match:
-            return (float(left_match.group(1)), float(top_match.group(1)))
-        return None
+class AbsolutelyPositionedTableParser:
+    """Parser for pseudo-tables built from position:absolute divs in some SEC filings.
 
-    def _clean_text(self, element: Tag) -> str:
-        return clean_text(element.get_text(separator=" ", strip=True))
+    Accepts raw tags or ``PositionedBox`` entries from a ``LayoutIndex``;
+    positioned elements are ``(left, top, box)`` tuples.
+    """
 
-    def _is_bold(self, el: Tag) -> bool:
-        style = (el.get("style") or "").lower()
-        return "font-weight:700" in style or "font-weight:bold" in style
+    def __init__(self, elements: Sequence[Union[Tag, PositionedBox]]):
+        self.boxes = [el if isinstance(el, PositionedBox) else PositionedBox.from_tag(el)
+                      for el in elements if isinstance(el, (Tag, PositionedBox))]
+        self.elements = [box.el for box in self.boxes]
+        self.positioned_elements = self._extract_positions()
+        self._layout: Optional[_GridLayout] = None
+        self._table_like: Optional[bool] = None
 
     @staticmethod
     def _is_spacer(el) -> bool:
         """Detect inline-block spacer boxes common in PDF->HTML conversions."""
         if not isinstance(el, Tag):
             return False
-        style = el.get("style", "").lower().replace(" ", "")
-        text = el.get_text(strip=True)
-        has_nbsp = '\xa0' in str(el) or '&nbsp;' in str(el)
-        width_match = re.search(r'width:(\d+)px', style)
-        return (
-            'display:inline-block' in style
-            and (not text or has_nbsp)
-            and bool(width_match and int(width_match.group(1)) < 30)
-        )
+        return is_spacer(el)
 
     def _contains_number(self, text: str) -> bool:
         return bool(NUMERIC_RE.search(text))
 
-    def _extract_positions(self) -> List[Tuple[float, float, Tag]]:
+    def _extract_positions(self) -> List[Tuple[float, float, PositionedBox]]:
         positioned = []
-        for el in self.elements:
-            pos = self._get_position(el)
-            if self._is_spacer(el):
+        for box in self.boxes:
+            pos = box.position
+            if box.spacer:
                 if pos:
-                    positioned.append((pos[0], pos[1], el))
+                    positioned.append((pos[0], pos[1], box))
                 continue
-            text = self._clean_text(el)
-            if pos and text:
-                positioned.append((pos[0], pos[1], el))
+            if pos and box.text:
+                positioned.append((pos[0], pos[1], box))
         return positioned
 
-    def _filter_table_content(self, elements: List[Tuple[float, float, Tag]]) -> List[Tuple[float, float, Tag]]:
+    def _filter_table_content(self, elements: List[Tuple[float, float, PositionedBox]]) -> List[Tuple[float, float, PositionedBox]]:
         """Filter out title/caption text that appears before the actual table."""
         if len(elements) < 10:
             return elements
 
-        y_coords = [top for _, top, _ in elements]
-        y_clusters = self._cluster_by_eps(y_coords, eps=15)
+        row_ids, n_rows = self._sweep_clusters([top for _, top, _ in elements], eps=15)
 
-        row_counts = defaultdict(list)
-        for left, top, el in elements:
-            row_counts[y_clusters[top]].append((left, top, el))
-
-        sorted_rows = sorted(row_counts.items(), key=lambda x: min(t for _, t, _ in x[1]))
-
-        # First row with >= 3 elements is likely the start of the actual table
-        table_start_row = None
-        for row_id, row_elements in sorted_rows:
-            if len(row_elements) >= 3:
-                table_start_row = row_id
-                break
+        # Row ids ascend with y, so the first row with >= 3 elements is the
+        # lowest id with >= 3 members: likely the start of the actual table
+        row_sizes = [0] * n_rows
+        row_min_top = [float("inf")] * n_rows
+        for (_, top, _), row_id in zip(elements, row_ids):
+            row_sizes[row_id] += 1
+            row_min_top[row_id] = min(row_min_top[row_id], top)
 
+        table_start_row = next((r for r in range(n_rows) if row_sizes[r] >= 3), None)
         if table_start_row is None:
             return elements
 
-        table_start_y = min(top for _, top, _ in row_counts[table_start_row])
+        table_start_y = row_min_top[table_start_row]
         filtered = [(l, t, e) for l, t, e in elements if t >= table_start_y - 30]
         return filtered if len(filtered) >= 6 else elements
 
-    def _cluster_by_eps(self, values: List[float], eps: float) -> Dict[float, int]:
-        """Cluster positions within epsilon tolerance to handle rendering jitter."""
+    @staticmethod
+    def _sweep_clusters(values: List[float], eps: float) -> Tuple[List[int], int]:
+        """Assign a cluster id to every value in one sweep over the sorted values.
+
+        A new cluster starts when a value is more than ``eps`` past the current
+        cluster's first value. Ids ascend with position. Returns (ids aligned
+        with ``values``, number of clusters).
+        """
         if not values:
-            return {}
+            return [], 0
 
-        sorted_vals = sorted(set(values))
+        order = sorted(range(len(values)), key=values.__getitem__)
+        ids = [0] * len(values)
         cluster_id = 0
-        clusters = {}
-        anchor = sorted_vals[0]
-
-        for val in sorted_vals:
-            if val - anchor > eps:
+        anchor = values[order[0]]
+        for i in order:
+            if values[i] - anchor > eps:
                 cluster_id += 1
-                anchor = val
-            clusters[val] = cluster_id
+                anchor = values[i]
+            ids[i] = cluster_id
+        return ids, cluster_id + 1
 
-        return clusters
+    def _cluster_by_eps(self, values: List[float], eps: float) -> Dict[float, int]:
+        """Cluster positions within epsilon tolerance to handle rendering jitter."""
+        ids, _ = self._sweep_clusters(values, eps)
+        return dict(zip(values, ids))
+
+    def _grid_layout(self) -> Optional[_GridLayout]:
+        """Filtered boxes with row/column ids, computed once and shared by detection and rendering."""
+        if self._layout is None and len(self.positioned_elements) >= 6:
+            filtered = self._filter_table_content(self.positioned_elements)
+            row_ids, n_rows = self._sweep_clusters([top for _, top, _ in filtered], eps=12)
+            col_ids, n_cols = self._sweep_clusters([left for left, _, _ in filtered], eps=50)
+            self._layout = _GridLayout(filtered, row_ids, col_ids, n_rows, n_cols)
+        return self._layout
 
     def is_table_like(self) -> bool:
         """Determine if positioned elements form a table-like structure."""
+        if self._table_like is None:
+            self._table_like = self._detect_table()
+        return self._table_like
+
+    def _detect_table(self) -> bool:
         if len(self.positioned_elements) < 6:
             return False
 
-        filtered_elements = self._filter_table_content(self.positioned_elements)
+        layout = self._grid_layout()
+        filtered_elements = layout.elements
         if len(filtered_elements) < 6:
             return False
 
-        x_coords = [left for left, _, _ in filtered_elements]
-        y_coords = [top for _, top, _ in filtered_elements]
-
-        y_clusters = self._cluster_by_eps(y_coords, eps=12)
-        x_clusters = self._cluster_by_eps(x_coords, eps=50)
-
-        n_rows = len(set(y_clusters.values()))
-        n_cols = len(set(x_clusters.values()))
+        n_rows, n_cols = layout.n_rows, layout.n_cols
 
         if n_rows < 2 or n_cols < 2:
             return False
 
         # >= 20% of cells should contain numbers
-        elements_with_numbers = sum(
-            1 for _, _, el in filtered_elements
-            if not self._is_spacer(el) and self._contains_number(self._clean_text(el))
-        )
-        if elements_with_numbers / len(filtered_elements) < 0.20:
+        numeric = [not box.spacer and self._contains_number(box.text) for _, _, box in filtered_elements]
+        if sum(numeric) / len(filtered_elements) < 0.20:
             return False
 
         # Avg cell > 50 chars = probably prose, not a table
-        avg_length = sum(len(self._clean_text(el)) for _, _, el in filtered_elements) / len(filtered_elements)
+        avg_length = sum(len(box.text) for _, _, box in filtered_elements) / len(filtered_elements)
         if avg_length > 50:
             return False
 
         # > 40% long text with periods = prose
         text_with_periods = sum(
-            1 for _, _, el in filtered_elements
-            if '.' in self._clean_text(el) and len(self._clean_text(el)) > 20
+            1 for _, _, box in filtered_elements
+            if '.' in box.text and len(box.text) > 20
         )
         if text_with_periods / len(filtered_elements) > 0.40:
             return False
@@ -156,61 +157,40 @@ class AbsolutelyPositionedTableParser:
         if len(filtered_elements) / (n_rows * n_cols) < 0.25:
             return False
 
-        # Rows should average >= 2 elements
-        row_counts = defaultdict(int)
-        for left, top, _ in filtered_elements:
-            row_counts[y_clusters[top]] += 1
-        counts = list(row_counts.values())
-        if not counts or sum(counts) / len(counts) < 2:
+        # Rows should average >= 2 elements (every row id has at least one element)
+        if len(filtered_elements) / n_rows < 2:
             return False
 
         # At least one column should be predominantly numeric
-        col_elements = defaultdict(list)
-        for left, top, element in filtered_elements:
-            col_elements[x_clusters[left]].append(element)
+        col_sizes = [0] * n_cols
+        col_numeric = [0] * n_cols
+        for col_id, is_numeric in zip(layout.col_ids, numeric):
+            col_sizes[col_id] += 1
+            col_numeric[col_id] += is_numeric
 
         has_numeric_column = any(
-            sum(1 for el in elems if not self._is_spacer(el) and self._contains_number(self._clean_text(el)))
-            / len(elems) > 0.5
-            for elems in col_elements.values()
-            if len(elems) >= 2
+            col_numeric[c] / col_sizes[c] > 0.5
+            for c in range(n_cols)
+            if col_sizes[c] >= 2
         )
         if not has_numeric_column:
             return False
 
         return True
 
-    def to_grid(self) -> Optional[List[List[List[Tuple[float, float, Tag]]]]]:
+    def to_grid(self) -> Optional[List[List[List[Tuple[float, float, PositionedBox]]]]]:
         """Convert positioned elements to a 2D grid, or None if not table-like."""
         if not self.is_table_like():
             return None
 
-        filtered_elements = self._filter_table_content(self.positioned_elements)
-        x_coords = [left for left, _, _ in filtered_elements]
-        y_coords = [top for _, top, _ in filtered_elements]
+        layout = self._grid_layout()
+        grid = [[[] for _ in range(layout.n_cols)] for _ in range(layout.n_rows)]
+        for element, row_id, col_id in zip(layout.elements, layout.row_ids, layout.col_ids):
+            grid[row_id][col_id].append(element)
 
-        y_clusters = self._cluster_by_eps(y_coords, eps=12)
-        x_clusters = self._cluster_by_eps(x_coords, eps=50)
-
-        sorted_row_ids = sorted(set(y_clusters.values()))
-        sorted_col_ids = sorted(set(x_clusters.values()))
-        row_index = {v: i for i, v in enumerate(sorted_row_ids)}
-        col_index = {v: i for i, v in enumerate(sorted_col_ids)}
-
-        n_rows = len(sorted_row_ids)
-        n_cols = len(sorted_col_ids)
-
-        grid_dict: Dict[Tuple[int, int], List[Tuple[float, float, Tag]]] = defaultdict(list)
-        for left, top, element in filtered_elements:
-            row_id = row_index[y_clusters[top]]
-            col_id = col_index[x_clusters[left]]
-            grid_dict[(row_id, col_id)].append((left, top, element))
-
-        grid = [[[] for _ in range(n_cols)] for _ in range(n_rows)]
-        for (row, col), cell_elements in grid_dict.items():
-            if row < n_rows and col < n_cols:
+        for row in grid:
+            for cell_elements in row:
                 cell_elements.sort(key=lambda x: x[0])
-                grid[row][col] = cell_elements
 
         return grid
 
@@ -228,14 +208,14 @@ class AbsolutelyPositionedTableParser:
                     text_row.append("")
                 else:
                     texts = []
-                    for _, _, element in cell_elements:
-                        if self._is_spacer(element):
+                    for _, _, box in cell_elements:
+                        if box.spacer:
                             if texts:
                                 texts.append(" ")
                         else:
-                            text = self._clean_text(element)
+                            text = box.text
                             if text:
-                                if self._is_bold(element):
+                                if box.bold:
                                     text = f"**{text}**"
                                 texts.append(text)
                     text_row.append("".join(texts))
@@ -360,14 +340,14 @@ class AbsolutelyPositionedTableParser:
         for i, row in enumerate(rows):
             row.sort(key=lambda x: x[0])
             texts = []
-            for _, _, el in row:
-                if self._is_spacer(el):
+            for _, _, box in row:
+                if box.spacer:
                     if texts:
                         texts.append(" ")
                 else:
-                    text = self._clean_text(el)
+                    text = box.text
                     if text:
-                        if self._is_bold(el):
+                        if box.bold:
                             text = f"**{text}**"
                         texts.append(text)
 
@@ -384,9 +364,8 @@ class AbsolutelyPositionedTableParser:
                 prev_line = lines[-1] if lines else ""
 
                 is_header = (
-                    any(self._is_bold(el) for _, _, el in row if not self._is_spacer(el)) and
-                    all(self._is_bold(el) for _, _, el in row if
-                        not self._is_spacer(el) and self._clean_text(el)) and
+                    any(box.bold for _, _, box in row if not box.spacer) and
+                    all(box.bold for _, _, box in row if not box.spacer and box.text) and
                     len(line) < 80
                 )
 
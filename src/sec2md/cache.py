@@ -0,0 +1,443 @@
+"""Content-addressed caches for repeated parsing work.
+
+Boilerplate tables (cover pages, signatures, exhibit indexes) are often
+byte-identical across a company's filings and across issuers that share a
+filing agent. ``TableCache`` stores the markdown rendered by ``TableParser``
+keyed by a normalized hash of the table HTML, so repeated tables skip grid
+construction entirely.
+
+Whole filings are reprocessed too (retries, re-chunking, several consumers
+of one document). ``ParseCache`` keeps complete parse results -- pages,
+elements, sections and the annotated-HTML sidecars -- keyed by a hash of the
+HTML, the library version and the parse options.
+"""
+
+from __future__ import annotations
+
+import re
+import json
+import zlib
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from bs4 import Tag
+
+from sec2md.models import Element, Exhibit, Page, Section, TextBlock
+from sec2md.text_buffer import PageSpan
+
+logger = logging.getLogger(__name__)
+
+_START_TAG_RE = re.compile(r"<([a-zA-Z][\w:.-]*)(\s[^>]*)?>")
+_SPAN_ATTR_RE = re.compile(r"""\b(rowspan|colspan)\s*=\s*["']?([^"'\s>]*)""", re.I)
+_TAG_EDGE_WS_RE = re.compile(r"\s*(<[^>]*>)\s*")
+
+
+def _library_version() -> str:
+    from sec2md import __version__
+    return __version__
+
+
+@dataclass
+class CacheStats:
+    """Hit/miss counters for a cache."""
+    hits: int = 0
+    misses: int = 0
+    disk_hits: int = 0
+    evictions: int = 0
+
+    @property
+    def lookups(self) -> int:
+        return self.hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from memory or disk."""
+        return self.hits / self.lookups if self.lookups else 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f"CacheStats(hits={self.hits}, misses={self.misses}, disk_hits={self.disk_hits}, "
+            f"evictions={self.evictions}, hit_rate={self.hit_rate:.1%})"
+        )
+
+
+def normalize_table_html(html: str) -> str:
+    """Reduce table HTML to the parts that affect its markdown rendering.
+
+    Drops every attribute except rowspan/colspan (ids, styles and XBRL
+    contextRefs differ between filings but not in the rendered table) and
+    whitespace around tags, which ``TableParser`` strips from cell text anyway.
+    """
+    def _strip_attrs(m: re.Match) -> str:
+        name = m.group(1).lower()
+        attrs = m.group(2) or ""
+        spans = " ".join(f"{k.lower()}={v}" for k, v in _SPAN_ATTR_RE.findall(attrs))
+        return f"<{name} {spans}>" if spans else f"<{name}>"
+
+    html = html.replace("\xa0", " ").replace("&nbsp;", " ")
+    html = _START_TAG_RE.sub(_strip_attrs, html)
+    return _TAG_EDGE_WS_RE.sub(r"\1", html).strip()
+
+
+class TableCache:
+    """Bounded LRU of rendered table markdown, optionally backed by a directory.
+
+    Share one instance across ``Parser`` objects (e.g. for a batch run) to
+    reuse the markdown of tables that repeat between filings.
+
+    Args:
+        max_entries: Maximum number of tables kept in memory.
+        cache_dir: Optional directory for a persistent second tier. Entries
+            are written on miss and read back when absent from memory.
+
+    Example:
+        >>> cache = TableCache(max_entries=4096, cache_dir=".sec2md-tables")
+        >>> for html in filings:
+        ...     pages = sec2md.parse_filing(html, table_cache=cache)
+        >>> print(cache.stats)
+        CacheStats(hits=812, misses=2301, disk_hits=0, evictions=0, hit_rate=26.1%)
+    """
+
+    def __init__(self, max_entries: int = 4096, cache_dir: Optional[Union[str, Path]] = None):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        if self.cache_dir:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.stats = CacheStats()
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key_for(table: Union[Tag, str]) -> str:
+        """Hash of the normalized table HTML, salted with the library version."""
+        html = str(table)
+        normalized = normalize_table_html(html)
+        digest = hashlib.sha1(f"{_library_version()}\0{normalized}".encode("utf-8"))
+        return digest.hexdigest()
+
+    def _disk_path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.md"
+
+    def get(self, key: str) -> Optional[str]:
+        """Return cached markdown for ``key`` or None, updating statistics."""
+        with self._lock:
+            markdown = self._entries.get(key)
+            if markdown is not None:
+                self._entries.move_to_end(key)
+                self.stats.hits += 1
+                return markdown
+
+        if self.cache_dir:
+            path = self._disk_path(key)
+            try:
+                markdown = path.read_text(encoding="utf-8")
+            except FileNotFoundError:
+                markdown = None
+            except OSError:
+                logger.warning("Failed to read table cache entry: %s", path)
+                markdown = None
+            if markdown is not None:
+                with self._lock:
+                    self.stats.hits += 1
+                    self.stats.disk_hits += 1
+                    self._store(key, markdown)
+                return markdown
+
+        with self._lock:
+            self.stats.misses += 1
+        return None
+
+    def put(self, key: str, markdown: str) -> None:
+        """Store rendered markdown for ``key`` in memory (and on disk if enabled)."""
+        with self._lock:
+            self._store(key, markdown)
+
+        if self.cache_dir:
+            path = self._disk_path(key)
+            try:
+                path.parent.mkdir(exist_ok=True)
+                tmp = path.with_suffix(".tmp")
+                tmp.write_text(markdown, encoding="utf-8")
+                tmp.replace(path)
+            except OSError:
+                logger.warning("Failed to write table cache entry: %s", path)
+
+    def _store(self, key: str, markdown: str) -> None:
+        self._entries[key] = markdown
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+    def clear(self) -> None:
+        """Drop in-memory entries and reset statistics (disk entries are kept)."""
+        with self._lock:
+            self._entries.clear()
+            self.stats = CacheStats()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        disk = f", cache_dir='{self.cache_dir}'" if self.cache_dir else ""
+        return f"TableCache(entries={len(self)}/{self.max_entries}{disk}, {self.stats})"
+
+
+@dataclass
+class ParsedFiling:
+    """A filing's parse results, as stored in a ``ParseCache``."""
+    pages: List[Page]
+    sections: Dict[str, List[Section]] = field(default_factory=dict)  # by filing type
+    html: Optional[str] = None                                       # Parser.html()
+    source_map: Optional[Dict[str, List[List[int]]]] = None          # SourceMap.to_dict()
+
+
+def _encode_filing(filing: ParsedFiling) -> Dict[str, Any]:
+    """JSON-friendly record of ``filing``: rows instead of dicts, each element once.
+
+    TextBlocks refer to their elements by index, and sections keep their
+    page spans as offsets (or the span text for sections that have already
+    built their pages).
+    """
+    elements: List[list] = []
+    element_index: Dict[int, int] = {}
+
+    def refs(items: Optional[List[Element]]) -> Optional[List[int]]:
+        if items is None:
+            return None
+        out = []
+        for e in items:
+            if id(e) not in element_index:
+                element_index[id(e)] = len(elements)
+                elements.append([
+                    e.id, e.content, e.kind, e.page_start, e.page_end,
+                    e.content_start_offset, e.content_end_offset, e.tags,
+                    list(e.table_columns) if e.table_columns else None,
+                ])
+            out.append(element_index[id(e)])
+        return out
+
+    pages = []
+    for page in filing.pages:
+        text_blocks = None
+        if page.text_blocks is not None:
+            text_blocks = [
+                [tb.name, tb.title, refs(tb.elements), tb.start_page, tb.end_page, tb.source_pages]
+                for tb in page.text_blocks
+            ]
+        pages.append([page.number, page.content, page.display_page, refs(page.elements), text_blocks])
+
+    sections = {}
+    for filing_type, items in filing.sections.items():
+        rows = []
+        for section in items:
+            if section.spans is not None:
+                spans = [
+                    [span.page.number, span.start, span.end]
+                    + ([span.trim_start, span.trim_end] if span.clean is not None else [])
+                    for span in section.spans
+                ]
+            else:
+                spans = [[page.number, page.content] for page in section.pages]
+            exhibits = [[x.exhibit_no, x.description] for x in section.exhibits] if section.exhibits else None
+            rows.append([section.part, section.item, section.item_title, spans, exhibits])
+        sections[filing_type] = rows
+
+    return {
+        "elements": elements,
+        "pages": pages,
+        "sections": sections,
+        "html": filing.html,
+        "source_map": filing.source_map,
+    }
+
+
+def _decode_filing(record: Dict[str, Any]) -> ParsedFiling:
+    """Rebuild fresh model objects from a record made by ``_encode_filing``."""
+    from sec2md.section_extractor import SectionExtractor
+
+    elements = [
+        Element(
+            id=eid, content=content, kind=kind, page_start=page_start, page_end=page_end,
+            content_start_offset=start, content_end_offset=end, tags=tags,
+            table_columns=tuple(columns) if columns else None,
+        )
+        for eid, content, kind, page_start, page_end, start, end, tags, columns in record["elements"]
+    ]
+
+    def deref(idx: Optional[List[int]]) -> Optional[List[Element]]:
+        return None if idx is None else [elements[i] for i in idx]
+
+    pages = []
+    for number, content, display_page, element_idx, text_blocks in record["pages"]:
+        if text_blocks is not None:
+            text_blocks = [
+                TextBlock(name=name, title=title, elements=deref(idx), start_page=start_page,
+                          end_page=end_page, source_pages=source_pages)
+                for name, title, idx, start_page, end_page, source_pages in text_blocks
+            ]
+        pages.append(Page(number=number, content=content, elements=deref(element_idx),
+                          text_blocks=text_blocks, display_page=display_page))
+
+    by_number = {page.number: page for page in pages}
+    sections = {}
+    for filing_type, rows in record["sections"].items():
+        items = []
+        for part, item, item_title, span_rows, exhibits in rows:
+            if exhibits is not None:
+                exhibits = [Exhibit(exhibit_no=no, description=desc) for no, desc in exhibits]
+            if all(len(row) == 2 for row in span_rows):
+                section_pages = [
+                    Page(number=number, content=content, elements=by_number[number].elements,
+                         text_blocks=by_number[number].text_blocks, display_page=by_number[number].display_page)
+                    for number, content in span_rows
+                ]
+                items.append(Section(part=part, item=item, item_title=item_title, pages=section_pages,
+                                     exhibits=exhibits))
+                continue
+            spans = []
+            for number, start, end, *trim in span_rows:
+                clean = SectionExtractor._clean_text if trim else None
+                spans.append(PageSpan(by_number[number], start, end, *trim, clean=clean))
+            items.append(Section.from_spans(spans, part=part, item=item, item_title=item_title,
+                                            exhibits=exhibits))
+        sections[filing_type] = items
+
+    return ParsedFiling(pages=pages, sections=sections, html=record["html"], source_map=record["source_map"])
+
+
+class ParseCache:
+    """Bounded LRU of parse results, optionally backed by a directory.
+
+    Entries are kept as compact records (see ``ParsedFiling``) and rebuilt
+    into new ``Page``/``Section`` objects on every hit, so callers can
+    modify what they get back. On disk each record is zlib-compressed JSON.
+
+    Args:
+        max_entries: Maximum number of filings kept in memory.
+        cache_dir: Optional directory for a persistent second tier. Entries
+            are written on ``put`` and read back when absent from memory.
+
+    Example:
+        >>> cache = ParseCache(cache_dir=".sec2md-parses")
+        >>> pages = sec2md.parse_filing(html, parse_cache=cache)   # parses
+        >>> pages = sec2md.parse_filing(html, parse_cache=cache)   # cached
+        >>> print(cache.stats)
+        CacheStats(hits=1, misses=1, disk_hits=0, evictions=0, hit_rate=50.0%)
+    """
+
+    def __init__(self, max_entries: int = 32, cache_dir: Optional[Union[str, Path]] = None):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        if self.cache_dir:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.stats = CacheStats()
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key_for(html: Union[str, bytes], **options: Any) -> str:
+        """Hash of the raw HTML, salted with the library version and parse options."""
+        if isinstance(html, str):
+            html = html.encode("utf-8")
+        digest = hashlib.sha256()
+        digest.update(f"{_library_version()}\0{json.dumps(options, sort_keys=True)}\0".encode("utf-8"))
+        digest.update(html)
+        return digest.hexdigest()
+
+    def _disk_path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json.z"
+
+    def get(self, key: str, sidecars: bool = False) -> Optional[ParsedFiling]:
+        """Return the cached parse for ``key`` or None, updating statistics.
+
+        With ``sidecars``, an entry stored without the annotated HTML counts
+        as a miss (the caller has to parse again) but stays cached.
+        """
+        with self._lock:
+            record = self._entries.get(key)
+            if record is not None:
+                self._entries.move_to_end(key)
+                return self._hit(record, sidecars)
+
+        if self.cache_dir:
+            path = self._disk_path(key)
+            try:
+                record = json.loads(zlib.decompress(path.read_bytes()))
+            except FileNotFoundError:
+                record = None
+            except (OSError, ValueError, zlib.error):
+                logger.warning("Failed to read parse cache entry: %s", path)
+                record = None
+            if record is not None:
+                with self._lock:
+                    self._store(key, record)
+                    filing = self._hit(record, sidecars)
+                    if filing is not None:
+                        self.stats.disk_hits += 1
+                return filing
+
+        with self._lock:
+            self.stats.misses += 1
+        return None
+
+    def _hit(self, record: Dict[str, Any], sidecars: bool) -> Optional[ParsedFiling]:
+        if sidecars and record["html"] is None:
+            self.stats.misses += 1
+            return None
+        self.stats.hits += 1
+        return _decode_filing(record)
+
+    def put(self, key: str, filing: ParsedFiling) -> None:
+        """Store ``filing`` for ``key`` in memory (and on disk if enabled).
+
+        Sections the entry already holds in memory for other filing types
+        are kept: one key is one HTML document and parse options, so they
+        describe the same pages.
+        """
+        record = _encode_filing(filing)
+        with self._lock:
+            previous = self._entries.get(key)
+            if previous is not None:
+                for filing_type, rows in previous["sections"].items():
+                    record["sections"].setdefault(filing_type, rows)
+            self._store(key, record)
+
+        if self.cache_dir:
+            path = self._disk_path(key)
+            try:
+                path.parent.mkdir(exist_ok=True)
+                tmp = path.with_suffix(".tmp")
+                tmp.write_bytes(zlib.compress(json.dumps(record, separators=(",", ":")).encode("utf-8")))
+                tmp.replace(path)
+            except OSError:
+                logger.warning("Failed to write parse cache entry: %s", path)
+
+    def _store(self, key: str, record: Dict[str, Any]) -> None:
+        self._entries[key] = record
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+    def clear(self) -> None:
+        """Drop in-memory entries and reset statistics (disk entries are kept)."""
+        with self._lock:
+            self._entries.clear()
+            self.stats = CacheStats()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        disk = f", cache_dir='{self.cache_dir}'" if self.cache_dir else ""
+        return f"ParseCache(entries={len(self)}/{self.max_entries}{disk}, {self.stats})"
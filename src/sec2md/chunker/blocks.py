@@ -1,6 +1,8 @@
 import re
-from typing import List, Optional
-from pydantic import BaseModel, Field, computed_field
+from typing import List, Optional, Union
+from pydantic import BaseModel, Field, PrivateAttr, computed_field
+
+from sec2md.markdown_table import TableFormat, render_tables
 
 try:
     import tiktoken
@@ -44,10 +46,15 @@ class BaseBlock(BaseModel):
 
     model_config = {"frozen": False}
 
+    # Blocks are read many times while chunking; count once
+    _tokens: Optional[int] = PrivateAttr(default=None)
+
     @computed_field
     @property
     def tokens(self) -> int:
-        return estimate_tokens(self.content)
+        if self._tokens is None:
+            self._tokens = estimate_tokens(self.content)
+        return self._tokens
 
 
 class Sentence(BaseModel):
@@ -56,33 +63,47 @@ class Sentence(BaseModel):
 
     model_config = {"frozen": False}
 
+    _tokens: Optional[int] = PrivateAttr(default=None)
+
     @computed_field
     @property
     def tokens(self) -> int:
-        return estimate_tokens(self.content)
+        if self._tokens is None:
+            self._tokens = estimate_tokens(self.content)
+        return self._tokens
 
 
 class TextBlock(BaseBlock):
     block_type: str = Field(default='Text', description="Text block type")
 
+    _sentences: Optional[List[Sentence]] = PrivateAttr(default=None)
+
     @computed_field
     @property
     def sentences(self) -> List[Sentence]:
         """Returns the text block sentences"""
-        return [Sentence(content=content) for content in split_sentences(self.content)]
+        if self._sentences is None:
+            self._sentences = [Sentence(content=content) for content in split_sentences(self.content)]
+        return self._sentences
 
     @classmethod
     def from_sentences(cls, sentences: List[Sentence], page: int, element_ids: Optional[List[str]] = None):
         content = " ".join([sentence.content for sentence in sentences])
-        return cls(content=content, page=page, block_type='Text', element_ids=element_ids)
+        block = cls(content=content, page=page, block_type='Text', element_ids=element_ids)
+        if len(sentences) == 1:
+            block._tokens = sentences[0]._tokens
+        return block
 
 
 class TableBlock(BaseBlock):
     block_type: str = Field(default='Table', description="Table block type")
 
-    def __init__(self, **data):
+    def __init__(self, table_format: Union[TableFormat, str] = TableFormat.MARKDOWN, **data):
         if 'content' in data:
-            data['content'] = self._to_minified_markdown_static(data['content'])
+            if TableFormat(table_format) is TableFormat.MARKDOWN:
+                data['content'] = self._to_minified_markdown_static(data['content'])
+            else:
+                data['content'] = render_tables(data['content'], table_format)
         super().__init__(**data)
 
     @staticmethod
@@ -18,6 +18,8 @@ class Chunk(BaseModel):
     vector: Optional[List[float]] = Field(None, description="Vector embedding for this chunk")
     display_page_map: Optional[Dict[int, int]] = Field(None, description="Maps page number to original display_page from filing")
     index: Optional[int] = Field(None, description="Sequential index of this chunk (0-based)")
+    part: Optional[str] = Field(None, description="Filing part the chunk belongs to (set by chunk_filing)")
+    item: Optional[str] = Field(None, description="Filing item the chunk belongs to (set by chunk_filing)")
 
     model_config = {"frozen": False, "arbitrary_types_allowed": True}
 
@@ -176,6 +178,7 @@ class Chunk(BaseModel):
 
     def __repr__(self):
         index_str = f"[{self.index}] " if self.index is not None else ""
+        item_str = f"{self.item}, " if self.item else ""
         pages_str = f"{self.start_page}-{self.end_page}" if self.start_page != self.end_page else str(self.start_page)
         display_str = ""
         if self.start_display_page is not None:
@@ -183,7 +186,7 @@ class Chunk(BaseModel):
                 display_str = f", display_pages={self.start_display_page}-{self.end_display_page}"
             else:
                 display_str = f", display_page={self.start_display_page}"
-        return f"Chunk{index_str}(pages={pages_str}{display_str}, blocks={len(self.blocks)}, tokens={self.num_tokens})"
+        return f"Chunk{index_str}({item_str}pages={pages_str}{display_str}, blocks={len(self.blocks)}, tokens={self.num_tokens})"
 
     def visualize(self, html: str) -> str:
         """
@@ -4,6 +4,7 @@ from typing import Union, Tuple, List, Dict, Any, Optional
 
 from sec2md.chunker.chunk import Chunk
 from sec2md.chunker.blocks import BaseBlock, TextBlock, TableBlock, HeaderBlock, estimate_tokens
+from sec2md.markdown_table import MarkdownTable, TableFormat, render_row, render_tables
 
 # Rebuild Chunk after Element is defined
 from sec2md.models import Element
@@ -19,10 +20,12 @@ logger = logging.getLogger(__name__)
 class Chunker:
     """Splits content into chunks"""
 
-    def __init__(self, chunk_size: int = 512, chunk_overlap: int = 128, max_table_tokens: int = 2048):
+    def __init__(self, chunk_size: int = 512, chunk_overlap: int = 128, max_table_tokens: int = 2048,
+                 table_format: Union[TableFormat, str] = TableFormat.MARKDOWN):
         self.chunk_size = chunk_size
         self.chunk_overlap = chunk_overlap
         self.max_table_tokens = max_table_tokens
+        self.table_format = TableFormat(table_format)
 
     def split(self, pages: List[Any], header: str = None) -> List[Chunk]:
         """Split the pages into chunks with optional header for embedding context.
@@ -88,74 +91,46 @@ class Chunker:
             return self._split_from_elements(pages)
         else:
             # Text-based splitting doesn't produce synthetic elements
-            return self._split_from_text(pages), {}
+            return self._split_from_text(pages, self.table_format), {}
 
     def _split_table_element(self, elem: Element, page_number: int) -> List[Tuple[Element, TableBlock]]:
         """Split an oversized table element into smaller synthetic elements with corresponding blocks.
 
+        Tables are split by row first. If a part is still over ``max_table_tokens``
+        (very wide tables, or a single long row), the table is split into column
+        groups that each repeat the row-label column and header, and the groups
+        are then split by row.
+
         Returns:
             List of (Element, TableBlock) tuples. Each element has sliced content matching its block.
         """
         content = elem.content
-        tokens = estimate_tokens(content)
+        tokens = self._table_tokens(content)
 
         # No splitting needed
         if not self.max_table_tokens or tokens <= self.max_table_tokens:
-            block = TableBlock(content=content, page=page_number, element_ids=[elem.id])
+            block = TableBlock(content=content, page=page_number, element_ids=[elem.id],
+                               table_format=self.table_format)
             return [(elem, block)]
 
         lines = [line for line in content.split('\n') if line.strip()]
-        if len(lines) <= 2:
-            # Table too small to split (just header + separator)
-            block = TableBlock(content=content, page=page_number, element_ids=[elem.id])
-            return [(elem, block)]
-
-        header_line = lines[0]
-        separator_line = lines[1] if len(lines) > 1 else ""
-        data_rows = lines[2:]
-
-        # Build ellipsis row matching column count
-        header_cells = [cell.strip() for cell in header_line.strip().split('|') if cell.strip()]
-        num_cols = max(1, len(header_cells))
-        ellipsis_row = "|" + "|".join(["..."] * num_cols) + "|"
-        if not separator_line:
-            separator_line = "|" + "|".join(["---"] * num_cols) + "|"
-
-        results: List[Tuple[Element, TableBlock]] = []
-        row_idx = 0
-        part_idx = 0
-
-        while row_idx < len(data_rows):
-            base_lines = [header_line, separator_line]
-            if row_idx > 0:
-                base_lines.append(ellipsis_row)
-
-            segment_rows = []
-            while row_idx < len(data_rows):
-                next_row = data_rows[row_idx]
-                candidate_lines = base_lines + segment_rows + [next_row]
-                if row_idx < len(data_rows) - 1:
-                    candidate_lines.append(ellipsis_row)
-                candidate_tokens = estimate_tokens("\n".join(candidate_lines))
-
-                # Over budget and we have rows - stop here
-                if candidate_tokens > self.max_table_tokens and segment_rows:
-                    break
 
-                # Over budget but no rows yet - take this one anyway (single row exceeds limit)
-                if candidate_tokens > self.max_table_tokens:
-                    segment_rows.append(next_row)
-                    row_idx += 1
-                    break
+        parts: List[Tuple[str, Optional[Tuple[int, int]]]] = []
+        if len(lines) > 2:
+            packed = self._pack_table_rows(lines[0], lines[1], lines[2:])
+            if all(part_tokens <= self.max_table_tokens for _, part_tokens in packed):
+                parts = [(part, None) for part, _ in packed]
 
-                segment_rows.append(next_row)
-                row_idx += 1
+        if not parts:
+            parts = self._split_table_columns(lines)
 
-            content_lines = base_lines + segment_rows
-            if row_idx < len(data_rows):
-                content_lines.append(ellipsis_row)
+        if len(parts) <= 1 and parts[0][1] is None:
+            block = TableBlock(content=content, page=page_number, element_ids=[elem.id],
+                               table_format=self.table_format)
+            return [(elem, block)]
 
-            segment_content = "\n".join(content_lines)
+        results: List[Tuple[Element, TableBlock]] = []
+        for part_idx, (segment_content, columns) in enumerate(parts):
             segment_id = f"{elem.id}:part-{part_idx}"
 
             # Create synthetic element with sliced content
@@ -166,20 +141,247 @@ class Chunker:
                 page_start=elem.page_start,
                 page_end=elem.page_end,
                 content_start_offset=elem.content_start_offset,
-                content_end_offset=elem.content_end_offset
+                content_end_offset=elem.content_end_offset,
+                table_columns=columns
             )
 
             segment_block = TableBlock(
                 content=segment_content,
                 page=page_number,
-                element_ids=[segment_id]
+                element_ids=[segment_id],
+                table_format=self.table_format
             )
 
             results.append((segment_element, segment_block))
-            part_idx += 1
 
         return results
 
+    def _table_tokens(self, content: str) -> int:
+        """Tokens of markdown table ``content`` as it will be emitted, in ``table_format``."""
+        if self.table_format is TableFormat.MARKDOWN:
+            return estimate_tokens(content)
+        return estimate_tokens(render_tables(content, self.table_format))
+
+    def _pack_table_rows(self, header_line: str, separator_line: str, data_rows: List[str]) -> List[Tuple[str, int]]:
+        """Greedily pack data rows under a repeated header into parts within ``max_table_tokens``.
+
+        Each row is tokenized once; part boundaries are predicted from prefix
+        sums of the per-row counts and then confirmed against the exact token
+        count of the rendered part, so the output matches packing row by row
+        while the total work stays linear in the table size. Counts are taken
+        in ``table_format``: for the other formats a row costs what it adds
+        to a one-row rendering of the table.
+
+        Returns:
+            List of (content, tokens) for each part.
+        """
+        # Build ellipsis row matching column count
+        header_cells = [cell.strip() for cell in header_line.strip().split('|') if cell.strip()]
+        num_cols = max(1, len(header_cells))
+        ellipsis_row = "|" + "|".join(["..."] * num_cols) + "|"
+        if not separator_line:
+            separator_line = "|" + "|".join(["---"] * num_cols) + "|"
+
+        budget = self.max_table_tokens
+        n = len(data_rows)
+
+        base_tokens = self._table_tokens(f"{header_line}\n{separator_line}")
+        if self.table_format is TableFormat.MARKDOWN:
+            def row_cost(row: str) -> int:
+                # Includes the joining newline
+                return estimate_tokens(row) + 1
+        else:
+            def row_cost(row: str) -> int:
+                return max(1, self._table_tokens(f"{header_line}\n{separator_line}\n{row}") - base_tokens)
+
+        prefix = [0]
+        for row in data_rows:
+            prefix.append(prefix[-1] + row_cost(row))
+        ellipsis_tokens = row_cost(ellipsis_row)
+
+        def render(start: int, end: int) -> str:
+            lines = [header_line, separator_line]
+            if start > 0:
+                lines.append(ellipsis_row)
+            lines.extend(data_rows[start:end])
+            if end < n:
+                lines.append(ellipsis_row)
+            return "\n".join(lines)
+
+        def predicted(start: int, end: int) -> int:
+            leading = ellipsis_tokens if start > 0 else 0
+            trailing = ellipsis_tokens if end < n else 0
+            return base_tokens + leading + prefix[end] - prefix[start] + trailing
+
+        parts: List[Tuple[str, int]] = []
+        start = 0
+
+        while start < n:
+            # First row is always taken, even if it alone exceeds the budget
+            end = start + 1
+            while end < n and predicted(start, end + 1) <= budget:
+                end += 1
+
+            # Correct the estimate against the exact count (BPE merges across lines)
+            content = render(start, end)
+            tokens = self._table_tokens(content)
+            while tokens > budget and end > start + 1:
+                end -= 1
+                content = render(start, end)
+                tokens = self._table_tokens(content)
+            while tokens <= budget and end < n:
+                candidate = render(start, end + 1)
+                candidate_tokens = self._table_tokens(candidate)
+                if candidate_tokens > budget:
+                    break
+                end += 1
+                content, tokens = candidate, candidate_tokens
+
+            parts.append((content, tokens))
+            start = end
+
+        return parts
+
+    def _split_table_columns(self, lines: List[str]) -> List[Tuple[str, Tuple[int, int]]]:
+        """Split a table into column groups (each repeating column 0), then by row.
+
+        Returns:
+            List of (content, (start, end)) where (start, end) is the half-open
+            range of source columns in the part besides the row-label column.
+        """
+        budget = self.max_table_tokens
+        table = MarkdownTable.from_lines(lines)
+        num_cols = table.num_columns
+        if num_cols == 0:
+            return [("\n".join(lines), (0, 0))]
+
+        # Cap individual cells so that a label + one value column always fits
+        cell_limit = max(1, budget // 8)
+        table = MarkdownTable(
+            header=[self._clip_cell(c, cell_limit) for c in table.header],
+            rows=self._wrap_oversized_cells(table.rows, cell_limit),
+        )
+
+        value_cols = list(range(1, num_cols)) or [0]
+        groups = self._group_columns(table, value_cols)
+
+        parts: List[Tuple[str, Tuple[int, int]]] = []
+        pending = list(groups)
+        while pending:
+            group = pending.pop(0)
+            columns = [0] + group if group != [0] else [0]
+            sub = table.select_columns(columns)
+            header_line = render_row(sub.header)
+            data_rows = [render_row(row) for row in sub.rows]
+            if data_rows:
+                packed = self._pack_table_rows(header_line, sub.separator_line(), data_rows)
+            else:
+                packed = [(f"{header_line}\n{sub.separator_line()}", 0)]
+            group_parts = [part for part, _ in packed]
+
+            # Token estimates are per cell; re-split a group if the rendered part disagrees
+            if len(group) > 1 and any(part_tokens > budget for _, part_tokens in packed):
+                mid = len(group) // 2
+                pending[:0] = [group[:mid], group[mid:]]
+                continue
+
+            col_range = (group[0], group[-1] + 1)
+            parts.extend((p, col_range) for p in group_parts)
+
+        return parts
+
+    def _group_columns(self, table: MarkdownTable, value_cols: List[int]) -> List[List[int]]:
+        """Greedily group value columns so header + widest row of each group fits the budget."""
+        budget = self.max_table_tokens
+        # Per-column overhead: separator cell, two ellipsis cells, pipes and spacing
+        col_overhead = estimate_tokens("| --- ") + 2 * estimate_tokens("|...") + 2
+
+        def col_cost(c: int) -> Tuple[int, List[int]]:
+            header_cost = estimate_tokens(table.header[c]) + col_overhead
+            return header_cost, [estimate_tokens(row[c]) + 2 for row in table.rows]
+
+        label_header, label_rows = col_cost(0)
+        groups: List[List[int]] = []
+        current: List[int] = []
+        fixed = label_header
+        row_sums = list(label_rows)
+
+        for c in value_cols:
+            if c == 0:
+                return [[0]]
+            header_cost, row_costs = col_cost(c)
+            new_fixed = fixed + header_cost
+            new_sums = [a + b for a, b in zip(row_sums, row_costs)]
+            widest = max(new_sums) if new_sums else 0
+
+            if current and new_fixed + widest > budget:
+                groups.append(current)
+                current = [c]
+                fixed = label_header + header_cost
+                row_sums = [a + b for a, b in zip(label_rows, row_costs)]
+            else:
+                current.append(c)
+                fixed = new_fixed
+                row_sums = new_sums
+
+        if current:
+            groups.append(current)
+        return groups
+
+    @staticmethod
+    def _clip_cell(text: str, limit: int) -> str:
+        """Clip a header cell that alone would blow the budget."""
+        if estimate_tokens(text) <= limit:
+            return text
+        words = text.split()
+        clipped: List[str] = []
+        used = 0
+        for word in words:
+            used += estimate_tokens(" " + word)
+            if used >= limit:
+                break
+            clipped.append(word)
+        return (" ".join(clipped) or text[:limit]) + "…"
+
+    @staticmethod
+    def _wrap_oversized_cells(rows: List[List[str]], limit: int) -> List[List[str]]:
+        """Break cells over ``limit`` tokens into continuation rows that repeat the row label."""
+        wrapped_rows: List[List[str]] = []
+        for row in rows:
+            pieces_per_cell = []
+            for text in row:
+                if estimate_tokens(text) <= limit:
+                    pieces_per_cell.append([text])
+                    continue
+                pieces: List[str] = []
+                current: List[str] = []
+                used = 0
+                for word in text.split():
+                    cost = estimate_tokens(" " + word)
+                    if cost > limit:
+                        # Unbreakable run (e.g. a URL): hard-split by characters
+                        if current:
+                            pieces.append(" ".join(current))
+                            current, used = [], 0
+                        pieces.extend(word[i:i + limit] for i in range(0, len(word), limit))
+                        continue
+                    if current and used + cost > limit:
+                        pieces.append(" ".join(current))
+                        current, used = [], 0
+                    current.append(word)
+                    used += cost
+                if current:
+                    pieces.append(" ".join(current))
+                pieces_per_cell.append(pieces or [""])
+
+            depth = max(len(p) for p in pieces_per_cell) if pieces_per_cell else 1
+            for i in range(depth):
+                wrapped_rows.append([
+                    pieces[i] if i < len(pieces) else ("" if j else pieces[0])
+                    for j, pieces in enumerate(pieces_per_cell)
+                ])
+        return wrapped_rows
+
     def _split_from_elements(self, pages: List[Any]) -> Tuple[List[BaseBlock], Dict[str, Element]]:
         """Build blocks directly from parser elements.
 
@@ -193,7 +395,7 @@ class Chunker:
         for page in pages:
             elems = getattr(page, 'elements', None)
             if not elems:
-                blocks.extend(self._split_from_text([page]))
+                blocks.extend(self._split_from_text([page], self.table_format))
                 continue
 
             # Stable order: by offset when available, else original index
@@ -224,7 +426,7 @@ class Chunker:
         return blocks, synthetic_elements
 
     @staticmethod
-    def _split_from_text(pages: List[Any]):
+    def _split_from_text(pages: List[Any], table_format: TableFormat = TableFormat.MARKDOWN):
         """Fallback: split blocks from page content."""
         blocks = []
         table_content = ""
@@ -235,7 +437,7 @@ class Chunker:
 
             for line in page.content.split('\n'):
                 if table_content and not Chunker._is_table_line(line):
-                    blocks.append(TableBlock(content=table_content, page=page.number))
+                    blocks.append(TableBlock(content=table_content, page=page.number, table_format=table_format))
                     table_content = ""
 
                 if line.startswith("#"):
@@ -248,7 +450,7 @@ class Chunker:
                     blocks.append(TextBlock(content=line, page=page.number))
 
         if table_content and last_page:
-            blocks.append(TableBlock(content=table_content, page=last_page.number))
+            blocks.append(TableBlock(content=table_content, page=last_page.number, table_format=table_format))
 
         return blocks
 
@@ -1,8 +1,11 @@
 """Chunking utilities for page-aware splitting."""
 
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional, Union
 from collections import defaultdict
-from sec2md.models import Page, Section, TextBlock
+from sec2md.models import Page, Section, TextBlock, FilingType, Item10K, Item10Q, Item13D, Item13G
+from sec2md.markdown_table import TableFormat
+from sec2md.section_extractor import SectionExtractor
+from sec2md.text_block_registry import TextBlockEntry
 from sec2md.chunker.chunker import Chunker
 from sec2md.chunker.chunk import Chunk
 
@@ -12,7 +15,8 @@ def chunk_pages(
     chunk_size: int = 512,
     chunk_overlap: int = 128,
     max_table_tokens: int = 2048,
-    header: Optional[str] = None
+    header: Optional[str] = None,
+    table_format: Union[TableFormat, str] = TableFormat.MARKDOWN
 ) -> List[Chunk]:
     """
     Chunk pages into overlapping chunks.
@@ -23,6 +27,7 @@ def chunk_pages(
         chunk_overlap: Overlap between chunks in tokens
         max_table_tokens: Maximum tokens allowed per table before splitting
         header: Optional header to prepend to each chunk's embedding_text
+        table_format: Table rendering in chunks: "markdown", "compact", "rows" or "tsv"
 
     Returns:
         List of Chunk objects with page tracking and elements
@@ -34,7 +39,8 @@ def chunk_pages(
         ...     print(f"Page {chunk.page}: {chunk.content[:100]}...")
         ...     print(f"Elements: {chunk.elements}")
     """
-    chunker = Chunker(chunk_size=chunk_size, chunk_overlap=chunk_overlap, max_table_tokens=max_table_tokens)
+    chunker = Chunker(chunk_size=chunk_size, chunk_overlap=chunk_overlap, max_table_tokens=max_table_tokens,
+                      table_format=table_format)
     return chunker.split(pages=pages, header=header)
 
 
@@ -43,7 +49,8 @@ def chunk_section(
     chunk_size: int = 512,
     chunk_overlap: int = 128,
     max_table_tokens: int = 2048,
-    header: Optional[str] = None
+    header: Optional[str] = None,
+    table_format: Union[TableFormat, str] = TableFormat.MARKDOWN
 ) -> List[Chunk]:
     """
     Chunk a filing section into overlapping chunks.
@@ -54,6 +61,7 @@ def chunk_section(
         chunk_overlap: Overlap between chunks in tokens
         max_table_tokens: Maximum tokens allowed per table before splitting
         header: Optional header to prepend to each chunk's embedding_text
+        table_format: Table rendering in chunks: "markdown", "compact", "rows" or "tsv"
 
     Returns:
         List of Chunk objects
@@ -68,10 +76,104 @@ def chunk_section(
         chunk_size=chunk_size,
         chunk_overlap=chunk_overlap,
         max_table_tokens=max_table_tokens,
-        header=header
+        header=header,
+        table_format=table_format
     )
 
 
+def _page_piece(page: Page, start: int, end: int, first: bool) -> Page:
+    """``page`` cut to ``[start, end)`` of its content, with the elements that end there.
+
+    An element is placed by its end so that one holding a PART line and the
+    ITEM header after it goes with the item. Elements without offsets go
+    with the first piece of their page.
+    """
+    elements = page.elements
+    if elements:
+        elements = [
+            e for e in elements
+            if (start < e.content_end_offset <= end if e.content_end_offset is not None else first)
+        ]
+    return Page(
+        number=page.number,
+        content=page.content[start:end],
+        elements=elements,
+        display_page=page.display_page
+    )
+
+
+def chunk_filing(
+    pages: List[Page],
+    filing_type: FilingType,
+    chunk_size: int = 512,
+    chunk_overlap: int = 128,
+    max_table_tokens: int = 2048,
+    header: Optional[str] = None,
+    table_format: Union[TableFormat, str] = TableFormat.MARKDOWN,
+    desired_items: Optional[Iterable[Union[Item10K, Item10Q, Item13D, Item13G, str]]] = None
+) -> List[Chunk]:
+    """
+    Chunk a whole filing section by section in one pass.
+
+    Equivalent to extract_sections() followed by chunk_section() on each
+    section, except that every part of a page is split into blocks once:
+    a page shared by two sections is cut at the section boundary instead
+    of being re-split (with all of its elements) for each of them. Chunks
+    never cross a section boundary.
+
+    Text outside every section (cover pages, 8-K/13D item header lines,
+    dropped or unwanted items) is not chunked.
+
+    Args:
+        pages: List of Page objects (with optional elements)
+        filing_type: Type of filing ("10-K", "10-Q", "8-K", ...)
+        chunk_size: Target chunk size in tokens (estimated as chars/4)
+        chunk_overlap: Overlap between chunks in tokens (within a section)
+        max_table_tokens: Maximum tokens allowed per table before splitting
+        header: Optional header to prepend to each chunk's embedding_text
+        table_format: Table rendering in chunks: "markdown", "compact", "rows" or "tsv"
+        desired_items: Only chunk these items (see extract_sections())
+
+    Returns:
+        List of Chunk objects with ``part``/``item`` set and ``index``
+        numbered across the whole filing
+
+    Example:
+        >>> chunks = sec2md.chunk_filing(pages, filing_type="10-K", chunk_size=512)
+        >>> risk_chunks = [c for c in chunks if c.item == "ITEM 1A"]
+    """
+    extractor = SectionExtractor(
+        pages=pages,
+        filing_type=filing_type,
+        desired_items=set(desired_items) if desired_items else None
+    )
+    chunker = Chunker(chunk_size=chunk_size, chunk_overlap=chunk_overlap, max_table_tokens=max_table_tokens,
+                      table_format=table_format)
+
+    chunks: List[Chunk] = []
+    claimed: Dict[int, int] = {}  # page number -> end of the last piece taken from it
+    for section in extractor.iter_sections():
+        pieces = []
+        for span in section.spans:
+            start, end = span.start, span.end
+            first = span.page.number not in claimed
+            start = max(start, claimed.get(span.page.number, 0))
+            if start >= end:
+                continue
+            claimed[span.page.number] = end
+            pieces.append(_page_piece(span.page, start, end, first))
+        if not pieces:
+            continue
+
+        for chunk in chunker.split(pages=pieces, header=header):
+            chunk.index = len(chunks)
+            chunk.part = section.part
+            chunk.item = section.item
+            chunks.append(chunk)
+
+    return chunks
+
+
 def merge_text_blocks(pages: List[Page]) -> List[TextBlock]:
     """
     Merge multi-page TextBlocks into single TextBlock objects.
@@ -134,20 +236,24 @@ def merge_text_blocks(pages: List[Page]) -> List[TextBlock]:
 
 
 def chunk_text_block(
-    text_block: TextBlock,
+    text_block: Union[TextBlock, TextBlockEntry],
     chunk_size: int = 512,
     chunk_overlap: int = 128,
     max_table_tokens: int = 2048,
-    header: Optional[str] = None
+    header: Optional[str] = None,
+    table_format: Union[TableFormat, str] = TableFormat.MARKDOWN
 ) -> List[Chunk]:
     """
     Chunk a single TextBlock (financial note).
 
     Args:
-        text_block: TextBlock object (possibly spanning multiple pages)
+        text_block: TextBlock object (possibly spanning multiple pages), or a
+            registry entry from ``Parser.get_text_block_entry()``, whose
+            elements are already grouped by page
         chunk_size: Target chunk size in tokens (estimated as chars/4)
         chunk_overlap: Overlap between chunks in tokens
         header: Optional header to prepend to each chunk's embedding_text
+        table_format: Table rendering in chunks: "markdown", "compact", "rows" or "tsv"
 
     Returns:
         List of Chunk objects with elements preserved
@@ -158,12 +264,19 @@ def chunk_text_block(
         >>> chunks = chunk_text_block(debt_note, chunk_size=512, header="Company: AAPL | Note: Debt")
         >>> print(f"Chunked {debt_note.title} into {len(chunks)} chunks")
         >>> print(f"Note spans pages {debt_note.start_page}-{debt_note.end_page}")
+
+        >>> # Straight from the parser's registry, without merging TextBlocks
+        >>> entry = parser.get_text_block_entry("us-gaap:DebtDisclosureTextBlock")
+        >>> chunks = chunk_text_block(entry, chunk_size=512)
     """
-    # Group elements by page
-    elements_by_page = defaultdict(list)
-    for elem in text_block.elements:
-        # Use page_start for grouping (elements are always on single pages in practice)
-        elements_by_page[elem.page_start].append(elem)
+    if isinstance(text_block, TextBlockEntry):
+        elements_by_page = {n: text_block.elements_by_page[n] for n in text_block.source_pages}
+    else:
+        # Group elements by page
+        elements_by_page = defaultdict(list)
+        for elem in text_block.elements:
+            # Use page_start for grouping (elements are always on single pages in practice)
+            elements_by_page[elem.page_start].append(elem)
 
     # Create one Page per page the TextBlock spans, with only elements from that page
     pages = []
@@ -179,6 +292,7 @@ def chunk_text_block(
             # Note: display_page not available here since TextBlocks don't preserve it
         ))
 
-    chunker = Chunker(chunk_size=chunk_size, chunk_overlap=chunk_overlap, max_table_tokens=max_table_tokens)
+    chunker = Chunker(chunk_size=chunk_size, chunk_overlap=chunk_overlap, max_table_tokens=max_table_tokens,
+                      table_format=table_format)
 
     return chunker.split(pages=pages, header=header)
@@ -3,14 +3,17 @@
 import re
 import base64
 import logging
-from typing import overload, List, Literal
+from typing import overload, List, Literal, Optional
 from urllib.parse import urljoin
 
 import requests
 
 from sec2md.utils import is_url, fetch
 from sec2md.parser import Parser
-from sec2md.models import Page
+from sec2md.models import Page, FilingType
+from sec2md.cache import TableCache, ParseCache, ParsedFiling
+from sec2md.sections import extract_sections
+from sec2md.text_buffer import share_page_text
 
 logger = logging.getLogger(__name__)
 
@@ -104,6 +107,7 @@ def convert_to_markdown(
     user_agent: str | None = None,
     return_pages: bool = False,
     embed_images: bool = False,
+    table_cache: Optional[TableCache] = None,
 ) -> str: ...
 
 
@@ -114,6 +118,7 @@ def convert_to_markdown(
     user_agent: str | None = None,
     return_pages: bool = True,
     embed_images: bool = False,
+    table_cache: Optional[TableCache] = None,
 ) -> List[Page]: ...
 
 
@@ -123,6 +128,7 @@ def convert_to_markdown(
     user_agent: str | None = None,
     return_pages: bool = False,
     embed_images: bool = False,
+    table_cache: Optional[TableCache] = None,
 ) -> str | List[Page]:
     """
     Convert SEC filing HTML to Markdown.
@@ -132,6 +138,7 @@ def convert_to_markdown(
         user_agent: User agent for EDGAR requests (required for sec.gov URLs)
         return_pages: If True, returns List[Page] instead of markdown string
         embed_images: If True, fetch and embed images as base64 data URIs (default: False)
+        table_cache: Optional TableCache shared across calls to reuse rendered tables
 
     Returns:
         Markdown string (default) or List[Page] if return_pages=True
@@ -162,7 +169,7 @@ def convert_to_markdown(
     if embed_images and source_url:
         html = _embed_images(html, source_url, user_agent)
 
-    parser = Parser(html)
+    parser = Parser(html, table_cache=table_cache)
 
     if return_pages:
         return parser.get_pages()
@@ -176,6 +183,10 @@ def parse_filing(
     user_agent: str | None = None,
     include_elements: bool = True,
     embed_images: bool = False,
+    table_cache: Optional[TableCache] = None,
+    shared_text: bool = False,
+    lazy_elements: bool = False,
+    parse_cache: Optional[ParseCache] = None,
 ) -> List[Page]:
     """
     Parse SEC filing HTML into structured Page objects.
@@ -188,6 +199,14 @@ def parse_filing(
         user_agent: User agent for EDGAR requests (required for sec.gov URLs)
         include_elements: If True, extract citable elements (default: True)
         embed_images: If True, fetch and embed images as base64 data URIs (default: False)
+        table_cache: Optional TableCache shared across calls to reuse rendered tables
+        shared_text: If True, pages and elements hold offsets into one shared text
+            buffer instead of their own copies of the text (default: False)
+        lazy_elements: If True, each page builds its elements on first access to
+            ``page.elements`` (default: False). Ignored with ``parse_cache``,
+            which stores fully built pages.
+        parse_cache: Optional ParseCache; a filing parsed before (same HTML,
+            sec2md version and options) is returned from it without parsing
 
     Returns:
         List[Page]: Parsed pages with content, elements, and text blocks
@@ -213,11 +232,90 @@ def parse_filing(
         >>> page_dict = page.model_dump()  # Full serialization
         >>> essentials = page.model_dump(include={'number', 'content', 'elements'})
     """
+    if parse_cache is not None:
+        pages = load_filing(source, user_agent=user_agent, include_elements=include_elements,
+                            embed_images=embed_images, table_cache=table_cache,
+                            parse_cache=parse_cache).pages
+        if shared_text:
+            share_page_text(pages)
+        return pages
+
     source_url = source if isinstance(source, str) and is_url(source) else None
     html = _resolve_source(source, user_agent=user_agent)
 
     if embed_images and source_url:
         html = _embed_images(html, source_url, user_agent)
 
-    parser = Parser(html)
-    return parser.get_pages(include_elements=include_elements)
+    parser = Parser(html, table_cache=table_cache)
+    return parser.get_pages(include_elements=include_elements, shared_text=shared_text,
+                            lazy_elements=lazy_elements)
+
+
+def load_filing(
+    source: str | bytes,
+    *,
+    user_agent: str | None = None,
+    include_elements: bool = True,
+    embed_images: bool = False,
+    table_cache: Optional[TableCache] = None,
+    parse_cache: Optional[ParseCache] = None,
+    filing_type: Optional[FilingType] = None,
+    sidecars: bool = False,
+) -> ParsedFiling:
+    """
+    Parse a filing into pages plus, on request, its sections and annotated-HTML sidecars.
+
+    With ``parse_cache`` the result is looked up by a hash of the HTML, the
+    sec2md version and ``include_elements``/``embed_images`` first, and
+    stored after parsing. Sections missing from a cached entry are extracted
+    from its pages; missing sidecars mean the filing is parsed again (a
+    cache miss), keeping the sections already cached. Either way the entry
+    is updated, so the next call is served from the cache.
+
+    Args:
+        source: URL or HTML string/bytes
+        user_agent: User agent for EDGAR requests (required for sec.gov URLs)
+        include_elements: If True, extract citable elements (default: True)
+        embed_images: If True, fetch and embed images as base64 data URIs (default: False)
+        table_cache: Optional TableCache shared across calls to reuse rendered tables
+        parse_cache: Optional ParseCache holding earlier parse results
+        filing_type: If set, also extract sections ("10-K", "10-Q", "8-K", ...)
+        sidecars: If True, also keep the annotated HTML (``Parser.html()``) and
+            the element source map (``SourceMap.to_dict()``)
+
+    Returns:
+        ParsedFiling with ``pages``, ``sections[filing_type]``, ``html`` and ``source_map``
+
+    Examples:
+        >>> cache = ParseCache(cache_dir=".sec2md-parses")
+        >>> filing = load_filing(html, parse_cache=cache, filing_type="10-K", sidecars=True)
+        >>> risk = get_section(filing.sections["10-K"], Item10K.RISK_FACTORS)
+        >>> highlight_html(filing.html, [e.id for e in risk.pages[0].elements])
+    """
+    source_url = source if isinstance(source, str) and is_url(source) else None
+    html = _resolve_source(source, user_agent=user_agent)
+    embed_images = bool(embed_images and source_url)
+
+    key = None
+    filing = None
+    if parse_cache is not None:
+        key = ParseCache.key_for(html, include_elements=include_elements, embed_images=embed_images)
+        filing = parse_cache.get(key, sidecars=sidecars)
+
+    changed = filing is None
+    if filing is None:
+        if embed_images:
+            html = _embed_images(html, source_url, user_agent)
+        parser = Parser(html, table_cache=table_cache)
+        filing = ParsedFiling(pages=parser.get_pages(include_elements=include_elements))
+        if sidecars:
+            filing.html = parser.html()
+            filing.source_map = parser.source_map.to_dict()
+
+    if filing_type and filing_type not in filing.sections:
+        filing.sections[filing_type] = extract_sections(filing.pages, filing_type)
+        changed = True
+
+    if parse_cache is not None and changed:
+        parse_cache.put(key, filing)
+    return filing
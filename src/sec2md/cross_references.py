@@ -0,0 +1,126 @@
+"""Cross-reference graph between elements, notes and items.
+
+Filings point at themselves constantly: "see Note 7 — Debt", "refer to
+Item 7A". ``CrossReferenceGraph`` resolves those mentions once per filing
+-- notes to their XBRL TextBlock (or "Note N" header element) and items to
+their section header elements -- so following a reference is a dict lookup
+instead of another search.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional
+
+from sec2md.models import Element, Page, TextBlock
+from sec2md.section_extractor import ITEM_ROWS_RE, LEAD_WRAP
+
+_NOTE_HEADER_RE = re.compile(rf'^\s*{LEAD_WRAP}NOTE\s+(\d{{1,2}})\b', re.IGNORECASE)
+_ITEM_HEADER_RE = re.compile(rf'^\s*{LEAD_WRAP}ITEM\s+(\d{{1,2}}(?:\.\d{{2}})?[A-Z]?)\b', re.IGNORECASE)
+# Mentions: "Note 7", "Item 7A", "Item 2.02". Capitalized only, so "note that" and "item" as a noun don't match.
+_NOTE_REF_RE = re.compile(r'\bNote\s+(\d{1,2})\b')
+_ITEM_REF_RE = re.compile(r'\b(?:Item|ITEM)\s+(\d{1,2}(?:\.\d{2})?[A-C]?)\b')
+
+
+@dataclass
+class CrossReference:
+    """One resolved mention of a note or item inside an element."""
+    source_id: str              # element containing the mention
+    kind: str                   # "note" or "item"
+    label: str                  # text as written, e.g. "Note 7"
+    target: str                 # TextBlock name, or "NOTE 7" / "ITEM 7A"
+    target_ids: List[str] = field(default_factory=list)  # elements of the target
+
+
+def _first_line(content: str) -> str:
+    return content.lstrip().split("\n", 1)[0]
+
+
+class CrossReferenceGraph:
+    """Element-level reference graph with O(1) neighbor lookups."""
+
+    def __init__(self):
+        self.notes: Dict[str, List[str]] = {}           # "7" -> target element IDs
+        self.note_text_blocks: Dict[str, str] = {}      # "7" -> TextBlock name
+        self.items: Dict[str, List[str]] = {}           # "7A" -> header element IDs
+        self._out: Dict[str, List[CrossReference]] = {}
+        self._neighbors: Dict[str, List[str]] = {}
+        self._in: Dict[str, List[str]] = {}
+
+    @classmethod
+    def from_pages(cls, pages: List[Page], text_blocks: Optional[Iterable[TextBlock]] = None) -> "CrossReferenceGraph":
+        """Build the graph from parsed pages.
+
+        Args:
+            pages: Pages with elements.
+            text_blocks: Merged TextBlocks (``Parser.get_text_block`` or
+                ``merge_text_blocks``); notes are matched to them by the
+                "Note N" header of their first element or their title.
+        """
+        graph = cls()
+        elements = [e for page in pages for e in (page.elements or [])]
+        graph._index_targets(elements, text_blocks or [])
+        for element in elements:
+            graph._add_references(element)
+        return graph
+
+    def _index_targets(self, elements: List[Element], text_blocks: Iterable[TextBlock]) -> None:
+        for tb in text_blocks:
+            if not tb.elements:
+                continue
+            m = _NOTE_HEADER_RE.match(_first_line(tb.elements[0].content)) or _NOTE_HEADER_RE.match(tb.title or "")
+            if m and m.group(1) not in self.notes:
+                self.notes[m.group(1)] = [e.id for e in tb.elements]
+                self.note_text_blocks[m.group(1)] = tb.name
+
+        for element in elements:
+            if element.kind == "table":
+                continue
+            first = _first_line(element.content)
+            m = _NOTE_HEADER_RE.match(first)
+            if m and m.group(1) not in self.notes:
+                self.notes[m.group(1)] = [element.id]
+            m = _ITEM_HEADER_RE.match(first)
+            # Skip table-of-contents blocks listing many items
+            if m and len(ITEM_ROWS_RE.findall(element.content)) < 3:
+                self.items.setdefault(m.group(1).upper(), []).append(element.id)
+
+    def _add_references(self, element: Element) -> None:
+        seen = set()
+        neighbors: Dict[str, None] = {}
+        for kind, regex, targets in (("note", _NOTE_REF_RE, self.notes), ("item", _ITEM_REF_RE, self.items)):
+            for m in regex.finditer(element.content):
+                key = m.group(1).upper()
+                target_ids = targets.get(key)
+                if not target_ids or element.id in target_ids or (kind, key) in seen:
+                    continue
+                seen.add((kind, key))
+                target = self.note_text_blocks.get(key, f"NOTE {key}") if kind == "note" else f"ITEM {key}"
+                ref = CrossReference(source_id=element.id, kind=kind, label=m.group(0),
+                                     target=target, target_ids=target_ids)
+                self._out.setdefault(element.id, []).append(ref)
+                for target_id in target_ids:
+                    if target_id not in neighbors:
+                        neighbors[target_id] = None
+                        self._in.setdefault(target_id, []).append(element.id)
+        if neighbors:
+            self._neighbors[element.id] = list(neighbors)
+
+    def references(self, element_id: str) -> List[CrossReference]:
+        """Resolved references made by an element."""
+        return self._out.get(element_id, [])
+
+    def neighbors(self, element_id: str) -> List[str]:
+        """Element IDs an element refers to (all elements of each target), in order."""
+        return self._neighbors.get(element_id, [])
+
+    def referenced_by(self, element_id: str) -> List[str]:
+        """IDs of elements that refer to the note or item containing ``element_id``."""
+        return self._in.get(element_id, [])
+
+    def __len__(self) -> int:
+        return sum(len(refs) for refs in self._out.values())
+
+    def __repr__(self) -> str:
+        return f"CrossReferenceGraph(references={len(self)}, notes={len(self.notes)}, items={len(self.items)})"
@@ -8,114 +8,46 @@ from __future__ import annotations
 
 import re
 import hashlib
+from dataclasses import dataclass
 from typing import List, Dict, Optional, Tuple, Any
 
 from bs4.element import Tag
 
 from sec2md.models import Page, Element, TextBlock
 
-# iXBRL tag names used for fact extraction
-_XBRL_FACT_TAGS = {'ix:nonfraction', 'nonfraction', 'ix:nonnumeric', 'nonnumeric'}
-
-
-def _extract_xbrl_tags(nodes: List[Tag]) -> Optional[List[str]]:
-    """Extract distinct XBRL concept names from source DOM nodes."""
-    tags: List[str] = []
-    seen: set = set()
-    for node in nodes:
-        if not isinstance(node, Tag):
-            continue
-        for el in node.find_all(_XBRL_FACT_TAGS):
-            name = el.get('name', '')
-            if name and name not in seen:
-                seen.add(name)
-                tags.append(name)
-    return tags if tags else None
-
 
 def build_elements_for_pages(
     pages: List[Page],
-    page_segments: Dict[int, List[Tuple[str, Optional[Tag], Any]]],
+    page_segments: Dict[int, List[Tuple[str, Optional[Tag], Any, Tuple[Tag, ...]]]],
     min_chars: int = 500,
-) -> Tuple[List[Page], Dict[str, List[Tag]]]:
+) -> Tuple[List[Page], Dict[str, List[Tag]], Dict[str, List[Tag]]]:
     """Build Elements and TextBlocks for pages from parsed segments.
 
     Args:
         pages: Parsed pages (content already set).
-        page_segments: Per-page segment tuples (content, source_node, text_block_info).
+        page_segments: Per-page segment tuples (content, source_node, text_block_info,
+            facts) where facts are the iXBRL fact tags the parser passed while
+            producing the segment.
         min_chars: Minimum characters before flushing a merged block.
 
     Returns:
-        (augmented_pages, block_nodes_map) where block_nodes_map maps
-        element IDs to their source DOM nodes (for HTML augmentation).
+        (augmented_pages, block_nodes_map, block_facts_map) where block_nodes_map
+        maps element IDs to their source DOM nodes (for HTML augmentation) and
+        block_facts_map maps element IDs to the iXBRL fact tags they contain.
     """
     page_elements: Dict[int, List[Element]] = {}
     page_text_blocks: Dict[int, List[TextBlock]] = {}
     block_nodes_map: Dict[str, List[Tag]] = {}
+    block_facts_map: Dict[str, List[Tag]] = {}
 
     for page in pages:
-        page_num = page.number
-        segments = page_segments.get(page_num, [])
-
-        if not segments:
-            page_elements[page_num] = []
-            page_text_blocks[page_num] = []
-            continue
-
-        blocks_with_nodes = _group_segments_into_blocks(segments, page_num)
-        merged_blocks = _merge_small_blocks(blocks_with_nodes, page_num, min_chars=min_chars)
-
-        elements = []
-        text_block_map: Dict[str, List[str]] = {}
-
-        for element, nodes, text_block_info in merged_blocks:
-            element.tags = _extract_xbrl_tags(nodes)
-            elements.append(element)
-            block_nodes_map[element.id] = nodes
-
-            if text_block_info:
-                tb_name = text_block_info.name
-                if tb_name not in text_block_map:
-                    text_block_map[tb_name] = []
-                text_block_map[tb_name].append(element.id)
-
-        # Compute content offsets
-        page_content = page.content
-        current_offset = 0
-        for element in elements:
-            search_text = element.content[:min(100, len(element.content))]
-            idx = page_content.find(search_text, current_offset)
-
-            if idx >= 0:
-                element.content_start_offset = idx
-                element.content_end_offset = idx + len(element.content)
-                current_offset = element.content_end_offset
-            else:
-                element.content_start_offset = None
-                element.content_end_offset = None
-
-        page_elements[page_num] = elements
-
-        # Build TextBlock objects
-        seen_names = {}
-        for element, nodes, text_block_info in merged_blocks:
-            if text_block_info and text_block_info.name not in seen_names:
-                seen_names[text_block_info.name] = text_block_info
-
-        element_map = {elem.id: elem for elem in elements}
-        text_blocks = []
-
-        for tb_name, tb_info in seen_names.items():
-            element_ids = text_block_map.get(tb_name, [])
-            if element_ids:
-                tb_elements = [element_map[eid] for eid in element_ids if eid in element_map]
-                text_blocks.append(TextBlock(
-                    name=tb_name,
-                    title=tb_info.title,
-                    elements=tb_elements
-                ))
-
-        page_text_blocks[page_num] = text_blocks
+        elements, text_blocks, nodes_map, facts_map = build_page_elements(
+            page, page_segments.get(page.number, []), min_chars=min_chars
+        )
+        page_elements[page.number] = elements
+        page_text_blocks[page.number] = text_blocks
+        block_nodes_map.update(nodes_map)
+        block_facts_map.update(facts_map)
 
     result = []
     for page in pages:
@@ -129,7 +61,91 @@ def build_elements_for_pages(
             display_page=page.display_page
         ))
 
-    return result, block_nodes_map
+    return result, block_nodes_map, block_facts_map
+
+
+def build_page_elements(
+    page: Page,
+    segments: List[Tuple[str, Optional[Tag], Any, Tuple[Tag, ...]]],
+    min_chars: int = 500,
+) -> Tuple[List[Element], List[TextBlock], Dict[str, List[Tag]], Dict[str, List[Tag]]]:
+    """Build the Elements and TextBlocks of one page.
+
+    Pages are independent, so this can run for any subset of pages in any order.
+
+    Returns:
+        (elements, text_blocks, block_nodes_map, block_facts_map) for the page.
+    """
+    page_num = page.number
+    block_nodes_map: Dict[str, List[Tag]] = {}
+    block_facts_map: Dict[str, List[Tag]] = {}
+
+    if not segments:
+        return [], [], block_nodes_map, block_facts_map
+
+    raw_blocks = _group_segments_into_blocks(segments, page_num)
+    merged_blocks = _merge_small_blocks(raw_blocks, page_num, min_chars=min_chars)
+
+    elements = []
+    text_block_map: Dict[str, List[str]] = {}
+
+    for element, nodes, text_block_info, facts in merged_blocks:
+        elements.append(element)
+        block_nodes_map[element.id] = nodes
+        if facts:
+            block_facts_map[element.id] = facts
+
+        if text_block_info:
+            tb_name = text_block_info.name
+            if tb_name not in text_block_map:
+                text_block_map[tb_name] = []
+            text_block_map[tb_name].append(element.id)
+
+    # Compute content offsets
+    page_content = page.content
+    current_offset = 0
+    for element in elements:
+        search_text = element.content[:min(100, len(element.content))]
+        idx = page_content.find(search_text, current_offset)
+
+        if idx >= 0:
+            element.content_start_offset = idx
+            element.content_end_offset = idx + len(element.content)
+            current_offset = element.content_end_offset
+        else:
+            element.content_start_offset = None
+            element.content_end_offset = None
+
+    # Build TextBlock objects
+    seen_names = {}
+    for element, _, text_block_info, _ in merged_blocks:
+        if text_block_info and text_block_info.name not in seen_names:
+            seen_names[text_block_info.name] = text_block_info
+
+    element_map = {elem.id: elem for elem in elements}
+    text_blocks = []
+
+    for tb_name, tb_info in seen_names.items():
+        element_ids = text_block_map.get(tb_name, [])
+        if element_ids:
+            tb_elements = [element_map[eid] for eid in element_ids if eid in element_map]
+            text_blocks.append(TextBlock(
+                name=tb_name,
+                title=tb_info.title,
+                elements=tb_elements
+            ))
+
+    return elements, text_blocks, block_nodes_map, block_facts_map
+
+
+def build_concept_index(pages: List[Page]) -> Dict[str, List[str]]:
+    """Map each XBRL concept name to the IDs of elements tagged with it, in document order."""
+    index: Dict[str, List[str]] = {}
+    for page in pages:
+        for element in page.elements or []:
+            for name in element.tags or []:
+                index.setdefault(name, []).append(element.id)
+    return index
 
 
 def augment_html_with_ids(
@@ -171,9 +187,9 @@ def augment_html_with_ids(
 # Internal helpers
 # ---------------------------------------------------------------------------
 
-def _is_bold_header(element: Element) -> bool:
-    """Check if element is a bold header (section boundary marker)."""
-    content = element.content.strip()
+def _is_bold_header(content: str) -> bool:
+    """Check if block content is a bold header (section boundary marker)."""
+    content = content.strip()
 
     if not (content.startswith('**') and '**' in content[2:]):
         return False
@@ -188,6 +204,12 @@ def _is_bold_header(element: Element) -> bool:
     return False
 
 
+def _concept_names(facts: List[Tag]) -> Optional[List[str]]:
+    """Distinct concept names of ``facts`` in document order, or None."""
+    names = list(dict.fromkeys(f.get('name') for f in facts if f.get('name')))
+    return names or None
+
+
 def _generate_block_id(page: int, idx: int, content: str, kind: str) -> str:
     """Generate stable block ID using normalized content hash."""
     normalized = re.sub(r'\s+', ' ', content.strip()).lower()
@@ -216,186 +238,188 @@ def _infer_kind_from_nodes(nodes: List[Tag]) -> str:
     return "text"
 
 
-def _create_block(
-    segments: List[str],
-    nodes: List[Tag],
-    page_num: int,
-    block_idx: int,
-) -> Optional[Element]:
-    """Create an Element from segments and nodes."""
-    content = "".join(segments).strip()
-    if not content:
-        return None
+@dataclass
+class _RawBlock:
+    """A block split on blank lines, before small blocks are merged.
+
+    ``idx`` is the block's position among raw blocks on the page; blocks
+    emitted unmerged (standalone tables) keep it in their element ID.
+    """
+    content: str
+    kind: str
+    nodes: List[Tag]
+    text_block: Any
+    idx: int
+    bold_header: bool
+    facts: List[Tag]
+
+
+class _NodeList:
+    """Ordered DOM nodes without duplicates, checked by identity in O(1)."""
+
+    __slots__ = ("nodes", "_seen")
+
+    def __init__(self):
+        self.nodes: List[Tag] = []
+        self._seen: set = set()
 
-    kind = _infer_kind_from_nodes(nodes)
-    block_id = _generate_block_id(page_num, block_idx, content, kind)
+    def add(self, node: Tag) -> None:
+        if id(node) not in self._seen:
+            self._seen.add(id(node))
+            self.nodes.append(node)
 
-    return Element(
-        id=block_id,
-        content=content,
-        kind=kind,
-        page_start=page_num,
-        page_end=page_num
-    )
+    def extend(self, nodes: List[Tag]) -> None:
+        for node in nodes:
+            self.add(node)
+
+    @classmethod
+    def of(cls, nodes) -> List[Tag]:
+        node_list = cls()
+        node_list.extend(nodes)
+        return node_list.nodes
 
 
 def _group_segments_into_blocks(
-    segments: List[Tuple[str, Optional[Tag], Any]],
+    segments: List[Tuple[str, Optional[Tag], Any, Tuple[Tag, ...]]],
     page_num: int,
-) -> List[Tuple[Element, List[Tag], Any]]:
+) -> List[_RawBlock]:
     """Group sequential segments into semantic blocks (split on double newlines)."""
-    blocks = []
-    current_block_segments: List[str] = []
-    current_block_nodes: List[Tag] = []
+    blocks: List[_RawBlock] = []
+    current_segments: List[str] = []
+    current_nodes = _NodeList()
+    current_facts = _NodeList()
     current_text_block = None
-    block_idx = 0
-
-    for content, node, text_block in segments:
-        if content == "\n":
-            if current_block_segments and current_block_segments[-1] == "\n":
-                if len(current_block_segments) > 1:
-                    block = _create_block(
-                        current_block_segments[:-1],
-                        current_block_nodes,
-                        page_num,
-                        block_idx
-                    )
-                    if block:
-                        blocks.append((block, list(current_block_nodes), current_text_block))
-                        block_idx += 1
-                current_block_segments = []
-                current_block_nodes = []
-                current_text_block = None
-                continue
 
-        current_block_segments.append(content)
-        if node is not None and node not in current_block_nodes:
-            current_block_nodes.append(node)
+    def emit(parts: List[str]) -> None:
+        content = "".join(parts).strip()
+        if content:
+            blocks.append(_RawBlock(
+                content=content,
+                kind=_infer_kind_from_nodes(current_nodes.nodes),
+                nodes=current_nodes.nodes,
+                text_block=current_text_block,
+                idx=len(blocks),
+                bold_header=_is_bold_header(content),
+                facts=current_facts.nodes,
+            ))
+
+    for content, node, text_block, facts in segments:
+        if content == "\n" and current_segments and current_segments[-1] == "\n":
+            if len(current_segments) > 1:
+                emit(current_segments[:-1])
+            current_segments = []
+            current_nodes = _NodeList()
+            current_facts = _NodeList()
+            current_text_block = None
+            continue
+
+        current_segments.append(content)
+        current_facts.extend(facts)
+        if node is not None:
+            current_nodes.add(node)
         if text_block is not None:
             current_text_block = text_block
 
-    if current_block_segments:
-        while current_block_segments and current_block_segments[-1] == "\n":
-            current_block_segments.pop()
-
-        if current_block_segments:
-            block = _create_block(
-                current_block_segments,
-                current_block_nodes,
-                page_num,
-                block_idx
-            )
-            if block:
-                blocks.append((block, list(current_block_nodes), current_text_block))
+    while current_segments and current_segments[-1] == "\n":
+        current_segments.pop()
+    if current_segments:
+        emit(current_segments)
 
     return blocks
 
 
 def _merge_small_blocks(
-    blocks_with_nodes: List[Tuple[Element, List[Tag], Any]],
+    blocks: List[_RawBlock],
     page_num: int,
     min_chars: int = 500,
-) -> List[Tuple[Element, List[Tag], Any]]:
-    """Merge consecutive small blocks into larger semantic units."""
-    if not blocks_with_nodes:
-        return []
-
-    merged: List[Tuple[Element, List[Tag], Any]] = []
-    current_elements: List[Element] = []
-    current_nodes: List[Tag] = []
+) -> List[Tuple[Element, List[Tag], Any, List[Tag]]]:
+    """Merge consecutive small blocks into larger semantic units.
+
+    Element IDs are only generated here, for the final blocks.
+    """
+    merged: List[Tuple[Element, List[Tag], Any, List[Tag]]] = []
+    current: List[_RawBlock] = []
+    current_nodes = _NodeList()
     current_chars = 0
+    current_all_headers = True
     current_text_block = None
 
-    def flush(block_idx: int):
-        nonlocal current_elements, current_nodes, current_chars
-        if not current_elements:
+    def emit(content: str, kind: str, idx: int, nodes: List[Tag], text_block: Any, facts: List[Tag]) -> None:
+        element = Element(
+            id=_generate_block_id(page_num, idx, content, kind),
+            content=content,
+            kind=kind,
+            page_start=page_num,
+            page_end=page_num,
+            tags=_concept_names(facts)
+        )
+        merged.append((element, nodes, text_block, facts))
+
+    def add(block: _RawBlock) -> None:
+        nonlocal current_chars, current_all_headers
+        current.append(block)
+        current_nodes.extend(block.nodes)
+        current_chars += len(block.content)
+        current_all_headers = current_all_headers and block.bold_header
+
+    def flush() -> None:
+        nonlocal current, current_nodes, current_chars, current_all_headers
+        if not current:
             return
 
-        merged_content = '\n\n'.join(e.content for e in current_elements)
-
-        kinds = [e.kind for e in current_elements]
+        kinds = [b.kind for b in current]
         if 'table' in kinds:
             kind = 'table'
         elif 'header' in kinds:
             kind = 'section'
         else:
-            kind = current_elements[0].kind
-
-        block_id = _generate_block_id(page_num, block_idx, merged_content, kind)
-
-        merged_element = Element(
-            id=block_id,
-            content=merged_content,
-            kind=kind,
-            page_start=page_num,
-            page_end=page_num
-        )
+            kind = current[0].kind
 
-        merged.append((merged_element, list(current_nodes), current_text_block))
-        current_elements = []
-        current_nodes = []
+        emit('\n\n'.join(b.content for b in current), kind, len(merged),
+             current_nodes.nodes, current_text_block, _NodeList.of(f for b in current for f in b.facts))
+        current = []
+        current_nodes = _NodeList()
         current_chars = 0
+        current_all_headers = True
 
-    for i, (element, nodes, text_block) in enumerate(blocks_with_nodes):
-        text_block_changed = False
-        if current_text_block is not None or text_block is not None:
-            if current_text_block is None and text_block is not None:
-                text_block_changed = True
-            elif current_text_block is not None and text_block is None:
-                text_block_changed = True
-            elif current_text_block is not None and text_block is not None:
-                text_block_changed = current_text_block.name != text_block.name
+    last = len(blocks) - 1
+    for i, block in enumerate(blocks):
+        text_block = block.text_block
+        if current_text_block is None or text_block is None:
+            text_block_changed = current_text_block is not text_block
+        else:
+            text_block_changed = current_text_block.name != text_block.name
 
-        if text_block_changed and current_elements:
-            flush(len(merged))
+        if text_block_changed:
+            flush()
 
         current_text_block = text_block
 
-        if element.kind == 'table':
-            if current_elements and current_chars < min_chars:
-                current_elements.append(element)
-                current_nodes.extend([n for n in nodes if n not in current_nodes])
-                flush(len(merged))
+        if block.kind == 'table':
+            if current and current_chars < min_chars:
+                add(block)
+                flush()
             else:
-                flush(len(merged))
-                merged.append((element, nodes, text_block))
+                flush()
+                emit(block.content, block.kind, block.idx, block.nodes, text_block, block.facts)
             continue
 
-        bold_header = _is_bold_header(element)
-
         # Flush before bold headers (section boundaries), but keep headers with content
-        if bold_header and current_elements:
-            all_headers = all(_is_bold_header(e) for e in current_elements)
-            is_current_only_headers = all_headers and current_chars < 200
-
-            if not is_current_only_headers:
-                flush(len(merged))
-
-        current_elements.append(element)
-        current_nodes.extend([n for n in nodes if n not in current_nodes])
-        current_chars += element.char_count
+        if block.bold_header and current:
+            if not (current_all_headers and current_chars < 200):
+                flush()
 
-        should_flush = False
+        add(block)
 
-        if current_chars >= min_chars:
-            should_flush = True
-
-        if i + 1 < len(blocks_with_nodes):
-            next_element, _, _ = blocks_with_nodes[i + 1]
-            if _is_bold_header(next_element):
-                should_flush = True
-
-        if i == len(blocks_with_nodes) - 1:
-            should_flush = True
-
-        if should_flush:
-            all_headers = all(_is_bold_header(e) for e in current_elements)
-            is_only_headers = all_headers and current_chars < 200
+        should_flush = (
+            current_chars >= min_chars
+            or i == last
+            or blocks[i + 1].bold_header
+        )
 
-            if not is_only_headers:
-                flush(len(merged))
+        if should_flush and not (current_all_headers and current_chars < 200):
+            flush()
 
-    if current_elements:
-        flush(len(merged))
+    flush()
 
     return merged
@@ -0,0 +1,123 @@
+"""Interval index over element character offsets.
+
+Citations from an LLM answer come back as ``(page, offset)`` positions in
+page content. ``ElementIndex`` maps them to element IDs with binary search
+over each page's ``[content_start_offset, content_end_offset)`` intervals
+instead of scanning ``page.elements``. The index is built once per filing
+and round-trips through ``to_dict()``/``from_dict()`` (JSON-friendly).
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from sec2md.models import Page
+
+
+@dataclass
+class _PageIntervals:
+    """One page's intervals sorted by start, with running max of ends."""
+    starts: List[int] = field(default_factory=list)
+    ends: List[int] = field(default_factory=list)
+    ids: List[str] = field(default_factory=list)
+    max_ends: List[int] = field(default_factory=list)
+
+    @classmethod
+    def from_rows(cls, rows: List[tuple]) -> "_PageIntervals":
+        rows = sorted(rows, key=lambda r: r[0])
+        intervals = cls(
+            starts=[r[0] for r in rows],
+            ends=[r[1] for r in rows],
+            ids=[r[2] for r in rows],
+        )
+        running = -1
+        for end in intervals.ends:
+            running = max(running, end)
+            intervals.max_ends.append(running)
+        return intervals
+
+    def _candidates(self, hi: int, start: int) -> List[int]:
+        """Positions below ``hi`` whose end is past ``start``, in start order.
+
+        Walks left only while some interval at or before the position can
+        still reach ``start`` (via ``max_ends``), so non-overlapping layouts
+        cost O(log n + k).
+        """
+        found = []
+        i = hi - 1
+        while i >= 0 and self.max_ends[i] > start:
+            if self.ends[i] > start:
+                found.append(i)
+            i -= 1
+        found.reverse()
+        return found
+
+
+class ElementIndex:
+    """Filing-wide interval index from ``(page, offset)`` to element IDs."""
+
+    def __init__(self, pages: Optional[Dict[int, _PageIntervals]] = None):
+        self._pages: Dict[int, _PageIntervals] = pages or {}
+
+    @classmethod
+    def from_pages(cls, pages: List[Page]) -> "ElementIndex":
+        """Index every element with content offsets, keyed by ``page_start``."""
+        rows: Dict[int, List[tuple]] = {}
+        for page in pages:
+            for element in page.elements or []:
+                start, end = element.content_start_offset, element.content_end_offset
+                if start is None or end is None:
+                    continue
+                rows.setdefault(element.page_start, []).append((start, end, element.id))
+        return cls({num: _PageIntervals.from_rows(r) for num, r in rows.items()})
+
+    def __len__(self) -> int:
+        return sum(len(p.ids) for p in self._pages.values())
+
+    def locate(self, page: int, offset: int) -> Optional[str]:
+        """ID of the element covering ``offset`` on ``page``, or None.
+
+        If intervals overlap, the one starting last (the innermost) wins.
+        """
+        intervals = self._pages.get(page)
+        if intervals is None:
+            return None
+        hi = bisect_right(intervals.starts, offset)
+        hits = intervals._candidates(hi, offset)
+        return intervals.ids[hits[-1]] if hits else None
+
+    def overlapping(self, page: int, start: int, end: int) -> List[str]:
+        """IDs of elements on ``page`` intersecting ``[start, end)``, in offset order."""
+        intervals = self._pages.get(page)
+        if intervals is None or end <= start:
+            return []
+        hi = bisect_left(intervals.starts, end)
+        return [intervals.ids[i] for i in intervals._candidates(hi, start)]
+
+    def within(self, page: int, start: int, end: int) -> List[str]:
+        """IDs of elements on ``page`` lying entirely inside ``[start, end]``, in offset order."""
+        intervals = self._pages.get(page)
+        if intervals is None:
+            return []
+        lo = bisect_left(intervals.starts, start)
+        hi = bisect_right(intervals.starts, end)
+        return [intervals.ids[i] for i in range(lo, hi) if intervals.ends[i] <= end]
+
+    def to_dict(self) -> Dict[str, Dict[str, list]]:
+        """Plain dict of per-page ``starts``/``ends``/``ids`` lists, keyed by page number as a string."""
+        return {
+            str(num): {"starts": p.starts, "ends": p.ends, "ids": p.ids}
+            for num, p in sorted(self._pages.items())
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Dict[str, list]]) -> "ElementIndex":
+        return cls({
+            int(num): _PageIntervals.from_rows(list(zip(p["starts"], p["ends"], p["ids"])))
+            for num, p in data.items()
+        })
+
+    def __repr__(self) -> str:
+        return f"ElementIndex(pages={len(self._pages)}, elements={len(self)})"
@@ -0,0 +1,108 @@
+"""Chunked serialization of the annotated DOM.
+
+``str(soup)`` renders a whole filing into one string, so writing it out
+holds the DOM and a full serialized copy at once. ``iter_html`` yields the
+same markup piece by piece instead: tags with block-level children are
+opened, walked and closed, and everything below them (a paragraph, a
+table) is rendered by bs4 as one piece. Peak extra memory is then bounded
+by the largest leaf block plus the write buffer.
+"""
+
+from __future__ import annotations
+
+import io
+from typing import IO, Iterator, Union
+
+from bs4 import BeautifulSoup
+from bs4.element import NavigableString, Tag
+
+# Rendered in one piece by bs4, whatever they contain
+_LEAF_TAGS = {"table", "p", "pre", "script", "style", "textarea", "h1", "h2", "h3", "h4", "h5", "h6", "svg", "math"}
+# Children that don't make their parent worth splitting
+_INLINE_TAGS = {
+    "a", "b", "i", "u", "em", "strong", "span", "font", "sup", "sub", "small", "big", "code",
+    "br", "img", "wbr", "ix:nonfraction", "ix:nonnumeric",
+}
+DEFAULT_BUFFER_SIZE = 1 << 16
+
+
+def _open_tag(tag: Tag, formatter) -> str:
+    """Opening tag as bs4 renders it (``Tag._format_tag`` with opening=True)."""
+    attrs = []
+    for key, val in formatter.attributes(tag):
+        if val is None:
+            attrs.append(key)
+            continue
+        if isinstance(val, (list, tuple)):
+            val = " ".join(val)
+        elif not isinstance(val, str):
+            val = str(val)
+        attrs.append(f"{key}={formatter.quoted_attribute_value(formatter.attribute_value(val))}")
+    prefix = f"{tag.prefix}:" if tag.prefix else ""
+    attribute_string = " " + " ".join(attrs) if attrs else ""
+    return f"<{prefix}{tag.name}{attribute_string}>"
+
+
+def _close_tag(tag: Tag) -> str:
+    prefix = f"{tag.prefix}:" if tag.prefix else ""
+    return f"</{prefix}{tag.name}>"
+
+
+def _is_container(tag: Tag) -> bool:
+    if tag.name in _LEAF_TAGS or tag.is_empty_element:
+        return False
+    return any(isinstance(child, Tag) and child.name not in _INLINE_TAGS for child in tag.contents)
+
+
+def iter_html(soup: Union[BeautifulSoup, Tag], formatter: str = "minimal") -> Iterator[str]:
+    """Yield ``str(soup)`` in pieces, in document order.
+
+    Example:
+        >>> "".join(iter_html(parser.soup)) == str(parser.soup)
+        True
+    """
+    fmt = soup.formatter_for_name(formatter)
+    stack = [soup]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, NavigableString):
+            yield node.output_ready(fmt)
+        elif isinstance(node, str):
+            # Closing tag pushed when its element was opened
+            yield node
+        elif node is soup or _is_container(node):
+            if not node.hidden:
+                yield _open_tag(node, fmt)
+                stack.append(_close_tag(node))
+            stack.extend(reversed(node.contents))
+        else:
+            yield node.decode(formatter=fmt)
+
+
+def write_html(soup: Union[BeautifulSoup, Tag], fp: IO, buffer_size: int = DEFAULT_BUFFER_SIZE) -> int:
+    """Write ``str(soup)`` to ``fp`` in buffered chunks.
+
+    Args:
+        soup: Document or subtree to serialize.
+        fp: Text file-like object, or binary one (written as UTF-8).
+        buffer_size: Characters collected before each ``fp.write``.
+
+    Returns:
+        Number of characters written.
+    """
+    binary = isinstance(fp, (io.RawIOBase, io.BufferedIOBase)) or "b" in getattr(fp, "mode", "")
+    pending = []
+    size = total = 0
+    for piece in iter_html(soup):
+        pending.append(piece)
+        size += len(piece)
+        if size >= buffer_size:
+            chunk = "".join(pending)
+            fp.write(chunk.encode("utf-8") if binary else chunk)
+            total += size
+            pending, size = [], 0
+    if pending:
+        chunk = "".join(pending)
+        fp.write(chunk.encode("utf-8") if binary else chunk)
+        total += size
+    return total
@@ -0,0 +1,132 @@
+"""Positioned-layout index for PDF-to-HTML filings.
+
+Filings converted from PDF lay text out as ``position:absolute`` boxes. The
+parser groups those boxes into blocks, splits groups on column transitions
+and hands them to ``AbsolutelyPositionedTableParser``; every step needs the
+same coordinates, text and style flags. ``LayoutIndex`` measures each box
+once so the CSS regexes, ``get_text`` and spacer checks run once per box
+rather than once per routine.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import Iterable, Iterator, List, Optional
+
+from bs4 import Tag
+
+from sec2md.utils import clean_text
+
+_LEFT_RE = re.compile(r'left:\s*(\d+(?:\.\d+)?)px')
+_TOP_RE = re.compile(r'top:\s*(\d+(?:\.\d+)?)px')
+_BOTTOM_RE = re.compile(r'bottom:\s*(\d+(?:\.\d+)?)px')
+_SPACER_WIDTH_RE = re.compile(r'width:(\d+)px')
+
+# Assumed page height when a box is anchored with bottom: instead of top:
+FALLBACK_HEIGHT = 10000.0
+
+
+def extract_top_px(style: str, fallback_height: float = FALLBACK_HEIGHT) -> Optional[float]:
+    """Y position from ``top:`` or, failing that, ``bottom:`` CSS."""
+    m_top = _TOP_RE.search(style)
+    if m_top:
+        return float(m_top.group(1))
+    m_bot = _BOTTOM_RE.search(style)
+    if m_bot:
+        return fallback_height - float(m_bot.group(1))
+    return None
+
+
+def is_absolutely_positioned(el: Tag) -> bool:
+    style = (el.get("style") or "").lower().replace(" ", "")
+    return "position:absolute" in style
+
+
+def is_spacer(el: Tag, text: Optional[str] = None) -> bool:
+    """Detect inline-block spacer boxes common in PDF->HTML conversions.
+
+    Style checks run first so the node is only serialized (to look for
+    ``&nbsp;``) for narrow inline-block boxes that actually carry text.
+    """
+    style = el.get("style", "").lower().replace(" ", "")
+    if 'display:inline-block' not in style:
+        return False
+    width_match = _SPACER_WIDTH_RE.search(style)
+    if not (width_match and int(width_match.group(1)) < 30):
+        return False
+    if text is None:
+        text = el.get_text(strip=True)
+    if not text:
+        return True
+    markup = str(el)
+    return '\xa0' in markup or '&nbsp;' in markup
+
+
+@dataclass
+class PositionedBox:
+    """One absolutely positioned element, measured once."""
+    el: Tag
+    left: Optional[float]
+    top: Optional[float]       # from top: only
+    y: Optional[float]         # from top:, else derived from bottom:
+    text: str                  # cleaned text
+    has_text: bool
+    bold: bool
+    spacer: bool
+
+    @classmethod
+    def from_tag(cls, el: Tag) -> "PositionedBox":
+        style = el.get("style", "")
+        left = _LEFT_RE.search(style)
+        top = _TOP_RE.search(style)
+        raw_text = el.get_text(separator=" ", strip=True)
+        lowered = style.lower()
+        return cls(
+            el=el,
+            left=float(left.group(1)) if left else None,
+            top=float(top.group(1)) if top else None,
+            y=float(top.group(1)) if top else extract_top_px(style),
+            text=clean_text(raw_text),
+            has_text=bool(raw_text),
+            bold="font-weight:700" in lowered or "font-weight:bold" in lowered,
+            spacer=is_spacer(el, raw_text),
+        )
+
+    @property
+    def position(self) -> Optional[tuple]:
+        """(left, top) when both are set via ``left:``/``top:``."""
+        if self.left is None or self.top is None:
+            return None
+        return (self.left, self.top)
+
+
+class LayoutIndex:
+    """Measured positioned boxes of one container, in document order."""
+
+    def __init__(self, boxes: List[PositionedBox]):
+        self.boxes = boxes
+
+    @classmethod
+    def from_container(cls, container: Tag) -> "LayoutIndex":
+        """Index the container's absolutely positioned children that have text or are spacers."""
+        boxes = []
+        for child in container.children:
+            if isinstance(child, Tag) and is_absolutely_positioned(child):
+                box = PositionedBox.from_tag(child)
+                if box.has_text or box.spacer:
+                    boxes.append(box)
+        return cls(boxes)
+
+    @classmethod
+    def from_elements(cls, elements: Iterable[Tag]) -> "LayoutIndex":
+        return cls([PositionedBox.from_tag(el) for el in elements if isinstance(el, Tag)])
+
+    def __iter__(self) -> Iterator[PositionedBox]:
+        return iter(self.boxes)
+
+    def __len__(self) -> int:
+        return len(self.boxes)
+
+    def __repr__(self) -> str:
+        return f"LayoutIndex(boxes={len(self.boxes)})"
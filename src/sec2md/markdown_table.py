@@ -0,0 +1,210 @@
+"""Structured view of a pipe-delimited markdown table.
+
+Tables travel through the pipeline as markdown strings (``Element.content``,
+``TableBlock.content``). ``MarkdownTable`` parses them back into a header and
+cell rows so they can be sliced by row or column and re-rendered, including
+in the token-compact formats of ``TableFormat``.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import List, Sequence, Union
+
+_PIPE_SPLIT_RE = re.compile(r"(?<!\\)\|")
+_SEPARATOR_CELL_RE = re.compile(r"^\s*:?-{3,}:?\s*$")
+_WS_RE = re.compile(r"\s+")
+_PAREN_RE = re.compile(r"\(\s+([^()]*?)\s+\)")
+_CURRENCY_RE = re.compile(r"([$€£¥])\s+(?=[\d(.-])")
+_PERCENT_RE = re.compile(r"(?<=[\d)])\s+%")
+ELLIPSIS = "..."
+
+
+class TableFormat(str, Enum):
+    """How tables are rendered in chunks and elements."""
+    MARKDOWN = "markdown"  # Minified pipe table (default)
+    COMPACT = "compact"    # Pipe table without empty columns, padding or spaced numbers
+    ROWS = "rows"          # One "label: v1; v2" line per row
+    TSV = "tsv"            # Tab-separated values
+
+
+def compact_cell(text: str) -> str:
+    """Tighten a cell: ``$ 1,234`` -> ``$1,234``, ``( 12 )`` -> ``(12)``, ``5 %`` -> ``5%``."""
+    text = _WS_RE.sub(" ", text).strip()
+    text = _PAREN_RE.sub(r"(\1)", text)
+    text = _CURRENCY_RE.sub(r"\1", text)
+    return _PERCENT_RE.sub("%", text)
+
+
+def split_row(line: str) -> List[str]:
+    """Split a markdown table row into stripped cell texts (escaped pipes are kept)."""
+    s = line.strip()
+    if s.startswith("|"):
+        s = s[1:]
+    if s.endswith("|") and not s.endswith("\\|"):
+        s = s[:-1]
+    return [c.strip() for c in _PIPE_SPLIT_RE.split(s)]
+
+
+def is_separator_row(line: str) -> bool:
+    """True for header separator rows like ``| --- | :---: |``."""
+    if "-" not in line:
+        return False
+    cells = split_row(line)
+    return bool(cells) and all(_SEPARATOR_CELL_RE.match(c) for c in cells)
+
+
+def render_row(cells: Sequence[str]) -> str:
+    return "| " + " | ".join(cells) + " |"
+
+
+@dataclass
+class MarkdownTable:
+    """A markdown table as a header row plus data rows of cell strings."""
+    header: List[str]
+    rows: List[List[str]] = field(default_factory=list)
+
+    @classmethod
+    def from_lines(cls, lines: Sequence[str]) -> "MarkdownTable":
+        """Parse non-empty table lines (header, optional separator, data rows)."""
+        lines = [ln for ln in lines if ln.strip()]
+        if not lines:
+            return cls(header=[], rows=[])
+        header = split_row(lines[0])
+        body = lines[1:]
+        if body and is_separator_row(body[0]):
+            body = body[1:]
+        table = cls(header=header, rows=[split_row(ln) for ln in body])
+        table._pad()
+        return table
+
+    @classmethod
+    def from_markdown(cls, text: str) -> "MarkdownTable":
+        return cls.from_lines(text.split("\n"))
+
+    @property
+    def num_columns(self) -> int:
+        return max([len(self.header)] + [len(r) for r in self.rows]) if (self.header or self.rows) else 0
+
+    def _pad(self) -> None:
+        n = self.num_columns
+        self.header = self.header + [""] * (n - len(self.header))
+        self.rows = [r + [""] * (n - len(r)) for r in self.rows]
+
+    def select_columns(self, columns: Sequence[int]) -> "MarkdownTable":
+        """Return a new table containing only ``columns`` (in the given order)."""
+        return MarkdownTable(
+            header=[self.header[c] for c in columns],
+            rows=[[row[c] for c in columns] for row in self.rows],
+        )
+
+    def separator_line(self) -> str:
+        return render_row(["---"] * self.num_columns)
+
+    def to_markdown(self) -> str:
+        if not self.header:
+            return ""
+        lines = [render_row(self.header), self.separator_line()]
+        lines.extend(render_row(row) for row in self.rows)
+        return "\n".join(lines)
+
+    @staticmethod
+    def _is_ellipsis_row(row: Sequence[str]) -> bool:
+        return bool(row) and all(c == ELLIPSIS for c in row)
+
+    def compacted(self) -> "MarkdownTable":
+        """Tightened cells with empty rows and empty value columns removed.
+
+        Column 0 (row labels) is always kept. Ellipsis continuation rows from
+        table splitting do not keep an otherwise empty column alive.
+        """
+        header = [compact_cell(c) for c in self.header]
+        rows = [[compact_cell(c) for c in row] for row in self.rows]
+        rows = [row for row in rows if any(row)]
+        content_rows = [row for row in rows if not self._is_ellipsis_row(row)]
+        keep = [
+            c for c in range(self.num_columns)
+            if c == 0 or header[c] or any(row[c] for row in content_rows)
+        ]
+        return MarkdownTable(
+            header=[header[c] for c in keep],
+            rows=[[row[c] for c in keep] for row in rows],
+        )
+
+    def to_compact_markdown(self) -> str:
+        table = self.compacted()
+        if not table.header:
+            return ""
+        lines = ["|" + "|".join(table.header) + "|", "|" + "|".join(["-"] * table.num_columns) + "|"]
+        lines.extend("|" + "|".join(row) + "|" for row in table.rows)
+        return "\n".join(lines)
+
+    @staticmethod
+    def _row_line(cells: Sequence[str]) -> str:
+        label, values = cells[0], list(cells[1:])
+        if not any(values):
+            return label
+        while not values[-1]:
+            values.pop()
+        joined = "; ".join(values)
+        return f"{label}: {joined}" if label else joined
+
+    def to_rows(self) -> str:
+        """One line per row: ``label: v1; v2``. Inner empty values keep their slot to preserve alignment."""
+        table = self.compacted()
+        lines = []
+        if any(table.header):
+            lines.append(self._row_line(table.header))
+        for row in table.rows:
+            lines.append(ELLIPSIS if self._is_ellipsis_row(row) else self._row_line(row))
+        return "\n".join(line for line in lines if line)
+
+    def to_tsv(self) -> str:
+        table = self.compacted()
+        if not table.header:
+            return ""
+        lines = ["\t".join(table.header)]
+        lines.extend("\t".join(row) for row in table.rows)
+        return "\n".join(lines)
+
+    def render(self, table_format: Union[TableFormat, str] = TableFormat.MARKDOWN) -> str:
+        """Render the table in ``table_format``."""
+        table_format = TableFormat(table_format)
+        if table_format is TableFormat.COMPACT:
+            return self.to_compact_markdown()
+        if table_format is TableFormat.ROWS:
+            return self.to_rows()
+        if table_format is TableFormat.TSV:
+            return self.to_tsv()
+        return self.to_markdown()
+
+
+def render_tables(text: str, table_format: Union[TableFormat, str]) -> str:
+    """Re-render every pipe table in ``text`` in ``table_format``, leaving other lines untouched.
+
+    ``TableFormat.MARKDOWN`` returns ``text`` unchanged.
+    """
+    table_format = TableFormat(table_format)
+    if table_format is TableFormat.MARKDOWN or "|" not in text:
+        return text
+
+    out: List[str] = []
+    run: List[str] = []
+
+    def _flush() -> None:
+        if run:
+            rendered = MarkdownTable.from_lines(run).render(table_format)
+            if rendered:
+                out.append(rendered)
+            run.clear()
+
+    for line in text.split("\n"):
+        if line.lstrip().startswith("|"):
+            run.append(line)
+        else:
+            _flush()
+            out.append(line)
+    _flush()
+    return "\n".join(out)
@@ -3,8 +3,11 @@
 from __future__ import annotations
 
 from enum import Enum
-from typing import List, Optional, Literal, Tuple
-from pydantic import BaseModel, Field, field_validator, computed_field
+from typing import Any, Callable, Iterator, List, Optional, Literal, Tuple, Union
+from pydantic import BaseModel, Field, PrivateAttr, SerializationInfo, field_validator, computed_field, model_serializer
+
+from sec2md.markdown_table import TableFormat, render_tables
+from sec2md.text_buffer import PageSpan, TextSpan, joined_span
 
 try:
     import tiktoken
@@ -320,6 +323,52 @@ class Exhibit(BaseModel):
     model_config = {"frozen": False}
 
 
+class _SharedTextModel(BaseModel):
+    """Model whose ``content`` may live in a shared ``TextBuffer``.
+
+    Once bound to a span (see ``text_buffer.share_page_text``), ``content``
+    is removed from the instance and sliced from the buffer on each access.
+    Assigning ``content`` stores a plain string again.
+    """
+
+    _text_span: Optional[TextSpan] = PrivateAttr(default=None)
+
+    def _bind_text(self, span: TextSpan) -> None:
+        self._text_span = span
+        self.__dict__.pop("content", None)
+
+    def __getattr__(self, name: str) -> Any:
+        if name == "content":
+            private = self.__pydantic_private__ or {}
+            span = private.get("_text_span")
+            if span is not None:
+                return span.text()
+        return super().__getattr__(name)
+
+    def _before_serialize(self) -> None:
+        """Hook for subclasses with lazily built fields."""
+
+    @model_serializer(mode="wrap")
+    def _serialize_shared_text(self, handler, info: SerializationInfo) -> Any:
+        """Serialize buffer-backed ``content`` in its usual field position."""
+        self._before_serialize()
+        data = handler(self)
+        if not isinstance(data, dict) or "content" in data or self._text_span is None:
+            return data
+        if info.exclude is not None and "content" in info.exclude:
+            return data
+        if info.include is not None and "content" not in info.include:
+            return data
+        ordered = {}
+        for key in type(self).model_fields:
+            if key == "content":
+                ordered[key] = self.content
+            elif key in data:
+                ordered[key] = data[key]
+        ordered.update((k, v) for k, v in data.items() if k not in ordered)
+        return ordered
+
+
 class TextBlock(BaseModel):
     """XBRL TextBlock (e.g., financial statement note)."""
 
@@ -345,7 +394,7 @@ class TextBlock(BaseModel):
         return f"TextBlock(name='{self.name}', title='{self.title}', elements={len(self.elements)}{pages_info})"
 
 
-class Element(BaseModel):
+class Element(_SharedTextModel):
     """Citable semantic block of content."""
 
     id: str = Field(..., description="Unique element ID for citation")
@@ -356,6 +405,7 @@ class Element(BaseModel):
     content_start_offset: Optional[int] = Field(None, description="Character offset where element starts in page content")
     content_end_offset: Optional[int] = Field(None, description="Character offset where element ends in page content")
     tags: Optional[List[str]] = Field(None, description="XBRL concept tags found in this element (e.g., 'us-gaap:Revenue...')")
+    table_columns: Optional[Tuple[int, int]] = Field(None, description="Source table columns [start, end) in a column-split table part; the row-label column 0 is always repeated")
 
     model_config = {"frozen": False}
 
@@ -371,6 +421,18 @@ class Element(BaseModel):
         """Token count of this element."""
         return _count_tokens(self.content)
 
+    def formatted(self, table_format: Union[TableFormat, str] = TableFormat.MARKDOWN) -> str:
+        """
+        Element content with any tables rendered in ``table_format``.
+
+        Args:
+            table_format: "markdown" (content as stored), "compact", "rows" or "tsv".
+
+        Returns:
+            Rendered content; non-table lines are left unchanged.
+        """
+        return render_tables(self.content, table_format)
+
     def visualize(self, html: str) -> str:
         """
         Open the filing HTML in a browser with this element highlighted
@@ -391,7 +453,7 @@ class Element(BaseModel):
         return f"Element(id='{self.id}', kind='{self.kind}', {pages}, chars={len(self.content)}, preview='{preview}...')"
 
 
-class Page(BaseModel):
+class Page(_SharedTextModel):
     """Represents a single page of markdown content."""
 
     number: int = Field(..., description="Page number in the filing")
@@ -402,6 +464,57 @@ class Page(BaseModel):
 
     model_config = {"frozen": False, "arbitrary_types_allowed": True}
 
+    # Set by Parser.get_pages(lazy_elements=True); builds elements and text_blocks on first access
+    _element_loader: Optional[Callable[["Page"], None]] = PrivateAttr(default=None)
+
+    def _defer_elements(self, loader: Callable[["Page"], None]) -> None:
+        self._element_loader = loader
+        self.__dict__.pop("elements", None)
+        self.__dict__.pop("text_blocks", None)
+
+    @property
+    def elements_loaded(self) -> bool:
+        """False while this page's elements are still waiting to be built."""
+        return self._element_loader is None
+
+    def materialize(self) -> "Page":
+        """Build this page's elements and text blocks now if they were deferred."""
+        loader = self._element_loader
+        if loader is not None:
+            self._element_loader = None
+            self.__dict__["elements"] = None
+            self.__dict__["text_blocks"] = None
+            loader(self)
+        return self
+
+    def __getattr__(self, name: str) -> Any:
+        if name in ("elements", "text_blocks"):
+            private = self.__pydantic_private__ or {}
+            if private.get("_element_loader") is not None:
+                self.materialize()
+                return self.__dict__[name]
+        return super().__getattr__(name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name in ("elements", "text_blocks"):
+            self.materialize()
+        super().__setattr__(name, value)
+
+    def _before_serialize(self) -> None:
+        self.materialize()
+
+    def __getstate__(self) -> dict:
+        self.materialize()
+        return super().__getstate__()
+
+    def __copy__(self) -> "Page":
+        self.materialize()
+        return super().__copy__()
+
+    def __deepcopy__(self, memo: Optional[dict] = None) -> "Page":
+        self.materialize()
+        return super().__deepcopy__(memo)
+
     @computed_field
     @property
     def tokens(self) -> int:
@@ -452,7 +565,14 @@ class Page(BaseModel):
 
 
 class Section(BaseModel):
-    """Represents a filing section (e.g., ITEM 1A - Risk Factors)."""
+    """Represents a filing section (e.g., ITEM 1A - Risk Factors).
+
+    Sections from ``SectionExtractor`` are views: they keep ``PageSpan``
+    offsets into the parsed pages, and ``pages`` (one sliced ``Page`` per
+    span) is only built on first access. The token total is counted once
+    and cached; ``markdown()`` is rebuilt on each call so a section does not
+    hold a second copy of its text.
+    """
 
     part: Optional[str] = Field(None, description="Part name (e.g., 'PART I', None for 8-K)")
     item: Optional[str] = Field(None, description="Item identifier (e.g., 'ITEM 1A', 'ITEM 2.02')")
@@ -462,6 +582,10 @@ class Section(BaseModel):
 
     model_config = {"frozen": False, "arbitrary_types_allowed": True}
 
+    # Set by from_spans(); ``pages`` is built from these on first access
+    _spans: Optional[List[PageSpan]] = PrivateAttr(default=None)
+    _tokens: Optional[int] = PrivateAttr(default=None)
+
     @field_validator('pages')
     @classmethod
     def validate_pages_not_empty(cls, v: List[Page]) -> List[Page]:
@@ -470,10 +594,88 @@ class Section(BaseModel):
             raise ValueError("Section must contain at least one page")
         return v
 
+    @classmethod
+    def from_spans(cls, spans: List[PageSpan], **fields: Any) -> "Section":
+        """Section viewing ``spans`` of the parsed pages, without copying their text.
+
+        Args:
+            spans: One span per page, in order (at least one).
+            **fields: part, item, item_title, exhibits.
+        """
+        if not spans:
+            raise ValueError("Section must contain at least one page")
+        section = cls.model_construct(**fields)
+        section.__dict__.pop("pages", None)
+        section._spans = spans
+        return section
+
+    @property
+    def spans(self) -> Optional[List[PageSpan]]:
+        """Page spans this section views, or None once ``pages`` has been built."""
+        return self._spans
+
+    def _page_texts(self) -> Iterator[str]:
+        """Each page's share of the section text, without building ``pages``."""
+        spans = self._spans
+        if spans is not None:
+            return (span.content for span in spans)
+        return (p.content for p in self.pages)
+
+    def materialize(self) -> "Section":
+        """Build ``pages`` now if this section is still a view."""
+        spans = self._spans
+        if spans is not None:
+            self._spans = None
+            self.__dict__["pages"] = [
+                Page(
+                    number=span.page.number,
+                    content=span.content,
+                    elements=span.page.elements,
+                    text_blocks=span.page.text_blocks,
+                    display_page=span.page.display_page
+                )
+                for span in spans
+            ]
+        return self
+
+    def __getattr__(self, name: str) -> Any:
+        if name == "pages":
+            private = self.__pydantic_private__ or {}
+            if private.get("_spans") is not None:
+                self.materialize()
+                return self.__dict__[name]
+        return super().__getattr__(name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name == "pages":
+            self._spans = None
+            self._tokens = None
+        super().__setattr__(name, value)
+
+    @model_serializer(mode="wrap")
+    def _serialize_view(self, handler) -> Any:
+        self.materialize()
+        return handler(self)
+
+    def __getstate__(self) -> dict:
+        self.materialize()
+        return super().__getstate__()
+
+    def __copy__(self) -> "Section":
+        self.materialize()
+        return super().__copy__()
+
+    def __deepcopy__(self, memo: Optional[dict] = None) -> "Section":
+        self.materialize()
+        return super().__deepcopy__(memo)
+
     @computed_field
     @property
     def page_range(self) -> Tuple[int, int]:
         """Get the start and end page numbers for this section."""
+        spans = self._spans
+        if spans is not None:
+            return spans[0].page.number, spans[-1].page.number
         if not self.pages:
             return 0, 0
         return self.pages[0].number, self.pages[-1].number
@@ -481,17 +683,20 @@ class Section(BaseModel):
     @computed_field
     @property
     def tokens(self) -> int:
-        """Total number of tokens in this section."""
-        return sum(p.tokens for p in self.pages)
+        """Total number of tokens in this section (counted once, then cached)."""
+        if self._tokens is None:
+            self._tokens = sum(_count_tokens(text) for text in self._page_texts())
+        return self._tokens
 
     @property
     def content(self) -> str:
         """Get section content with page delimiters."""
-        return "\n\n---\n\n".join(p.content for p in self.pages)
+        return "\n\n---\n\n".join(self._page_texts())
 
     def markdown(self) -> str:
         """Get section content as single markdown string."""
-        return "\n\n".join(p.content for p in self.pages)
+        span = joined_span([p._text_span for p in self.pages]) if self._spans is None else None
+        return span.text() if span is not None else "\n\n".join(self._page_texts())
 
     def preview(self) -> None:
         """
@@ -1,21 +1,34 @@
 from __future__ import annotations
 
+import codecs
 import re
 import logging
 from collections import defaultdict
 from dataclasses import dataclass
-from typing import List, Dict, Union, Optional, Tuple
+from typing import IO, List, Dict, Union, Optional, Tuple
 
 from bs4 import BeautifulSoup
 from bs4.element import NavigableString, Tag
 
 from sec2md.absolute_table_parser import AbsolutelyPositionedTableParser
+from sec2md.layout import LayoutIndex, PositionedBox, is_absolutely_positioned
 from sec2md.utils import median, clean_text
 from sec2md.table_parser import TableParser
-from sec2md.models import Page, Element
-from sec2md.element_builder import build_elements_for_pages, augment_html_with_ids
+from sec2md.cache import TableCache
+from sec2md.models import Page, Element, TextBlock
+from sec2md.element_builder import (
+    build_elements_for_pages, build_page_elements, augment_html_with_ids, build_concept_index
+)
+from sec2md.xbrl import FactTable, extract_facts
+from sec2md.text_buffer import share_page_text, bind_element_text
+from sec2md.text_block_registry import TextBlockEntry, TextBlockRegistry
+from sec2md.cross_references import CrossReferenceGraph
+from sec2md.source_map import SourceMap
+from sec2md.html_writer import write_html
 
 BLOCK_TAGS = {"div", "p", "h1", "h2", "h3", "h4", "h5", "h6", "table", "br", "hr", "ul", "ol", "li"}
+ROW_GROUP_TAGS = {"thead", "tbody", "tfoot"}
+XBRL_FACT_TAGS = {"ix:nonfraction", "nonfraction", "ix:nonnumeric", "nonnumeric"}
 BOLD_TAGS = {"b", "strong"}
 ITALIC_TAGS = {"i", "em"}
 
@@ -23,6 +36,8 @@ _css_decl = re.compile(r"^[a-zA-Z\-]+\s*:\s*[^;]+;\s*$")
 ITEM_HEADER_CELL_RE = re.compile(r"^\s*Item\s+([0-9IVX]+)\.\s*$", re.I)
 PART_HEADER_CELL_RE = re.compile(r"^\s*Part\s+([IVX]+)\s*$", re.I)
 
+_ELEMENT_PAGE_RE = re.compile(r"^sec2md-p(\d+)-")
+
 logger = logging.getLogger(__name__)
 
 
@@ -36,16 +51,27 @@ class TextBlockInfo:
 class Parser:
     """Document parser with support for regular tables and pseudo-tables."""
 
-    def __init__(self, content: str):
+    def __init__(self, content: str, table_cache: Optional[TableCache] = None):
         self.soup = BeautifulSoup(content, "lxml")
+        self._content = content
+        self.table_cache = table_cache
         self.includes_table = False
         self.include_images = True
         self.pages: Dict[int, List[str]] = defaultdict(list)
-        self.page_segments: Dict[int, List[Tuple[str, Optional[Tag], Optional[TextBlockInfo]]]] = defaultdict(list)
+        self.page_segments: Dict[int, List[Tuple[str, Optional[Tag], Optional[TextBlockInfo], Tuple[Tag, ...]]]] = defaultdict(list)
         self.input_char_count = len(self.soup.get_text())
         self.current_text_block: Optional[TextBlockInfo] = None
         self.continuation_map: Dict[str, TextBlockInfo] = {}
         self.footer_page_numbers: Dict[int, int] = {}
+        self.pending_facts: List[Tag] = []
+        self.concept_index: Dict[str, List[str]] = {}
+        self.block_facts_map: Dict[str, List[Tag]] = {}
+        self.block_nodes_map: Dict[str, List[Tag]] = {}
+        self.deferred_pages: List[Page] = []
+        self.text_block_registry = TextBlockRegistry()
+        self._page_by_number: Dict[int, Page] = {}
+        self._cross_references: Optional[CrossReferenceGraph] = None
+        self._source_map: Optional[SourceMap] = None
 
     @staticmethod
     def _is_text_block_tag(el: Tag) -> bool:
@@ -93,6 +119,22 @@ class Parser:
 
         return TextBlockInfo(name=name, title=title)
 
+    def _record_fact(self, el: Tag) -> None:
+        """Queue an iXBRL fact for the next appended segment."""
+        if el.get('name'):
+            self.pending_facts.append(el)
+
+    def _record_facts_in(self, root: Tag) -> None:
+        """Queue all facts inside a subtree rendered in one piece."""
+        for el in root.descendants:
+            if isinstance(el, Tag) and el.name in XBRL_FACT_TAGS:
+                self._record_fact(el)
+
+    def _take_facts(self) -> Tuple[Tag, ...]:
+        facts = tuple(self.pending_facts)
+        self.pending_facts.clear()
+        return facts
+
     @staticmethod
     def _is_continuation_tag(el: Tag) -> bool:
         if not isinstance(el, Tag):
@@ -128,22 +170,7 @@ class Parser:
     def _is_absolutely_positioned(el: Tag) -> bool:
         if not isinstance(el, Tag):
             return False
-        style = (el.get("style") or "").lower().replace(" ", "")
-        return "position:absolute" in style
-
-    @staticmethod
-    def _extract_top_px(el: Tag, fallback_height: float = 10000.0) -> Optional[float]:
-        """Extract Y position from top: or bottom: CSS."""
-        if not isinstance(el, Tag):
-            return None
-        style = el.get("style", "")
-        m_top = re.search(r'top:\s*(\d+(?:\.\d+)?)px', style)
-        if m_top:
-            return float(m_top.group(1))
-        m_bot = re.search(r'bottom:\s*(\d+(?:\.\d+)?)px', style)
-        if m_bot:
-            return fallback_height - float(m_bot.group(1))
-        return None
+        return is_absolutely_positioned(el)
 
     @staticmethod
     def _is_inline_display(el: Tag) -> bool:
@@ -241,11 +268,13 @@ class Parser:
             merged = self._try_merge_inline_spans(last_text, s, last_source, source_node)
             if merged:
                 buf[-1] = merged
-                seg_buf[-1] = (merged, last_source, last_seg[2])
+                seg_buf[-1] = (merged, last_source, last_seg[2], last_seg[3] + self._take_facts())
                 return
 
         self.pages[page_num].append(s)
-        self.page_segments[page_num].append((s, source_node, tb))
+        self.page_segments[page_num].append((s, source_node, tb, self._take_facts()))
+        if tb is not None:
+            self.text_block_registry.record(tb.name, tb.title, page_num)
 
     def _blankline_before(self, page_num: int) -> None:
         buf = self.pages[page_num]
@@ -254,11 +283,11 @@ class Parser:
             return
         if not buf[-1].endswith("\n"):
             buf.append("\n")
-            seg_buf.append(("\n", None, self.current_text_block))
+            seg_buf.append(("\n", None, self.current_text_block, ()))
         if len(buf) >= 2 and buf[-1] == "\n" and buf[-2] == "\n":
             return
         buf.append("\n")
-        seg_buf.append(("\n", None, self.current_text_block))
+        seg_buf.append(("\n", None, self.current_text_block, ()))
 
     def _blankline_after(self, page_num: int) -> None:
         self._blankline_before(page_num)
@@ -282,19 +311,23 @@ class Parser:
         if isinstance(element, NavigableString):
             return self._process_text_node(element)
 
+        if element.name in XBRL_FACT_TAGS:
+            self._record_fact(element)
+
         if element.name == "img":
             if self.include_images:
                 return self._img_to_markdown(element)
             return ""
 
         if element.name == "table":
+            self._record_facts_in(element)
             eff_rows = self._effective_rows(element)
             if len(eff_rows) <= 1:
                 cells = eff_rows[0] if eff_rows else []
                 return self._one_row_table_to_text(cells)
 
             self.includes_table = True
-            return TableParser(element).md().strip()
+            return self._table_to_markdown(element)
 
         if element.name in {"ul", "ol"}:
             items = []
@@ -331,6 +364,18 @@ class Parser:
         wrap = self._wrap_markdown(element)
         return f"{wrap}{text}{wrap}" if wrap else text
 
+    def _table_to_markdown(self, table: Tag) -> str:
+        """Render a data table, reusing cached markdown for repeated tables."""
+        if self.table_cache is None:
+            return TableParser(table).md().strip()
+
+        key = self.table_cache.key_for(table)
+        markdown = self.table_cache.get(key)
+        if markdown is None:
+            markdown = TableParser(table).md().strip()
+            self.table_cache.put(key, markdown)
+        return markdown
+
     def _extract_page_number_from_footer(self, footer_el: Tag) -> Optional[int]:
         text = footer_el.get_text(" ", strip=True)
         if not text:
@@ -376,20 +421,11 @@ class Parser:
 
         return False
 
-    def _extract_absolutely_positioned_children(self, container: Tag) -> List[Tag]:
-        positioned_children = []
-        for child in container.children:
-            if isinstance(child, Tag) and self._is_absolutely_positioned(child):
-                if child.get_text(strip=True) or AbsolutelyPositionedTableParser._is_spacer(child):
-                    positioned_children.append(child)
-        return positioned_children
-
-    def _compute_line_gaps(self, elements: List[Tag]) -> List[float]:
-        y_positions = []
-        for el in elements:
-            y = self._extract_top_px(el)
-            if y is not None:
-                y_positions.append(y)
+    def _extract_absolutely_positioned_children(self, container: Tag) -> List[PositionedBox]:
+        return LayoutIndex.from_container(container).boxes
+
+    def _compute_line_gaps(self, boxes: List[PositionedBox]) -> List[float]:
+        y_positions = [box.y for box in boxes if box.y is not None]
 
         if len(y_positions) < 2:
             return []
@@ -398,13 +434,14 @@ class Parser:
         gaps = [y_positions[i + 1] - y_positions[i] for i in range(len(y_positions) - 1)]
         return [g for g in gaps if 5 < g < 100]
 
-    def _split_positioned_groups(self, elements: List[Tag], gap_threshold: Optional[float] = None) -> List[List[Tag]]:
-        """Split positioned elements into groups using adaptive gap threshold."""
-        if not elements:
+    def _split_positioned_groups(self, boxes: List[PositionedBox],
+                                 gap_threshold: Optional[float] = None) -> List[List[PositionedBox]]:
+        """Split positioned boxes into groups using adaptive gap threshold."""
+        if not boxes:
             return []
 
         if gap_threshold is None:
-            line_gaps = self._compute_line_gaps(elements)
+            line_gaps = self._compute_line_gaps(boxes)
             if line_gaps:
                 median_gap = median(line_gaps)
                 gap_threshold = min(1.2 * median_gap, 30.0)
@@ -412,29 +449,25 @@ class Parser:
             else:
                 gap_threshold = 30.0
 
-        element_positions = []
-        for el in elements:
-            y = self._extract_top_px(el)
-            if y is not None:
-                element_positions.append((y, el))
+        positioned = [box for box in boxes if box.y is not None]
 
-        if not element_positions:
-            return [elements]
+        if not positioned:
+            return [boxes]
 
-        element_positions.sort(key=lambda x: x[0])
+        positioned.sort(key=lambda box: box.y)
 
         groups = []
-        current_group = [element_positions[0][1]]
-        last_y = element_positions[0][0]
+        current_group = [positioned[0]]
+        last_y = positioned[0].y
 
-        for y, el in element_positions[1:]:
-            if y - last_y > gap_threshold:
+        for box in positioned[1:]:
+            if box.y - last_y > gap_threshold:
                 if current_group:
                     groups.append(current_group)
-                current_group = [el]
+                current_group = [box]
             else:
-                current_group.append(el)
-            last_y = y
+                current_group.append(box)
+            last_y = box.y
 
         if current_group:
             groups.append(current_group)
@@ -443,65 +476,58 @@ class Parser:
         for group in groups:
             final_groups.extend(self._split_by_column_transition(group))
 
-        logger.debug(f"Split {len(elements)} elements into {len(final_groups)} groups (threshold: {gap_threshold:.1f}px)")
+        logger.debug(f"Split {len(boxes)} elements into {len(final_groups)} groups (threshold: {gap_threshold:.1f}px)")
         return final_groups
 
-    def _split_by_column_transition(self, elements: List[Tag]) -> List[List[Tag]]:
+    def _split_by_column_transition(self, boxes: List[PositionedBox]) -> List[List[PositionedBox]]:
         """Split a group if it transitions from multi-column to single-column."""
-        if len(elements) < 6:
-            return [elements]
+        if len(boxes) < 6:
+            return [boxes]
 
-        element_data = []
-        for el in elements:
-            style = el.get("style", "")
-            left_match = re.search(r'left:\s*(\d+(?:\.\d+)?)px', style)
-            y = self._extract_top_px(el)
-            if left_match and y is not None:
-                element_data.append((float(left_match.group(1)), y, el))
+        element_data = [box for box in boxes if box.left is not None and box.y is not None]
 
         if not element_data:
-            return [elements]
+            return [boxes]
 
-        element_data.sort(key=lambda x: x[1])
+        element_data.sort(key=lambda box: box.y)
 
         rows = []
         current_row = [element_data[0]]
-        last_y = element_data[0][1]
+        last_y = element_data[0].y
 
-        for left, top, el in element_data[1:]:
-            if abs(top - last_y) <= 15:
-                current_row.append((left, top, el))
+        for box in element_data[1:]:
+            if abs(box.y - last_y) <= 15:
+                current_row.append(box)
             else:
                 rows.append(current_row)
-                current_row = [(left, top, el)]
-                last_y = top
+                current_row = [box]
+                last_y = box.y
 
         if current_row:
             rows.append(current_row)
 
-        def count_columns(row):
-            return len(set(left for left, _, _ in row))
+        column_counts = [len(set(box.left for box in row)) for row in rows]
 
         split_point = None
         for i in range(len(rows) - 3):
-            current_cols = count_columns(rows[i])
-            next_cols = count_columns(rows[i + 1])
+            current_cols = column_counts[i]
+            next_cols = column_counts[i + 1]
 
             if current_cols >= 2 and next_cols == 1:
                 following_single = sum(1 for j in range(i + 1, min(i + 4, len(rows)))
-                                       if count_columns(rows[j]) == 1)
+                                       if column_counts[j] == 1)
                 if following_single >= 2:
                     split_point = i + 1
                     logger.debug(f"Column transition at row {i + 1} ({current_cols} cols -> {next_cols} col)")
                     break
 
         if split_point is None:
-            return [elements]
+            return [boxes]
 
-        split_y = rows[split_point][0][1]
+        split_y = rows[split_point][0].y
 
-        group1 = [el for left, top, el in element_data if top < split_y]
-        group2 = [el for left, top, el in element_data if top >= split_y]
+        group1 = [box for box in element_data if box.y < split_y]
+        group2 = [box for box in element_data if box.y >= split_y]
 
         result = []
         if group1:
@@ -509,7 +535,7 @@ class Parser:
         if group2:
             result.append(group2)
 
-        return result if result else [elements]
+        return result if result else [boxes]
 
     def _process_absolutely_positioned_container(self, container: Tag, page_num: int) -> int:
         positioned_children = self._extract_absolutely_positioned_children(container)
@@ -523,8 +549,8 @@ class Parser:
         content_elements = []
 
         for child in positioned_children:
-            if self._is_footer_element(child):
-                display_page = self._extract_page_number_from_footer(child)
+            if self._is_footer_element(child.el):
+                display_page = self._extract_page_number_from_footer(child.el)
                 if display_page is not None:
                     self.footer_page_numbers[page_num] = display_page
                     logger.debug(f"Extracted display_page={display_page} from footer on page {page_num}")
@@ -537,20 +563,24 @@ class Parser:
         groups = self._split_positioned_groups(content_elements)
 
         for i, group in enumerate(groups):
+            for box in group:
+                if box.el.name in XBRL_FACT_TAGS:
+                    self._record_fact(box.el)
+                self._record_facts_in(box.el)
             table_parser = AbsolutelyPositionedTableParser(group)
 
             if table_parser.is_table_like():
                 self.includes_table = True
                 markdown_table = table_parser.to_markdown()
                 if markdown_table:
-                    self._append(page_num, markdown_table, source_node=group[0] if group else None)
+                    self._append(page_num, markdown_table, source_node=group[0].el if group else None)
                     self._blankline_after(page_num)
             else:
                 text = table_parser.to_text()
                 if text:
                     if i > 0:
                         self._blankline_before(page_num)
-                    self._append(page_num, text, source_node=group[0] if group else None)
+                    self._append(page_num, text, source_node=group[0].el if group else None)
 
         return page_num
 
@@ -577,6 +607,9 @@ class Parser:
         if self._is_hidden(root):
             return page_num
 
+        if root.name in XBRL_FACT_TAGS:
+            self._record_fact(root)
+
         if root.name == "img" and self.include_images:
             md = self._img_to_markdown(root)
             if md:
@@ -639,6 +672,20 @@ class Parser:
         if is_block:
             self._blankline_before(page_num)
 
+        if root.name == "table":
+            layout_cell = self._layout_cell(root)
+            if layout_cell is not None:
+                # Layout-only wrapper (e.g. a note in a one-cell table): stream as normal flow
+                current = page_num
+                for child in layout_cell.children:
+                    current = self._stream_pages(child, current)
+                self._blankline_after(current)
+                if self._has_break_after(root):
+                    current += 1
+                self._restore_text_block(text_block_started, text_block_has_continuation,
+                                         continuation_ends_text_block, previous_text_block)
+                return current
+
         if root.name in {"table", "ul", "ol"}:
             t = self._process_element(root)
             if t:
@@ -802,10 +849,27 @@ class Parser:
 
         return "\n".join(lines[idx:])
 
-    def get_pages(self, include_elements: bool = True, include_images: bool = True) -> List[Page]:
+    def get_pages(self, include_elements: bool = True, include_images: bool = True,
+                  shared_text: bool = False, lazy_elements: bool = False) -> List[Page]:
+        """Parse the document into pages.
+
+        Args:
+            include_elements: Build citable Elements and TextBlocks per page.
+            include_images: Render images as markdown image links.
+            shared_text: Store page and element text once in a shared
+                ``TextBuffer``; ``content`` is then sliced on access.
+            lazy_elements: Build each page's elements (and annotate its DOM
+                nodes) only when ``page.elements`` is first read. Call
+                ``materialize_all()`` to build the rest in one go.
+        """
         self.include_images = include_images
         self.pages = defaultdict(list)
         self.page_segments = defaultdict(list)
+        self.pending_facts = []
+        self.deferred_pages = []
+        self.text_block_registry.clear()
+        self._cross_references = None
+        self.block_nodes_map = {}
         self.includes_table = False
         root = self.soup.body if self.soup.body else self.soup
         self._stream_pages(root, page_num=1)
@@ -833,11 +897,62 @@ class Parser:
 
         result = self._detect_display_page_numbers(result)
 
-        if include_elements:
+        if include_elements and lazy_elements:
+            self._defer_elements(result)
+        elif include_elements:
             result = self._add_elements_to_pages(result)
 
+        if shared_text:
+            share_page_text(result)
+
+        self._page_by_number = {page.number: page for page in result}
         return result
 
+    @staticmethod
+    def _direct_rows(table: Tag):
+        """Yield the table's own rows (not rows of nested tables)."""
+        for child in table.children:
+            if not isinstance(child, Tag):
+                continue
+            if child.name == "tr":
+                yield child
+            elif child.name in ROW_GROUP_TAGS:
+                for tr in child.children:
+                    if isinstance(tr, Tag) and tr.name == "tr":
+                        yield tr
+
+    @staticmethod
+    def _has_block_layout(cell: Tag, max_depth: int = 4) -> bool:
+        """True if the cell holds flowing block content (nested table or several blocks)."""
+        el = cell
+        for _ in range(max_depth):
+            tags = [c for c in el.children if isinstance(c, Tag)]
+            blocks = [t for t in tags if t.name in BLOCK_TAGS and t.name not in {"br", "hr"}]
+            if any(b.name == "table" for b in blocks) or len(blocks) >= 2:
+                return True
+            # Descend through a sole wrapper (a div, or an inline ix:nonNumeric around the note)
+            has_text = any(isinstance(c, NavigableString) and c.strip() for c in el.children)
+            if len(tags) != 1 or has_text:
+                return False
+            el = tags[0]
+        return False
+
+    def _layout_cell(self, table: Tag) -> Optional[Tag]:
+        """Return the single content cell of a layout-only table, else None.
+
+        Looks only at the table's own rows and stops at the first row that
+        disqualifies it, so data tables bail out after one row.
+        """
+        layout_cell = None
+        for tr in self._direct_rows(table):
+            cells = tr.find_all(["td", "th"], recursive=False)
+            if layout_cell is None and len(cells) == 1 and self._has_block_layout(cells[0]):
+                layout_cell = cells[0]
+                continue
+            if any(c.get_text(strip=True) or c.find("img") for c in cells):
+                return None
+        return layout_cell
+
     def _effective_rows(self, table: Tag) -> list[list[Tag]]:
         rows = []
         for tr in table.find_all('tr', recursive=True):
@@ -865,17 +980,189 @@ class Parser:
         return " ".join(t for t in texts if t).strip()
 
     def _add_elements_to_pages(self, pages: List[Page]) -> List[Page]:
-        result, block_nodes_map = build_elements_for_pages(pages, self.page_segments)
+        result, self.block_nodes_map, self.block_facts_map = build_elements_for_pages(pages, self.page_segments)
         page_elements = {}
         for page in result:
             if page.elements:
                 page_elements[page.number] = page.elements
-        augment_html_with_ids(page_elements, block_nodes_map)
+        augment_html_with_ids(page_elements, self.block_nodes_map)
+        for page in result:
+            self.text_block_registry.record_elements(page.number, page.text_blocks or [])
+        self.concept_index = build_concept_index(result)
         return result
 
+    def _defer_elements(self, pages: List[Page]) -> None:
+        """Leave element building to each page's first ``elements`` access."""
+        self.block_facts_map = {}
+        self.concept_index = {}
+        self.deferred_pages = pages
+        for page in pages:
+            page._defer_elements(self._materialize_page)
+
+    def _materialize_page(self, page: Page) -> None:
+        elements, text_blocks, block_nodes_map, block_facts_map = build_page_elements(
+            page, self.page_segments.get(page.number, [])
+        )
+        page.elements = elements or None
+        page.text_blocks = text_blocks or None
+        augment_html_with_ids({page.number: elements}, block_nodes_map)
+        self.block_nodes_map.update(block_nodes_map)
+        self.block_facts_map.update(block_facts_map)
+        self.text_block_registry.record_elements(page.number, text_blocks)
+        bind_element_text(page)
+
+    def materialize_all(self) -> List[Page]:
+        """Build elements for every page still deferred by ``get_pages(lazy_elements=True)``."""
+        pages = self.deferred_pages
+        for page in pages:
+            page.materialize()
+        self.deferred_pages = []
+        self.concept_index = build_concept_index(pages)
+        return pages
+
+    def get_text_block(self, name: str) -> Optional[TextBlock]:
+        """A financial note by XBRL TextBlock name, merged across its pages.
+
+        Looks the note up in the registry filled while parsing, so only the
+        note's own pages are read (and, with ``lazy_elements``, materialized).
+        The result is cached.
+
+        Example:
+            >>> debt = parser.get_text_block("us-gaap:DebtDisclosureTextBlock")
+            >>> chunks = chunk_text_block(debt)
+        """
+        if not self._page_by_number:
+            self.get_pages()
+        return self.text_block_registry.get(name, self._page_by_number.get)
+
+    def get_text_block_entry(self, name: str) -> Optional[TextBlockEntry]:
+        """Registry entry of a note with its element IDs and per-page elements.
+
+        ``chunk_text_block`` takes the entry directly, so a note can be
+        chunked without building a merged TextBlock. Only the note's own
+        pages are read (and, with ``lazy_elements``, materialized).
+
+        Example:
+            >>> entry = parser.get_text_block_entry("us-gaap:DebtDisclosureTextBlock")
+            >>> entry.element_ids, entry.source_pages
+            >>> chunks = chunk_text_block(entry)
+        """
+        if not self._page_by_number:
+            self.get_pages()
+        return self.text_block_registry.load(name, self._page_by_number.get)
+
+    def get_cross_references(self) -> CrossReferenceGraph:
+        """Graph of "see Note 7" / "Item 7A" references between elements.
+
+        Built once per parse, on first call; needs every page's elements.
+
+        Example:
+            >>> graph = parser.get_cross_references()
+            >>> graph.neighbors(chunk.elements[0].id)   # elements of the referenced notes/items
+        """
+        if self._cross_references is None:
+            if not self._page_by_number:
+                self.get_pages()
+            if self.deferred_pages:
+                self.materialize_all()
+            text_blocks = [self.get_text_block(name) for name in self.text_block_registry.names()]
+            self._cross_references = CrossReferenceGraph.from_pages(
+                list(self._page_by_number.values()), [tb for tb in text_blocks if tb is not None]
+            )
+        return self._cross_references
+
+    @property
+    def source_map(self) -> SourceMap:
+        """Element ID -> byte ranges of its source nodes in the original HTML.
+
+        Built on first access by lining the DOM up with one scan of the raw
+        HTML; ``to_dict()`` gives a JSON sidecar for a citation viewer.
+        """
+        if not self._page_by_number:
+            self.get_pages()
+        if self._source_map is None or self._source_map.block_nodes is not self.block_nodes_map:
+            raw = self._content if isinstance(self._content, bytes) else None
+            encoding = (self.soup.original_encoding or "utf-8") if raw is not None else "utf-8"
+            try:
+                codecs.lookup(encoding)
+            except LookupError:
+                encoding = "utf-8"
+            if self._source_map is not None:
+                source = self._source_map.source
+            elif raw is not None:
+                source = raw.decode(encoding, errors="replace")
+            else:
+                source = self._content
+            self._source_map = SourceMap(source, self.soup, self.block_nodes_map, raw=raw, encoding=encoding)
+        return self._source_map
+
+    def get_source_fragment(self, element_id: str) -> Optional[str]:
+        """Original HTML of an element's source nodes, sliced from the raw document.
+
+        Unlike ``html()``, nothing is re-serialized. Returns None for unknown
+        IDs or nodes that could not be located in the raw HTML.
+
+        Example:
+            >>> parser.get_source_fragment(chunk.elements[0].id)
+            '<p style="...">Net sales increased 2% ...</p>'
+        """
+        source_map = self.source_map
+        if element_id not in self.block_nodes_map and self.deferred_pages:
+            m = _ELEMENT_PAGE_RE.match(element_id)
+            page = self._page_by_number.get(int(m.group(1))) if m else None
+            if page is not None:
+                page.materialize()
+        return source_map.fragment(element_id)
+
+    def get_elements_for_concept(self, concept: str) -> List[str]:
+        """IDs of elements containing facts tagged with an XBRL concept (e.g. 'us-gaap:Revenues').
+
+        Uses the index built by the last ``get_pages(include_elements=True)`` call.
+        """
+        if self.deferred_pages:
+            self.materialize_all()
+        return self.concept_index.get(concept, [])
+
+    def get_facts(self) -> FactTable:
+        """All iXBRL facts of the filing as a columnar ``FactTable``.
+
+        Facts are linked to the elements built by the last
+        ``get_pages(include_elements=True)`` call; pages are parsed first if
+        that has not happened yet.
+        """
+        if not self.block_facts_map and not self.pages:
+            self.get_pages()
+        if self.deferred_pages:
+            self.materialize_all()
+        element_ids = {
+            id(fact): element_id
+            for element_id, facts in self.block_facts_map.items()
+            for fact in facts
+        }
+        return extract_facts(self.soup, element_ids)
+
     def markdown(self) -> str:
         pages = self.get_pages()
         return "\n\n".join(page.content for page in pages if page.content)
 
     def html(self) -> str:
+        if self.deferred_pages:
+            self.materialize_all()
         return str(self.soup)
+
+    def write_html(self, fp: IO) -> int:
+        """Stream the annotated document (same markup as ``html()``) to ``fp``.
+
+        The document is written in buffered pieces, so the full serialized
+        string is never held in memory.
+
+        Args:
+            fp: Text or binary (UTF-8) file-like object, e.g. an open file or
+                an object-storage upload stream.
+
+        Returns:
+            Number of characters written.
+        """
+        if self.deferred_pages:
+            self.materialize_all()
+        return write_html(self.soup, fp)
@@ -0,0 +1,187 @@
+"""Reverse lookup from quoted text to source elements.
+
+LLM answers quote the filing verbatim or nearly so. ``QuoteIndex`` finds the
+element a quote came from without scanning every page: element text is
+normalized the way ``Chunker._normalize_text`` does (lowercase, whitespace
+collapsed) and further reduced to word tokens, which drops markdown syntax
+(``**``, ``|``, ``#``) and punctuation. Word n-grams ("shingles") point to
+``(element, position)`` postings; a quote's shingles vote for the element
+and alignment they agree on, so small edits or dropped words in the quote
+still find the source. Single words are posted too, so a quote shorter
+than a shingle is answered by finding its words at consecutive positions.
+Postings are packed into ``array('Q')`` and keyed by a stable 64-bit hash,
+so an index can be pickled and loaded in another process.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sec2md.models import Element, Page
+
+_WORD_RE = re.compile(r"[0-9a-z]+(?:[.,'’][0-9a-z]+)*")
+_POS_BITS = 20
+_POS_MASK = (1 << _POS_BITS) - 1
+
+
+def _key(text: str) -> int:
+    """Stable 64-bit key of a word or shingle (``hash()`` is salted per process)."""
+    return int.from_bytes(hashlib.blake2b(text.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+def _contains(postings: array, packed: int) -> bool:
+    """Whether sorted ``postings`` holds ``packed``."""
+    i = bisect_left(postings, packed)
+    return i < len(postings) and postings[i] == packed
+
+
+def tokenize(text: str) -> List[Tuple[str, int, int]]:
+    """Lowercased word tokens of ``text`` with their ``[start, end)`` offsets."""
+    return [(m.group(0), m.start(), m.end()) for m in _WORD_RE.finditer(text.lower())]
+
+
+@dataclass
+class QuoteMatch:
+    """Where a quote was found."""
+    element_id: str
+    source: Optional[str]    # filing key passed to add_pages()/add_elements()
+    score: float             # fraction of the quote's n-grams found in order
+    start: int               # character offsets of the match in element.content
+    end: int
+    element: Element
+
+
+class QuoteIndex:
+    """Word n-gram index over element contents from one or many filings.
+
+    Args:
+        ngram: Words per shingle. Quotes shorter than this are matched
+            word by word against the single-word postings.
+        max_postings: Shingles occurring more often than this (boilerplate
+            such as "of the company") are ignored at query time as long as
+            the quote has rarer ones.
+    """
+
+    def __init__(self, ngram: int = 3, max_postings: int = 2000):
+        if ngram < 1:
+            raise ValueError("ngram must be at least 1")
+        self.ngram = ngram
+        self.max_postings = max_postings
+        self._postings: Dict[int, array] = {}
+        self._elements: List[Element] = []
+        self._sources: List[Optional[str]] = []
+
+    def __len__(self) -> int:
+        return len(self._elements)
+
+    def _shingles(self, words: List[str]) -> Iterable[Tuple[int, int]]:
+        n = self.ngram
+        for pos in range(len(words) - n + 1):
+            yield pos, _key(" ".join(words[pos:pos + n]))
+
+    def _post(self, key: int, packed: int) -> None:
+        postings = self._postings.get(key)
+        if postings is None:
+            postings = self._postings[key] = array("Q")
+        postings.append(packed)
+
+    def add_elements(self, elements: Iterable[Element], source: Optional[str] = None) -> None:
+        """Index ``elements``; ``source`` (e.g. an accession number) tells filings apart."""
+        for element in elements:
+            idx = len(self._elements)
+            self._elements.append(element)
+            self._sources.append(source)
+            words = [w for w, _, _ in tokenize(element.content)]
+            base = idx << _POS_BITS
+            for pos, key in self._shingles(words):
+                self._post(key, base | min(pos, _POS_MASK))
+            if self.ngram > 1:
+                for pos, word in enumerate(words[:_POS_MASK + 1]):
+                    self._post(_key(word), base | pos)
+
+    def add_pages(self, pages: List[Page], source: Optional[str] = None) -> None:
+        self.add_elements((e for page in pages for e in (page.elements or [])), source=source)
+
+    def search(self, quote: str, top_k: int = 3, min_score: float = 0.3) -> List[QuoteMatch]:
+        """Best-matching elements for ``quote``, highest score first.
+
+        Args:
+            quote: Quoted text; markdown, case and whitespace are ignored.
+            top_k: Maximum number of elements returned.
+            min_score: Minimum fraction of the quote's shingles that must line up.
+        """
+        tokens = tokenize(quote)
+        words = [w for w, _, _ in tokens]
+        if not words:
+            return []
+        if len(words) < self.ngram:
+            return self._lookup_short(words, top_k)
+
+        shingles = list(self._shingles(words))
+        postings = [(q, self._postings.get(key, ())) for q, key in shingles]
+        rare = [(q, p) for q, p in postings if p and len(p) <= self.max_postings]
+        votes: Counter = Counter()
+        for q, plist in rare or [(q, p) for q, p in postings if p]:
+            for packed in plist:
+                idx, pos = packed >> _POS_BITS, packed & _POS_MASK
+                votes[(idx, pos - q)] += 1
+
+        best: Dict[int, Tuple[int, int]] = {}
+        for (idx, offset), count in votes.items():
+            if idx not in best or count > best[idx][0]:
+                best[idx] = (count, offset)
+
+        ranked = sorted(best.items(), key=lambda item: (-item[1][0], item[0]))
+        matches = []
+        for idx, (count, offset) in ranked:
+            score = count / len(shingles)
+            if score < min_score or len(matches) >= top_k:
+                break
+            matches.append(self._match(idx, offset, len(words), score))
+        return matches
+
+    def _match(self, idx: int, offset: int, length: int, score: float) -> QuoteMatch:
+        element = self._elements[idx]
+        spans = tokenize(element.content)
+        first = max(0, offset)
+        last = min(len(spans), offset + length) - 1
+        start = spans[first][1] if spans else 0
+        end = spans[max(first, last)][2] if spans else 0
+        return QuoteMatch(
+            element_id=element.id, source=self._sources[idx], score=min(score, 1.0),
+            start=start, end=end, element=element,
+        )
+
+    def _lookup_short(self, words: List[str], top_k: int) -> List[QuoteMatch]:
+        """First verbatim occurrence per element of a quote shorter than one shingle.
+
+        Candidates come from the rarest word's postings; the other words must
+        sit at the neighbouring positions of the same element. Postings are
+        appended in (element, position) order, so membership is a bisect.
+        """
+        postings = [self._postings.get(_key(w)) for w in words]
+        if not all(postings):
+            return []
+        anchor = min(range(len(words)), key=lambda i: len(postings[i]))
+        matches = []
+        last_idx = -1
+        for packed in postings[anchor]:
+            idx, pos = packed >> _POS_BITS, packed & _POS_MASK
+            if idx == last_idx or pos < anchor:
+                continue
+            start = packed - anchor
+            if all(_contains(postings[j], start + j) for j in range(len(words)) if j != anchor):
+                last_idx = idx
+                matches.append(self._match(idx, pos - anchor, len(words), 1.0))
+                if len(matches) >= top_k:
+                    break
+        return matches
+
+    def __repr__(self) -> str:
+        return f"QuoteIndex(elements={len(self)}, shingles={len(self._postings)}, ngram={self.ngram})"
@@ -1,7 +1,12 @@
 from __future__ import annotations
 
 import re
-from typing import List, Optional, Literal, Any
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Iterable, Iterator, List, Optional, Literal, Any, Set, Tuple
+
+from sec2md.text_buffer import PageSpan
 
 LEAD_WRAP = r'(?:\*\*|__)?\s*(?:</?[^>]+>\s*)*'
 
@@ -28,6 +33,12 @@ ITEM_BREADCRUMB_TITLE_RE = re.compile(
     r'^[,\s]*(\d{1,2}[A-Z]?)(\s*,\s*\d{1,2}[A-Z]?)*\s*$',
     re.IGNORECASE
 )
+TABLE_ITEM_ROW_RE = re.compile(r'\|\s*ITEM\s+\d{1,2}[A-Z]?\.?\s*\|', re.IGNORECASE)  # | ITEM X. | TITLE | PAGE |
+TOC_TITLE_RE = re.compile(r'TABLE\s+OF\s+CONTENTS', re.IGNORECASE)
+INLINE_PART_REF_RE = re.compile(r'\bPart\s+[IVXLC]+', re.IGNORECASE)
+# Page-level prefilters: a page without these words can't hold a PART/ITEM header
+_PART_WORD_RE = re.compile(r'PART', re.IGNORECASE)
+_ITEM_WORD_RE = re.compile(r'ITEM', re.IGNORECASE)
 
 FILING_STRUCTURES = {
     "10-K": {
@@ -57,21 +68,187 @@ FILING_STRUCTURES = {
 }
 
 
+@dataclass
+class _PageHeaders:
+    """Cleaned text of one page and its PART/ITEM header candidates.
+
+    Match offsets are positions in ``joined``; ``part_starts`` and
+    ``item_starts`` mirror them for bisecting.
+    """
+    page: Any
+    joined: str
+    parts: List[re.Match] = field(default_factory=list)
+    items: List[re.Match] = field(default_factory=list)
+    part_starts: List[int] = field(default_factory=list)
+    item_starts: List[int] = field(default_factory=list)
+    # Per kept line: start/end in page.content and start/end in ``joined``
+    _lines: Optional[Tuple[List[int], List[int], List[int], List[int]]] = None
+
+    def span(self, start: int, end: int) -> PageSpan:
+        """Span of ``joined[start:end]``, stored as offsets into ``page.content``.
+
+        The raw slice runs from the start of the first line to the end of the
+        last; the cleaned lines are trimmed back to ``[start, end)``.
+        """
+        if self._lines is None:
+            raw_starts = [0]
+            for ln in self.page.content.split('\n'):
+                raw_starts.append(raw_starts[-1] + len(ln) + 1)
+            lines = ([], [], [], [])
+            pos = 0
+            for i, ln in SectionExtractor._iter_clean_lines(self.page.content):
+                for column, value in zip(lines, (raw_starts[i], raw_starts[i + 1] - 1, pos, pos + len(ln))):
+                    column.append(value)
+                pos += len(ln) + 1
+            self._lines = lines
+        raw_starts, raw_ends, clean_starts, clean_ends = self._lines
+        first = bisect_right(clean_starts, start) - 1
+        last = bisect_right(clean_starts, max(start, end - 1)) - 1
+        if clean_ends[last] < end:
+            last += 1
+        return PageSpan(self.page, raw_starts[first], raw_ends[last],
+                        start - clean_starts[first], clean_ends[last] - end,
+                        clean=SectionExtractor._clean_text)
+
+    def rebase(self, origin: int) -> None:
+        """Make the candidates match a fresh scan of the text from ``origin``.
+
+        A candidate starting before ``origin`` can only reach past it through
+        ``LEAD_WRAP``'s ``<...>`` spanning lines; a scan from ``origin`` would
+        find different matches there, so rescan in that (rare) case.
+        """
+        for matches, starts in ((self.parts, self.part_starts), (self.items, self.item_starts)):
+            i = bisect_right(starts, origin - 1)
+            if i and matches[i - 1].end() > origin:
+                break
+        else:
+            return
+        self.parts = list(PART_PATTERN.finditer(self.joined, origin))
+        self.part_starts = [m.start() for m in self.parts]
+        self.items = list(ITEM_PATTERN.finditer(self.joined, origin))
+        self.item_starts = [m.start() for m in self.items]
+
+    def next_part(self, origin: int) -> Optional[re.Match]:
+        """First PART candidate starting after ``origin``."""
+        i = bisect_right(self.part_starts, origin)
+        return self.parts[i] if i < len(self.parts) else None
+
+    def items_after(self, origin: int):
+        """ITEM candidates starting after ``origin``, in order."""
+        for i in range(bisect_right(self.item_starts, origin), len(self.items)):
+            yield self.items[i]
+
+
 class SectionExtractor:
-    def __init__(self, pages: List[Any], filing_type: Optional[Literal["10-K", "10-Q", "20-F", "8-K", "SC 13D", "SC 13G"]] = None,
+    def __init__(self, pages: Iterable[Any], filing_type: Optional[Literal["10-K", "10-Q", "20-F", "8-K", "SC 13D", "SC 13G"]] = None,
                  desired_items: Optional[set] = None, debug: bool = False):
-        """Extract sections from SEC filings."""
+        """Extract sections from SEC filings.
+
+        ``pages`` may be any iterable, e.g. a generator of parsed pages;
+        ``iter_sections`` then reads it one page at a time.
+        """
         self.pages = pages
         self.filing_type = filing_type
         self.structure = FILING_STRUCTURES.get(filing_type) if filing_type else None
         self.desired_items = desired_items
         self.debug = debug
         self._toc_locked = False
+        self._desired = self._normalize_desired_items(desired_items)
+        self._found: Set[Tuple[Optional[str], str]] = set()
 
     def _log(self, msg: str):
         if self.debug:
             print(msg)
 
+    def _normalize_desired_items(self, desired_items: Optional[Iterable[Any]]) -> Optional[Set[Tuple[Optional[str], str]]]:
+        """Desired items as ``(part, "ITEM X")`` keys; part is None when any part will do.
+
+        Accepts item enums (Item10K.RISK_FACTORS, Item8K.RESULTS_OF_OPERATIONS)
+        and strings ("ITEM 1A", "1A", "2.02").
+        """
+        if not desired_items:
+            return None
+        from sec2md.models import (
+            Item10K, Item10Q, Item13D, Item13G,
+            ITEM_10K_MAPPING, ITEM_10Q_MAPPING, ITEM_13D_MAPPING, ITEM_13G_MAPPING,
+        )
+
+        keys = set()
+        for item in desired_items:
+            if isinstance(item, Item10K):
+                keys.add(ITEM_10K_MAPPING[item])
+            elif isinstance(item, Item10Q):
+                keys.add(ITEM_10Q_MAPPING[item])
+            elif isinstance(item, Item13D):
+                keys.add(ITEM_13D_MAPPING[item])
+            elif isinstance(item, Item13G):
+                keys.add(ITEM_13G_MAPPING[item])
+            else:
+                code = item.value if isinstance(item, Enum) else str(item)
+                code = re.sub(r'^ITEM\s*', '', code.upper().strip())
+                if self.filing_type == "8-K":
+                    code = self._normalize_8k_item_code(code)
+                item_key = f"ITEM {code}"
+                # An item number repeated across parts (10-Q ITEM 2) stands for every
+                # one of them, so each must close before the scan may stop
+                parts = [p for p, items in (self.structure or {}).items() if item_key in items]
+                if len(parts) > 1:
+                    keys.update((p, item_key) for p in parts)
+                else:
+                    keys.add((None, item_key))
+        return keys
+
+    def _wants(self, part: Optional[str], item: Optional[str]) -> bool:
+        """Whether a section with this (final) part and item was asked for."""
+        if self._desired is None:
+            return True
+        return item is not None and any(i == item and p in (None, part) for p, i in self._desired)
+
+    def _mark_found(self, part: Optional[str], item: Optional[str]) -> None:
+        if self._desired is not None:
+            self._found.update(k for k in self._desired if k[1] == item and k[0] in (None, part))
+
+    def _all_found(self) -> bool:
+        """True once every desired item has a complete (closed) section."""
+        return self._desired is not None and len(self._found) == len(self._desired)
+
+    def _validate_section(self, section: Any) -> Optional[Any]:
+        """Drop PART stubs and sections outside the filing structure; fix up inferred parts."""
+        if section.item is None and sum(len(text.strip()) for text in section._page_texts()) <= 80:
+            self._log(f"DEBUG: Dropped empty PART stub - Part: {section.part}")
+            return None
+        if not self.structure:
+            return section
+
+        part = section.part
+        item = section.item
+        # If part is missing or inconsistent with canonical mapping, try to infer it from the item.
+        if item and self.filing_type:
+            inferred = self._infer_part_for_item(self.filing_type, item)
+            if inferred and inferred != part:
+                self._log(f"DEBUG: Rewriting part from {part} to {inferred} for {item}")
+                section.part = inferred
+                part = inferred
+
+        if (part in self.structure) and (item is None or item in self.structure.get(part, [])):
+            return section
+        self._log(f"DEBUG: Dropped section - Part: {part}, Item: {item}")
+        return None
+
+    @staticmethod
+    def _strip(text: str, start: int, end: int) -> Tuple[int, int]:
+        """Offsets of ``text[start:end].strip()``."""
+        while start < end and text[start].isspace():
+            start += 1
+        while end > start and text[end - 1].isspace():
+            end -= 1
+        return start, end
+
+    @staticmethod
+    def _span(page: Any, text: str, start: int, end: int) -> PageSpan:
+        """Span of ``text[start:end].strip()`` on ``page``; ``text`` is a prefix of its content."""
+        return PageSpan(page, *SectionExtractor._strip(text, start, end))
+
     @staticmethod
     def _normalize_section_key(part: Optional[str], item_num: Optional[str]) -> tuple[Optional[str], Optional[str]]:
         part_key = re.sub(r'\s+', ' ', part.upper().strip()) if part else None
@@ -82,11 +259,20 @@ class SectionExtractor:
     def _normalize_section(text: str) -> str:
         return re.sub(r'\s+', ' ', text.upper().strip())
 
-    def _clean_lines(self, content: str) -> List[str]:
+    @staticmethod
+    def _clean_lines(content: str) -> List[str]:
         """Remove headers, footers, and page navigation."""
+        return [ln for _, ln in SectionExtractor._iter_clean_lines(content)]
+
+    @staticmethod
+    def _clean_text(content: str) -> str:
+        """``content`` with headers, footers and page navigation removed."""
+        return "\n".join(SectionExtractor._clean_lines(content))
+
+    @staticmethod
+    def _iter_clean_lines(content: str) -> Iterator[Tuple[int, str]]:
+        """``(line number in content, cleaned line)`` for each line ``_clean_lines`` keeps."""
         content = content.replace(NBSP, ' ').replace(NARROW_NBSP, ' ').replace(ZWSP, '')
-        lines = [ln.rstrip() for ln in content.split('\n')]
-        content_str = '\n'.join(lines)
 
         # TODO: Breadcrumb removal - some filings have "PART II\n\nItem 7" on every page
         # as navigation breadcrumbs, but removing them here breaks section detection for
@@ -109,15 +295,24 @@ class SectionExtractor:
         #     filtered_lines.append(line)
         # content_str = '\n'.join(filtered_lines)
 
-        lines = content_str.split('\n')
-
-        out = []
-        for ln in lines:
-            if HEADER_FOOTER_RE.match(ln) or PAGE_NUM_RE.match(ln):
+        for i, ln in enumerate(content.split('\n')):
+            ln = ln.rstrip()
+            # Cheap substring checks first; the regexes only run on lines that could match
+            if ('|' in ln and 'Form' in ln and HEADER_FOOTER_RE.match(ln)) or PAGE_NUM_RE.match(ln):
                 continue
-            ln = MD_EDGE.sub('', ln)
-            out.append(ln)
-        return out
+            if '*' in ln or '_' in ln:
+                ln = MD_EDGE.sub('', ln)
+            yield i, ln
+
+    def page_text(self, page: Any) -> str:
+        """Text section headers are searched in on ``page``.
+
+        8-K and 13D/G headers are found in the page content itself; 10-K/10-Q
+        pages are cleaned first (their spans map back with ``_PageHeaders.span``).
+        """
+        if self.filing_type in ("8-K", "SC 13D", "SC 13G"):
+            return page.content
+        return self._clean_text(page.content)
 
     def _infer_part_for_item(self, filing_type: str, item_key: str) -> Optional[str]:
         """Infer PART from ITEM number (10-K only)."""
@@ -155,14 +350,12 @@ class SectionExtractor:
 
         # Check for table-based TOCs (modern filings)
         # Look for markdown tables with ITEM entries and page numbers
-        # Pattern: | ITEM X. | TITLE | PAGE |
-        table_item_pattern = re.compile(r'\|\s*ITEM\s+\d{1,2}[A-Z]?\.?\s*\|', re.IGNORECASE)
-        table_item_hits = len(table_item_pattern.findall(content))
+        table_item_hits = len(TABLE_ITEM_ROW_RE.findall(content))
         if table_item_hits >= 3:
             return True
 
         # Also check for "TABLE OF CONTENTS" header
-        if re.search(r'TABLE\s+OF\s+CONTENTS', content, re.IGNORECASE) and table_item_hits >= 2:
+        if table_item_hits >= 2 and TOC_TITLE_RE.search(content):
             return True
 
         return False
@@ -178,12 +371,24 @@ class SectionExtractor:
         r'<tr[^>]*>\s*<t[dh][^>]*>\s*([^<]+?)\s*</t[dh]>\s*<t[dh][^>]*>\s*([^<]+?)\s*</t[dh]>\s*</tr>',
         re.IGNORECASE | re.DOTALL
     )
+    _HEADER_FOOTER_8K_RE = re.compile(
+        r'^\s*(Form\s+8\-K|Page\s+\d+(?:\s+of\s+\d+)?|UNITED\s+STATES\s+SECURITIES\s+AND\s+EXCHANGE\s+COMMISSION)\b',
+        re.IGNORECASE
+    )
+    _TABLE_RULE_RE = re.compile(r'\|\s*-{3,}\s*\|\s*-{3,}\s*\|?')
+    _ITEM_CODE_8K_RE = re.compile(r'^([1-9])\.(\d{1,2})([A-Z]?)$')
+    _TOC_8K_RE = re.compile(r'TABLE OF CONTENTS', re.IGNORECASE)
+    _ITEM_PAGE_ROW_8K_RE = re.compile(r'ITEM\s+[1-9]\.\d{2}.*?\|\s*\d+\s*\|', re.IGNORECASE)
+    _PURSUANT_RE = re.compile(r'Pursuant to the requirements', re.IGNORECASE)
+    _EXHIBITS_HEADING_RE = re.compile(r'^\s*\(?d\)?\s*Exhibits\b.*$', re.IGNORECASE | re.MULTILINE)
+    _HARD_STOP_13D_RE = re.compile(r'^\s*(?:\*\*|__)?\s*SIGNATURE', re.IGNORECASE | re.MULTILINE)
+    _SUB_ITEM_RE = re.compile(r'^\([a-z]\)')
 
     @staticmethod
     def _normalize_8k_item_code(code: str) -> str:
         """Normalize '5.2' -> '5.02', keep suffix 'A' if present."""
         code = code.upper().strip()
-        m = re.match(r'^([1-9])\.(\d{1,2})([A-Z]?)$', code)
+        m = SectionExtractor._ITEM_CODE_8K_RE.match(code)
         if not m:
             return code
         major, minor, suffix = m.groups()
@@ -195,18 +400,13 @@ class SectionExtractor:
         text = text.replace(NBSP, " ").replace(NARROW_NBSP, " ").replace(ZWSP, "")
         text = self._PROMOTE_ITEM_8K_RE.sub(r'\n\2', text)
 
-        header_footer_8k = re.compile(
-            r'^\s*(Form\s+8\-K|Page\s+\d+(?:\s+of\s+\d+)?|UNITED\s+STATES\s+SECURITIES\s+AND\s+EXCHANGE\s+COMMISSION)\b',
-            re.IGNORECASE
-        )
-
         lines: List[str] = []
         for ln in text.splitlines():
             t = ln.strip()
-            if header_footer_8k.match(t):
+            if self._HEADER_FOOTER_8K_RE.match(t):
                 continue
             t = MD_EDGE.sub("", t)
-            if re.fullmatch(r'\|\s*-{3,}\s*\|\s*-{3,}\s*\|?', t):
+            if self._TABLE_RULE_RE.fullmatch(t):
                 continue
             lines.append(t)
 
@@ -258,135 +458,133 @@ class SectionExtractor:
         end = mstop.start() if mstop else next_item_start
         return doc[start_after:end].strip()
 
+    @staticmethod
+    def _item_headers(pattern: re.Pattern, content: str):
+        """ITEM header candidates in ``content``; skips the regex when the word is absent."""
+        if not _ITEM_WORD_RE.search(content):
+            return iter(())
+        return pattern.finditer(content)
+
+    @staticmethod
+    def _line_of(content: str, m: re.Match) -> str:
+        """Full (stripped) line(s) a match sits on."""
+        line_start = content.rfind('\n', 0, m.start()) + 1
+        line_end = content.find('\n', m.end())
+        if line_end == -1:
+            line_end = len(content)
+        return content[line_start:line_end].strip()
+
+    def _in_table_row(self, content: str, m: re.Match) -> bool:
+        return '|' in self._line_of(content, m)
+
     def _is_8k_boilerplate_page(self, page_content: str, page_num: int) -> bool:
         """Detect cover, TOC, and signature pages."""
         if page_num == 1:
             return True
 
-        if re.search(r'TABLE OF CONTENTS', page_content, re.IGNORECASE):
+        if self._TOC_8K_RE.search(page_content):
             return True
 
-        item_with_page_count = len(re.findall(r'ITEM\s+[1-9]\.\d{2}.*?\|\s*\d+\s*\|', page_content, re.IGNORECASE))
-        if item_with_page_count >= 2:
+        if '|' in page_content and len(self._ITEM_PAGE_ROW_8K_RE.findall(page_content)) >= 2:
             return True
 
-        if re.search(r'\*\*SIGNATURES\*\*', page_content) and \
-           re.search(r'Pursuant to the requirements', page_content, re.IGNORECASE):
+        if '**SIGNATURES**' in page_content and self._PURSUANT_RE.search(page_content):
             return True
 
         return False
 
-    def _get_8k_sections(self) -> List[Any]:
-        """Extract 8-K sections."""
-        from sec2md.models import Section, Page, ITEM_8K_TITLES
+    def _iter_8k_sections(self) -> Iterator[Any]:
+        """Extract 8-K sections, yielding each once the next item header closes it."""
+        from sec2md.models import Section, ITEM_8K_TITLES
 
-        sections = []
+        ready = []
+        emitted = 0
         current_item = None
         current_item_title = None
-        current_pages: List[Page] = []
+        current_pages: List[PageSpan] = []
 
         def flush_section():
-            nonlocal sections, current_item, current_item_title, current_pages
+            nonlocal current_item, current_item_title, current_pages
             if current_pages and current_item:
                 exhibits = None
                 if current_item.startswith("ITEM 9.01"):
-                    content = "\n".join(p.content for p in current_pages)
-                    md = re.search(r'^\s*\(?d\)?\s*Exhibits\b.*$', content, re.IGNORECASE | re.MULTILINE)
+                    content = "\n".join(span.content for span in current_pages)
+                    md = self._EXHIBITS_HEADING_RE.search(content)
                     ex_block = content[md.end():].strip() if md else content
                     parsed_exhibits = self._parse_exhibits(ex_block)
                     exhibits = parsed_exhibits if parsed_exhibits else None
 
-                sections.append(Section(
+                ready.append(Section.from_spans(
+                    current_pages,
                     part=None,
                     item=current_item,
                     item_title=current_item_title,
-                    pages=current_pages,
                     exhibits=exhibits
                 ))
+                self._mark_found(None, current_item)
                 current_pages = []
 
         for page in self.pages:
+            if self._all_found() and current_item is None:
+                self._log("DEBUG: All desired items found, stopping")
+                break
             page_num = page.number
-            remaining_content = page.content
+            content = page.content
 
-            if self._is_8k_boilerplate_page(remaining_content, page_num):
+            if self._is_8k_boilerplate_page(content, page_num):
                 self._log(f"DEBUG: Page {page_num} is boilerplate, skipping")
                 continue
 
-            while remaining_content:
-                item_m = None
-                first_idx = None
-
-                for m in self._ITEM_8K_RE.finditer(remaining_content):
-                    line_start = remaining_content.rfind('\n', 0, m.start()) + 1
-                    line_end = remaining_content.find('\n', m.end())
-                    if line_end == -1:
-                        line_end = len(remaining_content)
-                    full_line = remaining_content[line_start:line_end].strip()
-
-                    if '|' in full_line:
-                        self._log(f"DEBUG: Page {page_num} skipping table row: {full_line[:60]}")
-                        continue
-
-                    code = self._normalize_8k_item_code(m.group(2))
-                    title_inline = (m.group(3) or "").strip()
-                    title_inline = MD_EDGE.sub("", title_inline)
-
-                    item_m = m
-                    first_idx = m.start()
-                    self._log(f"DEBUG: Page {page_num} found ITEM {code} at position {first_idx}")
-                    break
-
-                if first_idx is None:
-                    if current_item and remaining_content.strip():
-                        current_pages.append(Page(
-                            number=page_num,
-                            content=remaining_content,
-                            elements=page.elements,
-                            text_blocks=page.text_blocks,
-                            display_page=page.display_page
-                        ))
-                    break
+            # One forward scan: each header closes the previous item and opens the next
+            origin = None
+            for m in self._item_headers(self._ITEM_8K_RE, content):
+                if self._in_table_row(content, m):
+                    self._log(f"DEBUG: Page {page_num} skipping table row: {self._line_of(content, m)[:60]}")
+                    continue
 
-                before = remaining_content[:first_idx].strip()
-                # Use header end position to skip past header and avoid infinite loop
-                header_end = item_m.end()
-                after = remaining_content[header_end:].strip()
+                code = self._normalize_8k_item_code(m.group(2))
+                self._log(f"DEBUG: Page {page_num} found ITEM {code} at position {m.start()}")
 
-                if current_item and before:
-                    current_pages.append(Page(
-                        number=page_num,
-                        content=before,
-                        elements=page.elements,
-                        text_blocks=page.text_blocks,
-                        display_page=page.display_page
-                    ))
+                before = self._span(page, content, origin or 0, m.start())
+                if current_item and before.content:
+                    current_pages.append(before)
 
                 flush_section()
 
-                code = self._normalize_8k_item_code(item_m.group(2))
-                title_inline = (item_m.group(3) or "").strip()
+                title_inline = (m.group(3) or "").strip()
                 title_inline = MD_EDGE.sub("", title_inline)
                 current_item = f"ITEM {code}"
                 current_item_title = title_inline if title_inline else ITEM_8K_TITLES.get(code)
 
-                if self.desired_items and code not in self.desired_items:
+                if not self._wants(None, current_item):
                     self._log(f"DEBUG: Skipping ITEM {code} (not in desired_items)")
                     current_item = None
                     current_item_title = None
-                    remaining_content = after
-                    continue
 
-                remaining_content = after
+                # Continue after the header line
+                origin = m.end()
+
+            if origin is None:
+                rest = PageSpan(page, 0, len(content))
+            else:
+                rest = self._span(page, content, origin, len(content))
+            if current_item and rest.content.strip():
+                current_pages.append(rest)
+
+            # Hand over sections closed on this page before reading the next one
+            emitted += len(ready)
+            yield from ready
+            ready.clear()
 
         flush_section()
+        emitted += len(ready)
+        yield from ready
 
-        self._log(f"DEBUG: Total sections extracted: {len(sections)}")
-        return sections
+        self._log(f"DEBUG: Total sections extracted: {emitted}")
 
-    def _get_13d_sections(self) -> List[Any]:
-        """Extract SC 13D / SC 13G sections."""
-        from sec2md.models import Section, Page, ITEM_13D_TITLES, ITEM_13G_TITLES
+    def _iter_13d_sections(self) -> Iterator[Any]:
+        """Extract SC 13D / SC 13G sections, yielding each once the next item header closes it."""
+        from sec2md.models import Section, ITEM_13D_TITLES, ITEM_13G_TITLES
 
         if self.filing_type == "SC 13G":
             _VALID_ITEMS = {str(i) for i in range(1, 11)}
@@ -395,158 +593,144 @@ class SectionExtractor:
             _VALID_ITEMS = {str(i) for i in range(1, 8)}
             _TITLES = ITEM_13D_TITLES
 
-        _HARD_STOP_RE = re.compile(
-            r'^\s*(?:\*\*|__)?\s*SIGNATURE', re.IGNORECASE | re.MULTILINE
-        )
-
-        sections = []
+        ready = []
+        emitted = 0
         current_item = None
         current_item_title = None
-        current_pages: List[Page] = []
+        current_pages: List[PageSpan] = []
 
         def flush_section():
-            nonlocal sections, current_item, current_item_title, current_pages
+            nonlocal current_item, current_item_title, current_pages
             if current_pages and current_item:
-                sections.append(Section(
+                ready.append(Section.from_spans(
+                    current_pages,
                     part=None,
                     item=current_item,
-                    item_title=current_item_title,
-                    pages=current_pages
+                    item_title=current_item_title
                 ))
+                self._mark_found(None, current_item)
                 current_pages = []
 
         for page in self.pages:
+            if self._all_found() and current_item is None:
+                self._log("DEBUG: All desired items found, stopping")
+                break
             page_num = page.number
-            remaining_content = page.content
+            content = page.content
 
-            # Truncate content at SIGNATURE
-            hard_stop = _HARD_STOP_RE.search(remaining_content)
+            # Truncate content at SIGNATURE; trimmed without re-basing, so
+            # offsets stay valid in page.content
+            hard_stop = self._HARD_STOP_13D_RE.search(content)
             last_page = False
+            lo = 0
             if hard_stop:
-                remaining_content = remaining_content[:hard_stop.start()].strip()
+                content = content[:hard_stop.start()].rstrip()
+                lo = len(content) - len(content.lstrip())
                 last_page = True
-                if not remaining_content:
+                if lo == len(content):
                     flush_section()
                     break
 
-            while remaining_content:
-                item_m = None
-                first_idx = None
-
-                for m in ITEM_PATTERN.finditer(remaining_content):
-                    # Skip table rows
-                    line_start = remaining_content.rfind('\n', 0, m.start()) + 1
-                    line_end = remaining_content.find('\n', m.end())
-                    if line_end == -1:
-                        line_end = len(remaining_content)
-                    full_line = remaining_content[line_start:line_end].strip()
+            origin = None
+            for m in self._item_headers(ITEM_PATTERN, content):
+                # Skip table rows
+                if self._in_table_row(content, m):
+                    self._log(f"DEBUG: Page {page_num} skipping table row: {self._line_of(content, m)[:60]}")
+                    continue
 
-                    if '|' in full_line:
-                        self._log(f"DEBUG: Page {page_num} skipping table row: {full_line[:60]}")
-                        continue
+                item_num = m.group(2).upper()
+                if item_num not in _VALID_ITEMS:
+                    self._log(f"DEBUG: Page {page_num} skipping non-13D item: {item_num}")
+                    continue
 
-                    item_num = m.group(2).upper()
-                    if item_num not in _VALID_ITEMS:
-                        self._log(f"DEBUG: Page {page_num} skipping non-13D item: {item_num}")
+                # Skip sub-items like Item 1(a), Item 2(b) — treat as content
+                title_inline = (m.group(3) or "").strip()
+                title_inline = MD_EDGE.sub("", title_inline)
+                if self._SUB_ITEM_RE.match(title_inline):
+                    # If same item number as current, treat as continuation
+                    if current_item == f"ITEM {item_num}":
+                        self._log(f"DEBUG: Page {page_num} skipping sub-item {item_num}({title_inline[:3]})")
                         continue
+                    # If different item, this is the first sub-item of a new item
+                    self._log(f"DEBUG: Page {page_num} found ITEM {item_num} (via sub-item)")
 
-                    # Skip sub-items like Item 1(a), Item 2(b) — treat as content
-                    title_check = (m.group(3) or "").strip()
-                    title_check = MD_EDGE.sub("", title_check)
-                    if re.match(r'^\([a-z]\)', title_check):
-                        # If same item number as current, treat as continuation
-                        if current_item == f"ITEM {item_num}":
-                            self._log(f"DEBUG: Page {page_num} skipping sub-item {item_num}({title_check[:3]})")
-                            continue
-                        # If different item, this is the first sub-item of a new item
-                        self._log(f"DEBUG: Page {page_num} found ITEM {item_num} (via sub-item)")
-
-                    item_m = m
-                    first_idx = m.start()
-                    self._log(f"DEBUG: Page {page_num} found ITEM {item_num} at position {first_idx}")
-                    break
-
-                if first_idx is None:
-                    if current_item and remaining_content.strip():
-                        current_pages.append(Page(
-                            number=page_num,
-                            content=remaining_content,
-                            elements=page.elements,
-                            text_blocks=page.text_blocks,
-                            display_page=page.display_page
-                        ))
-                    break
-
-                before = remaining_content[:first_idx].strip()
-                header_end = item_m.end()
-                after = remaining_content[header_end:].strip()
+                self._log(f"DEBUG: Page {page_num} found ITEM {item_num} at position {m.start()}")
 
-                if current_item and before:
-                    current_pages.append(Page(
-                        number=page_num,
-                        content=before,
-                        elements=page.elements,
-                        text_blocks=page.text_blocks,
-                        display_page=page.display_page
-                    ))
+                before = self._span(page, content, origin or 0, m.start())
+                if current_item and before.content:
+                    current_pages.append(before)
 
                 flush_section()
 
-                item_num = item_m.group(2).upper()
-                title_inline = (item_m.group(3) or "").strip()
-                title_inline = MD_EDGE.sub("", title_inline)
                 current_item = f"ITEM {item_num}"
                 current_item_title = title_inline if title_inline else _TITLES.get(item_num)
 
-                if self.desired_items and item_num not in self.desired_items:
+                if not self._wants(None, current_item):
                     self._log(f"DEBUG: Skipping ITEM {item_num} (not in desired_items)")
                     current_item = None
                     current_item_title = None
-                    remaining_content = after
-                    continue
 
-                remaining_content = after
+                origin = m.end()
+
+            if origin is None:
+                rest = PageSpan(page, lo, len(content))
+            else:
+                rest = self._span(page, content, origin, len(content))
+            if current_item and rest.content.strip():
+                current_pages.append(rest)
 
             if last_page:
                 flush_section()
                 break
 
+            # Hand over sections closed on this page before reading the next one
+            emitted += len(ready)
+            yield from ready
+            ready.clear()
+
         flush_section()
+        emitted += len(ready)
+        yield from ready
 
-        self._log(f"DEBUG: Total 13D sections extracted: {len(sections)}")
-        return sections
+        self._log(f"DEBUG: Total 13D sections extracted: {emitted}")
 
     def get_sections(self) -> List[Any]:
-        """Get sections from the filing."""
+        """Get sections from the filing.
+
+        With ``desired_items``, only those sections are returned and pages
+        are scanned only until each of them has been closed by the next
+        header.
+        """
+        return list(self.iter_sections())
+
+    def iter_sections(self) -> Iterator[Any]:
+        """Yield sections in document order as soon as each is complete.
+
+        A section is complete when the next PART/ITEM header closes it (or the
+        pages run out), so with a page generator the first sections can be
+        processed while later pages are still being produced. Pages are read
+        one at a time and only up to the page that closes the last section
+        yielded.
+        """
+        self._found = set()
         if self.filing_type == "8-K":
-            return self._get_8k_sections()
+            return self._iter_8k_sections()
         elif self.filing_type in ("SC 13D", "SC 13G"):
-            return self._get_13d_sections()
+            return self._iter_13d_sections()
         else:
-            return self._get_standard_sections()
-
-    def _get_standard_sections(self) -> List[Any]:
-        """Extract 10-K/10-Q/20-F sections."""
-        from sec2md.models import Section, Page
-
-        sections = []
-        current_part = None
-        current_item = None
-        current_item_title = None
-        current_pages: List[Page] = []
+            return self._iter_standard_sections()
 
-        def flush_section():
-            nonlocal sections, current_part, current_item, current_item_title, current_pages
-            if current_pages:
-                sections.append(Section(
-                    part=current_part,
-                    item=current_item,
-                    item_title=current_item_title,
-                    pages=current_pages
-                ))
-                current_pages = []
+    def _iter_page_headers(self) -> Iterator[_PageHeaders]:
+        """Cleaned pages with their PART/ITEM header candidates, in order.
 
+        TOC and empty pages are dropped. Pages without the words PART/ITEM
+        skip the header regexes entirely. Stops (before cleaning the next
+        page) once every desired item has been found.
+        """
         for page in self.pages:
+            if self._all_found():
+                self._log("DEBUG: All desired items found, stopping")
+                return
             page_num = page.number
             content = page.content
 
@@ -554,77 +738,100 @@ class SectionExtractor:
                 self._log(f"DEBUG: Page {page_num} detected as TOC, skipping")
                 continue
 
-            lines = self._clean_lines(content)
-            joined = "\n".join(lines)
+            joined = self.page_text(page)
 
             if not joined.strip():
                 self._log(f"DEBUG: Page {page_num} is empty after cleaning")
                 continue
 
-            part_m = None
-            item_m = None
-            first_idx = None
-            first_kind = None
+            entry = _PageHeaders(page=page, joined=joined)
+            if _PART_WORD_RE.search(joined):
+                entry.parts = list(PART_PATTERN.finditer(joined))
+                entry.part_starts = [m.start() for m in entry.parts]
+            if _ITEM_WORD_RE.search(joined):
+                entry.items = list(ITEM_PATTERN.finditer(joined))
+                entry.item_starts = [m.start() for m in entry.items]
+            yield entry
 
-            for m in PART_PATTERN.finditer(joined):
-                part_m = m
-                first_idx = m.start()
-                first_kind = 'part'
-                self._log(f"DEBUG: Page {page_num} found PART at position {first_idx}: {m.group(1)}")
-                break
+    @staticmethod
+    def _is_breadcrumb_item(m: re.Match) -> bool:
+        title = (m.group(3) or "").strip()
+        return not title or bool(ITEM_BREADCRUMB_TITLE_RE.match(title))
 
-            for m in ITEM_PATTERN.finditer(joined):
-                if first_idx is None or m.start() < first_idx:
-                    context_start = max(0, m.start() - 30)
-                    context = joined[context_start:m.start()]
-                    if re.search(r'\bPart\s+[IVXLC]+', context, re.IGNORECASE):
-                        self._log(f"DEBUG: Page {page_num} skipping inline reference at {m.start()}")
-                        continue
+    def _iter_standard_sections(self) -> Iterator[Any]:
+        """Extract 10-K/10-Q/20-F sections, yielding each once the next header closes it."""
+        from sec2md.models import Section
 
-                    title = (m.group(3) or "").strip()
-                    if not title or ITEM_BREADCRUMB_TITLE_RE.match(title):
-                        self._log(f"DEBUG: Page {page_num} skipping breadcrumb ITEM {m.group(2)} with title '{title}'")
-                        continue
+        ready = []
+        emitted = 0
+        current_part = None
+        current_item = None
+        current_item_title = None
+        current_pages: List[PageSpan] = []
+
+        def flush_section():
+            nonlocal current_pages
+            if current_pages:
+                self._log(f"DEBUG: Closed section - Part: {current_part}, Item: {current_item}, "
+                          f"Pages: {len(current_pages)}, Start: {current_pages[0].page.number}")
+                section = self._validate_section(Section.from_spans(
+                    current_pages,
+                    part=current_part,
+                    item=current_item,
+                    item_title=current_item_title
+                ))
+                if section is not None and self._wants(section.part, section.item):
+                    self._mark_found(section.part, section.item)
+                    ready.append(section)
+                current_pages = []
 
-                    item_m = m
-                    first_idx = m.start()
-                    first_kind = 'item'
-                    self._log(f"DEBUG: Page {page_num} found ITEM at position {first_idx}: ITEM {m.group(2)}")
+        for entry in self._iter_page_headers():
+            page = entry.page
+            page_num = page.number
+            joined = entry.joined
+
+            part_m = entry.parts[0] if entry.parts else None
+            item_m = None
+            first_idx = part_m.start() if part_m else None
+            first_kind = 'part' if part_m else None
+            if part_m:
+                self._log(f"DEBUG: Page {page_num} found PART at position {first_idx}: {part_m.group(1)}")
+
+            for m in entry.items:
+                if first_idx is not None and m.start() >= first_idx:
+                    break
+                context = joined[max(0, m.start() - 30):m.start()]
+                if INLINE_PART_REF_RE.search(context):
+                    self._log(f"DEBUG: Page {page_num} skipping inline reference at {m.start()}")
+                    continue
+                if self._is_breadcrumb_item(m):
+                    self._log(f"DEBUG: Page {page_num} skipping breadcrumb ITEM {m.group(2)} with title '{(m.group(3) or '').strip()}'")
+                    continue
+                item_m = m
+                first_idx = m.start()
+                first_kind = 'item'
+                self._log(f"DEBUG: Page {page_num} found ITEM at position {first_idx}: ITEM {m.group(2)}")
                 break
 
             if first_kind is None:
                 self._log(f"DEBUG: Page {page_num} - no header found. In section: {current_part or current_item}")
                 if current_part or current_item:
-                    if joined.strip():
-                        current_pages.append(Page(
-                            number=page_num,
-                            content=joined,
-                            elements=page.elements,
-                            text_blocks=page.text_blocks,
-                            display_page=page.display_page
-                        ))
+                    current_pages.append(entry.span(0, len(joined)))
                 continue
 
-            before = joined[:first_idx].strip()
-            after = joined[first_idx:].strip()
+            before = self._strip(joined, 0, first_idx)
+            after = entry.span(*self._strip(joined, first_idx, len(joined)))
 
-            if (current_part or current_item) and before:
-                current_pages.append(Page(
-                    number=page_num,
-                    content=before,
-                    elements=page.elements,
-                    text_blocks=page.text_blocks,
-                    display_page=page.display_page
-                ))
+            if (current_part or current_item) and before[0] < before[1]:
+                current_pages.append(entry.span(*before))
 
             flush_section()
 
-            if first_kind == 'part' and part_m:
-                part_text = part_m.group(1)
-                current_part, _ = self._normalize_section_key(part_text, None)
+            if first_kind == 'part':
+                current_part, _ = self._normalize_section_key(part_m.group(1), None)
                 current_item = None
                 current_item_title = None
-            elif first_kind == 'item' and item_m:
+            else:
                 item_num = item_m.group(2)
                 title = (item_m.group(3) or "").strip()
                 current_item_title = self._clean_item_title(title) if title else None
@@ -635,139 +842,80 @@ class SectionExtractor:
                         self._log(f"DEBUG: Inferred {inferred} at detection time for ITEM {item_num}")
                 _, current_item = self._normalize_section_key(current_part, item_num)
 
-            if after:
-                current_pages.append(Page(
-                    number=page_num,
-                    content=after,
-                    elements=page.elements,
-                    text_blocks=page.text_blocks,
-                    display_page=page.display_page
-                ))
+            current_pages.append(after)
+            origin = first_idx
 
-                if first_kind == 'part' and part_m:
-                    item_after = None
-                    for m in ITEM_PATTERN.finditer(after):
-                        title_after = (m.group(3) or "").strip()
-                        if not title_after or ITEM_BREADCRUMB_TITLE_RE.match(title_after):
-                            self._log(f"DEBUG: Page {page_num} skipping breadcrumb ITEM {m.group(2)} after PART with title '{title_after}'")
-                            continue
-                        item_after = m
-                        break
-                    if item_after:
-                        start = item_after.start()
-                        after = after[start:]
-                        current_pages[-1] = Page(
-                            number=page_num,
-                            content=after,
-                            elements=page.elements,
-                            text_blocks=page.text_blocks,
-                            display_page=page.display_page
-                        )
-                        item_num = item_after.group(2)
-                        title = (item_after.group(3) or "").strip()
-                        current_item_title = self._clean_item_title(title) if title else None
-                        _, current_item = self._normalize_section_key(current_part, item_num)
-                        self._log(f"DEBUG: Page {page_num} - promoted PART to ITEM {item_num} (intra-page)")
-
-                tail = after
-                while True:
-                    next_kind, next_idx, next_part_m, next_item_m = None, None, None, None
-
-                    for m in PART_PATTERN.finditer(tail):
-                        if m.start() > 0:
-                            next_kind, next_idx, next_part_m = 'part', m.start(), m
-                            break
-                    for m in ITEM_PATTERN.finditer(tail):
-                        if m.start() > 0 and (next_idx is None or m.start() < next_idx):
-                            title_tail = (m.group(3) or "").strip()
-                            if not title_tail or ITEM_BREADCRUMB_TITLE_RE.match(title_tail):
-                                self._log(f"DEBUG: Page {page_num} skipping breadcrumb ITEM {m.group(2)} in tail with title '{title_tail}'")
-                                continue
-                            next_kind, next_idx, next_item_m = 'item', m.start(), m
-
-                    if next_idx is None:
+            if first_kind == 'part':
+                # A PART header is immediately superseded by the first real ITEM after it
+                entry.rebase(origin)
+                for m in entry.items_after(first_idx):
+                    if self._is_breadcrumb_item(m):
+                        self._log(f"DEBUG: Page {page_num} skipping breadcrumb ITEM {m.group(2)} after PART with title '{(m.group(3) or '').strip()}'")
+                        continue
+                    current_pages[-1] = entry.span(m.start(), len(joined.rstrip()))
+                    item_num = m.group(2)
+                    title = (m.group(3) or "").strip()
+                    current_item_title = self._clean_item_title(title) if title else None
+                    _, current_item = self._normalize_section_key(current_part, item_num)
+                    origin = m.start()
+                    self._log(f"DEBUG: Page {page_num} - promoted PART to ITEM {item_num} (intra-page)")
+                    break
+
+            # Walk the remaining candidates on this page in document order
+            while True:
+                entry.rebase(origin)
+                next_part_m = entry.next_part(origin)
+                next_item_m = None
+                for m in entry.items_after(origin):
+                    if next_part_m is not None and m.start() >= next_part_m.start():
                         break
+                    if self._is_breadcrumb_item(m):
+                        self._log(f"DEBUG: Page {page_num} skipping breadcrumb ITEM {m.group(2)} in tail with title '{(m.group(3) or '').strip()}'")
+                        continue
+                    next_item_m = m
+                    break
 
-                    before_seg = tail[:next_idx].strip()
-                    after_seg = tail[next_idx:].strip()
-
-                    if before_seg:
-                        current_pages[-1] = Page(
-                            number=page_num,
-                            content=before_seg,
-                            elements=page.elements,
-                            text_blocks=page.text_blocks,
-                            display_page=page.display_page
-                        )
-                    flush_section()
+                if next_item_m is None and next_part_m is None:
+                    break
+                next_idx = (next_item_m or next_part_m).start()
 
-                    if next_kind == 'part' and next_part_m:
-                        current_part, _ = self._normalize_section_key(next_part_m.group(1), None)
-                        current_item = None
-                        current_item_title = None
-                        self._log(f"DEBUG: Page {page_num} - intra-page PART transition to {current_part}")
-                    elif next_kind == 'item' and next_item_m:
-                        item_num = next_item_m.group(2)
-                        title = (next_item_m.group(3) or "").strip()
-                        current_item_title = self._clean_item_title(title) if title else None
-                        if current_part is None and self.filing_type:
-                            inferred = self._infer_part_for_item(self.filing_type, f"ITEM {item_num.upper()}")
-                            if inferred:
-                                current_part = inferred
-                                self._log(f"DEBUG: Inferred {inferred} at detection time for ITEM {item_num}")
-                        _, current_item = self._normalize_section_key(current_part, item_num)
-                        self._log(f"DEBUG: Page {page_num} - intra-page ITEM transition to {current_item}")
-
-                    current_pages.append(Page(
-                        number=page_num,
-                        content=after_seg,
-                        elements=page.elements,
-                        text_blocks=page.text_blocks,
-                        display_page=page.display_page
-                    ))
-                    tail = after_seg
+                before_seg = self._strip(joined, origin, next_idx)
+                after_seg = entry.span(*self._strip(joined, next_idx, len(joined)))
 
-        flush_section()
+                if before_seg[0] < before_seg[1]:
+                    current_pages[-1] = entry.span(*before_seg)
+                flush_section()
 
-        self._log(f"DEBUG: Total sections before validation: {len(sections)}")
-        for s in sections:
-            self._log(f"  - Part: {s.part}, Item: {s.item}, Pages: {len(s.pages)}, Start: {s.pages[0].number if s.pages else 0}")
-
-        def _section_text_len(s):
-            return sum(len(p.content.strip()) for p in s.pages)
-
-        sections = [s for s in sections if s.item is not None or _section_text_len(s) > 80]
-        self._log(f"DEBUG: Sections after dropping empty PART stubs: {len(sections)}")
-
-        if self.structure and sections:
-            self._log(f"DEBUG: Validating against structure: {self.filing_type}")
-            fixed = []
-            for s in sections:
-                part = s.part
-                item = s.item
-
-                # If part is missing or inconsistent with canonical mapping, try to infer it from the item.
-                if item and self.filing_type:
-                    inferred = self._infer_part_for_item(self.filing_type, item)
-                    if inferred and inferred != part:
-                        self._log(f"DEBUG: Rewriting part from {part} to {inferred} for {item}")
-                        s = Section(
-                            part=inferred,
-                            item=s.item,
-                            item_title=s.item_title,
-                            pages=s.pages
-                        )
-                        part = inferred
-
-                if (part in self.structure) and (item is None or item in self.structure.get(part, [])):
-                    fixed.append(s)
+                if next_item_m is None:
+                    current_part, _ = self._normalize_section_key(next_part_m.group(1), None)
+                    current_item = None
+                    current_item_title = None
+                    self._log(f"DEBUG: Page {page_num} - intra-page PART transition to {current_part}")
                 else:
-                    self._log(f"DEBUG: Dropped section - Part: {part}, Item: {item}")
+                    item_num = next_item_m.group(2)
+                    title = (next_item_m.group(3) or "").strip()
+                    current_item_title = self._clean_item_title(title) if title else None
+                    if current_part is None and self.filing_type:
+                        inferred = self._infer_part_for_item(self.filing_type, f"ITEM {item_num.upper()}")
+                        if inferred:
+                            current_part = inferred
+                            self._log(f"DEBUG: Inferred {inferred} at detection time for ITEM {item_num}")
+                    _, current_item = self._normalize_section_key(current_part, item_num)
+                    self._log(f"DEBUG: Page {page_num} - intra-page ITEM transition to {current_item}")
+
+                current_pages.append(after_seg)
+                origin = next_idx
+
+            # Hand over sections closed on this page before reading the next one
+            emitted += len(ready)
+            yield from ready
+            ready.clear()
 
-            sections = fixed
-            self._log(f"DEBUG: Sections after validation: {len(sections)}")
+        flush_section()
+        emitted += len(ready)
+        yield from ready
 
-        return sections
+        self._log(f"DEBUG: Total sections extracted: {emitted}")
 
     def get_section(self, part: str, item: Optional[str] = None):
         """Get a specific section by part and item."""
@@ -1,6 +1,6 @@
 """Section extraction utilities for SEC filings."""
 
-from typing import List, Optional, Union
+from typing import Iterable, Iterator, List, Optional, Union
 from sec2md.models import Page, Section, FilingType, Item10K, Item10Q, Item13D, Item13G, ITEM_10K_MAPPING, ITEM_10Q_MAPPING, ITEM_13D_MAPPING, ITEM_13G_MAPPING
 from sec2md.section_extractor import SectionExtractor
 
@@ -8,7 +8,8 @@ from sec2md.section_extractor import SectionExtractor
 def extract_sections(
     pages: List[Page],
     filing_type: FilingType,
-    debug: bool = False
+    debug: bool = False,
+    desired_items: Optional[Iterable[Union[Item10K, Item10Q, Item13D, Item13G, str]]] = None
 ) -> List[Section]:
     """
     Extract sections from filing pages.
@@ -17,6 +18,8 @@ def extract_sections(
         pages: List of Page objects from convert_to_markdown(return_pages=True)
         filing_type: Type of filing ("10-K" or "10-Q")
         debug: Enable debug logging
+        desired_items: Only extract these items (enums or strings like "ITEM 1A",
+            "2.02"). Pages after the last of them are not scanned.
 
     Returns:
         List of Section objects, each containing pages for that section
@@ -26,10 +29,12 @@ def extract_sections(
         >>> sections = sec2md.extract_sections(pages, filing_type="10-K")
         >>> for section in sections:
         ...     print(f"{section.item}: {section.item_title}")
+        >>> risk_only = sec2md.extract_sections(pages, "10-K", desired_items=[Item10K.RISK_FACTORS])
     """
     extractor = SectionExtractor(
         pages=pages,
         filing_type=filing_type,
+        desired_items=set(desired_items) if desired_items else None,
         debug=debug
     )
 
@@ -37,8 +42,39 @@ def extract_sections(
     return extractor.get_sections()
 
 
+def iter_sections(
+    pages: Iterable[Page],
+    filing_type: FilingType,
+    debug: bool = False,
+    desired_items: Optional[Iterable[Union[Item10K, Item10Q, Item13D, Item13G, str]]] = None
+) -> Iterator[Section]:
+    """
+    Extract sections incrementally from an iterable of pages.
+
+    Each section is yielded as soon as the next PART/ITEM header closes it,
+    reading no further ahead than that page. Results match extract_sections().
+
+    Args:
+        pages: Pages in order -- a list or a generator
+        filing_type: Type of filing ("10-K" or "10-Q")
+        debug: Enable debug logging
+        desired_items: Only extract these items (see extract_sections())
+
+    Example:
+        >>> for section in sec2md.iter_sections(page_stream, filing_type="10-K"):
+        ...     index(sec2md.chunk_section(section))
+    """
+    extractor = SectionExtractor(
+        pages=pages,
+        filing_type=filing_type,
+        desired_items=set(desired_items) if desired_items else None,
+        debug=debug
+    )
+    return extractor.iter_sections()
+
+
 def get_section(
-    sections: List[Section],
+    sections: Union[List[Section], List[Page]],
     item: Union[Item10K, Item10Q, Item13D, Item13G, str],
     filing_type: FilingType = "10-K"
 ) -> Optional[Section]:
@@ -46,7 +82,9 @@ def get_section(
     Get a specific section by item enum or string.
 
     Args:
-        sections: List of sections from extract_sections()
+        sections: List of sections from extract_sections(), or the filing's
+            pages -- then only the requested item is extracted, and scanning
+            stops at the header that closes it
         item: Item enum (Item10K.RISK_FACTORS) or string ("ITEM 1A")
         filing_type: Type of filing ("10-K" or "10-Q")
 
@@ -57,6 +95,7 @@ def get_section(
         >>> sections = sec2md.extract_sections(pages, filing_type="10-K")
         >>> risk = sec2md.get_section(sections, Item10K.RISK_FACTORS)
         >>> print(risk.markdown())
+        >>> risk = sec2md.get_section(pages, Item10K.RISK_FACTORS)
     """
     # Map enum to (part, item) tuple
     if isinstance(item, Item10K):
@@ -83,6 +122,9 @@ def get_section(
         target_item = item_str
         target_part = None  # Match any part
 
+    if sections and isinstance(sections[0], Page):
+        sections = extract_sections(sections, filing_type, desired_items=[item])
+
     # Find matching section
     for section in sections:
         if section.item == target_item:
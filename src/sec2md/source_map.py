@@ -0,0 +1,241 @@
+"""Sidecar map from element IDs to byte ranges in the original HTML.
+
+``augment_html_with_ids`` annotates the parsed DOM, so citing a source node
+that way means re-serializing the whole document (``Parser.html()``).
+``SourceMap`` instead records where each element's source nodes start and
+end in the HTML the parser was given, so a citation viewer can slice the
+raw document directly.
+
+lxml does not report source positions, so start tags are found with one
+regex scan of the raw HTML and lined up with the DOM's tags in document
+order. Tags lxml invents (``<html>``/``<body>`` when missing) stay
+unmapped; raw tags lxml drops are skipped. Byte offsets are counted in the
+original input bytes and encoding, so ranges from a cp1252 filing slice the
+file as it was downloaded.
+"""
+
+from __future__ import annotations
+
+import codecs
+import re
+from bisect import bisect_right
+from typing import Dict, List, Optional, Tuple
+
+from bs4 import BeautifulSoup
+from bs4.element import Tag
+
+_MARKUP_RE = re.compile(
+    r"<!--.*?-->"
+    r"|<!\[CDATA\[.*?\]\]>"
+    r"|<[!?][^>]*>"
+    r"|</[^>]*>"
+    r"|<([A-Za-z][^\s/>]*)[^>\"']*(?:(?:\"[^\"]*\"|'[^']*')[^>\"']*)*>",
+    re.S,
+)
+# Content of these is text, not markup
+_RAW_TEXT_TAGS = {"script", "style", "textarea", "title", "xmp"}
+_TRAILING_CLOSE_RE = re.compile(r"(?:\s*</[^>]*>)*\s*$")
+# How many raw start tags may be skipped to find the one matching a DOM tag
+_LOOKAHEAD = 64
+# Bytes between the checkpoints of the character -> byte offset table
+_CHECKPOINT = 4096
+
+
+def _local(name: str) -> str:
+    return name.lower().rsplit(":", 1)[-1]
+
+
+def scan_start_tags(source: str) -> List[Tuple[str, int]]:
+    """``(local name, offset)`` of every start tag in ``source``, in order."""
+    tags = []
+    pos = 0
+    search = _MARKUP_RE.search
+    while True:
+        m = search(source, pos)
+        if m is None:
+            break
+        pos = m.end()
+        name = m.group(1)
+        if name is None:
+            continue
+        name = _local(name)
+        tags.append((name, m.start()))
+        if name in _RAW_TEXT_TAGS:
+            close = re.compile(rf"</{name}\s*>", re.I).search(source, pos)
+            pos = close.start() if close else len(source)
+    return tags
+
+
+class _ByteOffsets:
+    """Character offset in the decoded text -> byte offset in the original input.
+
+    ``text`` must be ``raw.decode(encoding, errors="replace")``; without
+    ``raw`` the text is measured as UTF-8. The table of ``(chars, bytes)``
+    checkpoints is built once, so a lookup encodes at most one checkpoint
+    interval.
+    """
+
+    def __init__(self, text: str, raw: Optional[bytes] = None, encoding: str = "utf-8"):
+        self.text = text
+        self.raw = raw
+        self.encoding = encoding
+        self.identity = raw.isascii() if raw is not None else text.isascii()
+        self._chars: List[int] = [0]
+        self._bytes: List[int] = [0]
+        if self.identity:
+            return
+        if raw is None:
+            total = 0
+            for start in range(0, len(text), _CHECKPOINT):
+                total += len(text[start:start + _CHECKPOINT].encode("utf-8", "surrogatepass"))
+                self._chars.append(min(start + _CHECKPOINT, len(text)))
+                self._bytes.append(total)
+            return
+        decoder = codecs.getincrementaldecoder(encoding)("replace")
+        chars = 0
+        for start in range(0, len(raw), _CHECKPOINT):
+            end = min(start + _CHECKPOINT, len(raw))
+            chars += len(decoder.decode(raw[start:end], final=end == len(raw)))
+            # Bytes of a character split across the boundary belong to the next interval
+            self._chars.append(chars)
+            self._bytes.append(end - len(decoder.getstate()[0]))
+
+    def __getitem__(self, offset: int) -> int:
+        if self.identity:
+            return offset
+        i = bisect_right(self._chars, offset) - 1
+        chars, pos = self._chars[i], self._bytes[i]
+        piece = self.text[chars:offset]
+        if self.raw is None:
+            return pos + len(piece.encode("utf-8", "surrogatepass"))
+        if "\ufffd" not in piece:
+            try:
+                return pos + len(piece.encode(self.encoding))
+            except UnicodeEncodeError:
+                pass
+        # Replacement characters have no encoded length; decode byte by byte
+        decoder = codecs.getincrementaldecoder(self.encoding)("replace")
+        remaining = offset - chars
+        while remaining > 0 and pos < len(self.raw):
+            remaining -= len(decoder.decode(self.raw[pos:pos + 1]))
+            pos += 1
+        return pos
+
+
+class SourceMap:
+    """Element ID -> ``[start, end)`` ranges of its source nodes in the raw HTML.
+
+    Args:
+        source: The HTML text the DOM was parsed from.
+        soup: The parsed DOM.
+        block_nodes: Element ID -> source DOM nodes (from element building).
+            Read on every lookup, so IDs added later (lazy pages) resolve too.
+        raw: The original input bytes ``source`` was decoded from, if any.
+            Byte ranges are counted in these; otherwise in UTF-8.
+        encoding: Encoding ``raw`` was decoded with.
+    """
+
+    def __init__(self, source: str, soup: BeautifulSoup, block_nodes: Dict[str, List[Tag]],
+                 raw: Optional[bytes] = None, encoding: str = "utf-8"):
+        self.source = source
+        self.block_nodes = block_nodes
+        self._byte_offsets: Optional[_ByteOffsets] = None
+        self._raw = raw
+        self._encoding = encoding
+        self._tags: List[Tag] = soup.find_all(True)
+        self._index: Dict[int, int] = {id(tag): i for i, tag in enumerate(self._tags)}
+        self._starts: List[Optional[int]] = self._align(scan_start_tags(source))
+        self._char_ranges: Dict[str, List[Tuple[int, int]]] = {}
+
+    def _align(self, raw: List[Tuple[str, int]]) -> List[Optional[int]]:
+        starts: List[Optional[int]] = []
+        j = 0
+        for tag in self._tags:
+            name = _local(tag.name)
+            for k in range(j, min(j + _LOOKAHEAD, len(raw))):
+                if raw[k][0] == name:
+                    starts.append(raw[k][1])
+                    j = k + 1
+                    break
+            else:
+                starts.append(None)
+        return starts
+
+    def _next_start(self, node: Tag) -> int:
+        """Raw offset of the first mapped tag after ``node``'s subtree."""
+        after = None
+        current = node
+        while current is not None and after is None:
+            after = current.find_next_sibling(True)
+            current = current.parent
+        if after is None:
+            return len(self.source)
+        starts = self._starts
+        for i in range(self._index[id(after)], len(starts)):
+            if starts[i] is not None:
+                return starts[i]
+        return len(self.source)
+
+    def _node_range(self, node: Tag) -> Optional[Tuple[int, int]]:
+        i = self._index.get(id(node))
+        start = self._starts[i] if i is not None else None
+        if start is None:
+            return None
+        limit = self._next_start(node)
+        name = re.escape(_local(node.name))
+        depth = 0
+        tag_re = re.compile(rf"<(/?)(?:[\w.-]+:)?{name}(?=[\s/>])[^>]*>", re.I)
+        for m in tag_re.finditer(self.source, start, limit):
+            depth += -1 if m.group(1) else 1
+            if depth == 0:
+                return start, m.end()
+        # No closing tag (e.g. an unclosed <p>): stop before whatever closes the parent
+        tail = _TRAILING_CLOSE_RE.search(self.source, start, limit)
+        return start, tail.start()
+
+    def _to_bytes(self) -> _ByteOffsets:
+        if self._byte_offsets is None:
+            self._byte_offsets = _ByteOffsets(self.source, self._raw, self._encoding)
+        return self._byte_offsets
+
+    def char_ranges(self, element_id: str) -> List[Tuple[int, int]]:
+        """Character ranges of the element's source nodes in ``source``."""
+        if element_id not in self._char_ranges:
+            ranges = [self._node_range(node) for node in self.block_nodes.get(element_id, [])]
+            self._char_ranges[element_id] = [r for r in ranges if r is not None]
+        return self._char_ranges[element_id]
+
+    def ranges(self, element_id: str) -> List[Tuple[int, int]]:
+        """Byte ranges of the element's source nodes in the original HTML."""
+        to_bytes = self._to_bytes()
+        return [(to_bytes[start], to_bytes[end]) for start, end in self.char_ranges(element_id)]
+
+    def span(self, element_id: str) -> Optional[Tuple[int, int]]:
+        """Byte range from the element's first source node to the end of its last."""
+        ranges = self.ranges(element_id)
+        if not ranges:
+            return None
+        return min(r[0] for r in ranges), max(r[1] for r in ranges)
+
+    def fragment(self, element_id: str) -> Optional[str]:
+        """Raw HTML covering all of the element's source nodes, or None if unmapped."""
+        ranges = self.char_ranges(element_id)
+        if not ranges:
+            return None
+        return self.source[min(r[0] for r in ranges):max(r[1] for r in ranges)]
+
+    def to_dict(self) -> Dict[str, List[List[int]]]:
+        """Byte ranges of every known element, JSON-friendly."""
+        ranges = {eid: self.char_ranges(eid) for eid in self.block_nodes}
+        to_bytes = self._to_bytes()
+        return {
+            eid: [[to_bytes[start], to_bytes[end]] for start, end in rs]
+            for eid, rs in ranges.items() if rs
+        }
+
+    def __len__(self) -> int:
+        return len(self.block_nodes)
+
+    def __repr__(self) -> str:
+        mapped = sum(1 for s in self._starts if s is not None)
+        return f"SourceMap(elements={len(self)}, tags={mapped}/{len(self._tags)})"
@@ -0,0 +1,146 @@
+"""Filing-wide registry of XBRL TextBlocks (financial statement notes).
+
+The parser records every TextBlock it walks through -- name, title and the
+pages its text lands on -- and, as each page's elements are built, the
+note's element IDs on that page. A note can then be looked up by name (and
+chunked, see ``chunk_text_block``) without merging ``text_blocks`` across
+every page (``merge_text_blocks``).
+"""
+
+from __future__ import annotations
+
+from bisect import insort
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set
+
+from sec2md.models import Element, Page, TextBlock
+
+
+@dataclass
+class TextBlockEntry:
+    """What the parser saw of one TextBlock while walking the DOM and building elements."""
+    name: str
+    title: Optional[str]
+    pages: List[int] = field(default_factory=list)
+    # Page -> the note's elements on it, for pages whose elements are built
+    elements_by_page: Dict[int, List[Element]] = field(default_factory=dict, repr=False)
+
+    @property
+    def page_span(self) -> tuple:
+        return (self.pages[0], self.pages[-1]) if self.pages else (0, 0)
+
+    @property
+    def source_pages(self) -> List[int]:
+        """Pages holding elements of the note, in order."""
+        return sorted(n for n, elements in self.elements_by_page.items() if elements)
+
+    @property
+    def elements(self) -> List[Element]:
+        """The note's elements in document order (built pages only)."""
+        return [e for n in self.source_pages for e in self.elements_by_page[n]]
+
+    @property
+    def element_ids(self) -> List[str]:
+        return [e.id for e in self.elements]
+
+
+class TextBlockRegistry:
+    """TextBlocks by XBRL name, in document order."""
+
+    def __init__(self):
+        self._entries: Dict[str, TextBlockEntry] = {}
+        self._merged: Dict[str, TextBlock] = {}
+        self._built_pages: Set[int] = set()
+
+    def record(self, name: str, title: Optional[str], page_num: int) -> None:
+        """Note that TextBlock ``name`` has text on ``page_num`` (called per segment)."""
+        entry = self._entries.get(name)
+        if entry is None:
+            entry = self._entries[name] = TextBlockEntry(name=name, title=title)
+        if entry.pages and entry.pages[-1] == page_num:
+            return
+        if page_num not in entry.pages:
+            insort(entry.pages, page_num)
+
+    def record_elements(self, page_num: int, text_blocks: Iterable[TextBlock]) -> None:
+        """Note each TextBlock's elements on ``page_num`` (called once the page's elements are built)."""
+        self._built_pages.add(page_num)
+        for tb in text_blocks:
+            entry = self._entries.get(tb.name)
+            if entry is None:
+                entry = self._entries[tb.name] = TextBlockEntry(name=tb.name, title=tb.title, pages=[page_num])
+            if not entry.elements_by_page or page_num >= max(entry.elements_by_page):
+                entry.title = tb.title
+            entry.elements_by_page.setdefault(page_num, []).extend(tb.elements)
+            if page_num not in entry.pages:
+                insort(entry.pages, page_num)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._merged.clear()
+        self._built_pages.clear()
+
+    def entry(self, name: str) -> Optional[TextBlockEntry]:
+        return self._entries.get(name)
+
+    def names(self) -> List[str]:
+        return list(self._entries)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[TextBlockEntry]:
+        return iter(self._entries.values())
+
+    def load(self, name: str, page_lookup: Callable[[int], Optional[Page]]) -> Optional[TextBlockEntry]:
+        """Entry for ``name`` with the elements of all its pages recorded.
+
+        Pages whose elements are not built yet (``lazy_elements``) are
+        materialized through ``page_lookup``; nothing else is read.
+        """
+        entry = self._entries.get(name)
+        if entry is None:
+            return None
+        for page_num in entry.pages:
+            if page_num not in self._built_pages:
+                page = page_lookup(page_num)
+                if page is not None:
+                    page.materialize()
+        return entry
+
+    def get(self, name: str, page_lookup: Callable[[int], Optional[Page]]) -> Optional[TextBlock]:
+        """Merged TextBlock for ``name``, built from its recorded elements on first call.
+
+        Args:
+            name: XBRL TextBlock name (e.g. 'us-gaap:DebtDisclosureTextBlock').
+            page_lookup: Returns the parsed page for a page number.
+
+        Returns:
+            TextBlock with elements and page span as ``merge_text_blocks``
+            would produce, or None if the note has no elements.
+        """
+        if name in self._merged:
+            return self._merged[name]
+        entry = self.load(name, page_lookup)
+        if entry is None:
+            return None
+        source_pages = entry.source_pages
+        if not source_pages:
+            return None
+
+        merged = TextBlock(
+            name=name,
+            title=entry.title,
+            elements=entry.elements,
+            start_page=source_pages[0],
+            end_page=source_pages[-1],
+            source_pages=source_pages,
+        )
+        self._merged[name] = merged
+        return merged
+
+    def __repr__(self) -> str:
+        return f"TextBlockRegistry(text_blocks={len(self)})"
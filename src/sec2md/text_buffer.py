@@ -0,0 +1,124 @@
+"""Offset-backed text storage.
+
+By default every ``Page`` and ``Element`` owns its own ``content`` string, so
+element text is held twice (once in the page, once in the element). With
+``share_page_text`` the page texts are joined into one ``TextBuffer`` and
+pages and elements keep only ``(start, end)`` offsets into it; ``content``
+is sliced from the buffer on access. Sections likewise keep ``PageSpan``
+offsets into the pages they cover instead of sliced page copies.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable, List, Optional
+
+if TYPE_CHECKING:
+    from sec2md.models import Page
+
+PAGE_SEPARATOR = "\n\n"
+
+
+class TextBuffer:
+    """One contiguous string holding a filing's page text."""
+
+    __slots__ = ("text",)
+
+    def __init__(self, text: str):
+        self.text = text
+
+    def __len__(self) -> int:
+        return len(self.text)
+
+    def __repr__(self) -> str:
+        return f"TextBuffer(chars={len(self.text)})"
+
+
+@dataclass(frozen=True)
+class TextSpan:
+    """A ``[start, end)`` range of a ``TextBuffer``."""
+    buffer: TextBuffer
+    start: int
+    end: int
+
+    def text(self) -> str:
+        return self.buffer.text[self.start:self.end]
+
+    def __len__(self) -> int:
+        return self.end - self.start
+
+
+@dataclass(frozen=True)
+class PageSpan:
+    """``page.content[start:end]``: that page's share of a ``Section``.
+
+    10-K/10-Q sections are read from the page with running headers, footers
+    and page numbers removed. For those spans ``clean`` is applied to the
+    slice (which covers whole lines) when ``content`` is read, and
+    ``trim_start``/``trim_end`` characters are then dropped from either end
+    of the cleaned text. No copy of the page is kept.
+    """
+    page: Page
+    start: int
+    end: int
+    trim_start: int = 0
+    trim_end: int = 0
+    clean: Optional[Callable[[str], str]] = None
+
+    @property
+    def content(self) -> str:
+        text = self.page.content[self.start:self.end]
+        if self.clean is None:
+            return text
+        text = self.clean(text)
+        return text[self.trim_start:len(text) - self.trim_end]
+
+
+def share_page_text(pages: List[Page]) -> TextBuffer:
+    """Move page and element text into one shared buffer, in place.
+
+    Pages are joined with ``PAGE_SEPARATOR`` (as ``Parser.markdown()`` does).
+    An element is backed by the buffer only when its content is exactly the
+    page text at its content offsets; other elements keep their own string.
+    TextBlocks reference the same Element objects, so they share the buffer too.
+    Elements of pages that are not materialized yet are bound when they are built.
+
+    Returns:
+        The buffer now backing ``pages``.
+    """
+    buffer = TextBuffer(PAGE_SEPARATOR.join(page.content for page in pages))
+
+    pos = 0
+    for page in pages:
+        span = TextSpan(buffer, pos, pos + len(page.content))
+        pos = span.end + len(PAGE_SEPARATOR)
+        page._bind_text(span)
+        if page.elements_loaded:
+            bind_element_text(page)
+
+    return buffer
+
+
+def bind_element_text(page: Page) -> None:
+    """Back a buffer-backed page's elements with slices of the same buffer."""
+    span = page._text_span
+    if span is None:
+        return
+    content = span.text()
+    for element in page.elements or []:
+        start, end = element.content_start_offset, element.content_end_offset
+        if start is None or end is None or element._text_span is not None:
+            continue
+        if content[start:end] == element.content:
+            element._bind_text(TextSpan(span.buffer, span.start + start, span.start + end))
+
+
+def joined_span(spans: List[Optional[TextSpan]]) -> Optional[TextSpan]:
+    """Single span equal to ``PAGE_SEPARATOR.join`` of ``spans``, if they are adjacent in one buffer."""
+    if not spans or any(span is None for span in spans):
+        return None
+    buffer = spans[0].buffer
+    for prev, span in zip(spans, spans[1:]):
+        if span.buffer is not buffer or span.start != prev.end + len(PAGE_SEPARATOR):
+            return None
+    return TextSpan(buffer, spans[0].start, spans[-1].end)
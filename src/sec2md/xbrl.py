@@ -0,0 +1,261 @@
+"""Inline XBRL fact extraction.
+
+``Element.tags`` only records which concepts appear in an element. This
+module reads the facts themselves -- values, contexts, units, decimals,
+scale and sign -- together with the period and dimensions declared in
+``ix:resources``, and lays them out as a ``FactTable``: one list per column,
+so the table converts directly to pandas, NumPy or Arrow.
+
+Each fact is linked to the sec2md element whose content contains it, so
+numbers can be traced back to citable markdown.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field, fields
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+from bs4 import BeautifulSoup, Tag
+
+_NUMBER_RE = re.compile(r"\d[\d.,\s]*")
+_ZERO_DASHES = {"-", "–", "—", "‒", "−"}
+_WS_RE = re.compile(r"\s+")
+
+
+def _local(name: Optional[str]) -> str:
+    """Tag name without its namespace prefix (lxml keeps ``ix:`` as part of the name)."""
+    return (name or "").rsplit(":", 1)[-1]
+
+
+@dataclass
+class XbrlContext:
+    """Period and dimensional qualifiers of an ``xbrli:context``."""
+    id: str
+    entity: Optional[str] = None
+    period_start: Optional[str] = None
+    period_end: Optional[str] = None
+    instant: Optional[str] = None
+    dimensions: Dict[str, str] = field(default_factory=dict)
+
+    @classmethod
+    def from_tag(cls, el: Tag) -> "XbrlContext":
+        ctx = cls(id=el.get("id", ""))
+        for child in el.find_all(True):
+            local = _local(child.name)
+            if local == "identifier":
+                ctx.entity = child.get_text(strip=True)
+            elif local == "startdate":
+                ctx.period_start = child.get_text(strip=True)
+            elif local == "enddate":
+                ctx.period_end = child.get_text(strip=True)
+            elif local == "instant":
+                ctx.instant = child.get_text(strip=True)
+            elif local in ("explicitmember", "typedmember"):
+                ctx.dimensions[child.get("dimension", "")] = child.get_text(strip=True)
+        return ctx
+
+
+def _unit_label(el: Tag) -> str:
+    """``iso4217:USD``, or ``iso4217:USD/xbrli:shares`` for divide units."""
+    parts: Dict[str, List[str]] = {"unitnumerator": [], "unitdenominator": []}
+    plain: List[str] = []
+    for measure in el.find_all(True):
+        if _local(measure.name) != "measure":
+            continue
+        parent = _local(measure.parent.name) if measure.parent else ""
+        (parts[parent] if parent in parts else plain).append(measure.get_text(strip=True))
+    if parts["unitnumerator"] or parts["unitdenominator"]:
+        return "*".join(parts["unitnumerator"]) + "/" + "*".join(parts["unitdenominator"])
+    return "*".join(plain)
+
+
+def parse_number(text: str, fmt: Optional[str] = None) -> Optional[float]:
+    """Read the displayed number of an ``ix:nonFraction`` per its ``format``.
+
+    Handles the ``num-dot-decimal`` (default), ``num-comma-decimal`` and
+    ``fixed-zero``/``zerodash`` transforms. Returns None when the text is not
+    a number (e.g. word formats such as ``numwordsen``).
+    """
+    local_fmt = _local(fmt).lower()
+    stripped = text.strip()
+    if local_fmt in ("fixed-zero", "zerodash") or stripped in _ZERO_DASHES:
+        return 0.0
+    match = _NUMBER_RE.search(stripped)
+    if not match:
+        return None
+    digits = _WS_RE.sub("", match.group(0))
+    if "comma-decimal" in local_fmt or local_fmt == "numcommadecimal":
+        digits = digits.replace(".", "").replace(",", ".")
+    else:
+        digits = digits.replace(",", "")
+    try:
+        return float(digits)
+    except ValueError:
+        return None
+
+
+def _int_or_none(value: Optional[str]) -> Optional[int]:
+    try:
+        return int(value) if value not in (None, "") else None
+    except ValueError:
+        return None
+
+
+@dataclass
+class FactTable:
+    """All iXBRL facts of a filing as parallel column lists.
+
+    Row ``i`` of every column describes the same fact; ``value`` is the
+    numeric value after ``scale`` and ``sign`` are applied (None for
+    non-numeric or nil facts) and ``text`` is the displayed text. Use
+    ``to_dict()`` to build a DataFrame or Arrow table.
+    """
+    fact_id: List[Optional[str]] = field(default_factory=list)
+    concept: List[str] = field(default_factory=list)
+    numeric: List[bool] = field(default_factory=list)
+    value: List[Optional[float]] = field(default_factory=list)
+    text: List[str] = field(default_factory=list)
+    context_ref: List[Optional[str]] = field(default_factory=list)
+    unit_ref: List[Optional[str]] = field(default_factory=list)
+    unit: List[Optional[str]] = field(default_factory=list)
+    decimals: List[Optional[str]] = field(default_factory=list)
+    scale: List[int] = field(default_factory=list)
+    sign: List[Optional[str]] = field(default_factory=list)
+    format: List[Optional[str]] = field(default_factory=list)
+    period_start: List[Optional[str]] = field(default_factory=list)
+    period_end: List[Optional[str]] = field(default_factory=list)
+    instant: List[Optional[str]] = field(default_factory=list)
+    dimensions: List[Optional[Dict[str, str]]] = field(default_factory=list)
+    element_id: List[Optional[str]] = field(default_factory=list)
+
+    @classmethod
+    def column_names(cls) -> List[str]:
+        return [f.name for f in fields(cls)]
+
+    def __len__(self) -> int:
+        return len(self.concept)
+
+    def __getitem__(self, column: str) -> List[Any]:
+        if column not in self.column_names():
+            raise KeyError(column)
+        return getattr(self, column)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return iter(self.to_records())
+
+    def to_dict(self) -> Dict[str, List[Any]]:
+        """Columns by name, e.g. ``pandas.DataFrame(facts.to_dict())``."""
+        return {name: getattr(self, name) for name in self.column_names()}
+
+    def to_records(self) -> List[Dict[str, Any]]:
+        names = self.column_names()
+        columns = [getattr(self, name) for name in names]
+        return [dict(zip(names, row)) for row in zip(*columns)]
+
+    def take(self, rows: Sequence[int]) -> "FactTable":
+        """New table with only ``rows``, in the given order."""
+        return FactTable(**{
+            name: [column[i] for i in rows]
+            for name, column in self.to_dict().items()
+        })
+
+    def where(self, concept: Optional[str] = None, element_id: Optional[str] = None) -> "FactTable":
+        """Facts matching a concept name and/or element ID."""
+        rows = [
+            i for i in range(len(self))
+            if (concept is None or self.concept[i] == concept)
+            and (element_id is None or self.element_id[i] == element_id)
+        ]
+        return self.take(rows)
+
+    def __repr__(self) -> str:
+        return f"FactTable(facts={len(self)}, concepts={len(set(self.concept))})"
+
+
+def _fact_text(el: Tag, continuations: Dict[str, Tag]) -> str:
+    """Displayed text of a fact, following ``continuedAt`` chains for non-numeric facts."""
+    parts = [el.get_text(" ", strip=True)]
+    next_id = el.get("continuedat")
+    seen = set()
+    while next_id and next_id in continuations and next_id not in seen:
+        seen.add(next_id)
+        cont = continuations[next_id]
+        parts.append(cont.get_text(" ", strip=True))
+        next_id = cont.get("continuedat")
+    return " ".join(p for p in parts if p)
+
+
+def extract_facts(
+    soup: BeautifulSoup,
+    element_ids: Optional[Dict[int, str]] = None,
+) -> FactTable:
+    """Extract every ``ix:nonFraction`` and ``ix:nonNumeric`` fact in ``soup``.
+
+    Args:
+        soup: Parsed filing HTML.
+        element_ids: Maps ``id(fact_tag)`` to the ID of the element containing
+            it (see ``Parser.get_facts``). Facts not shown in any element, such
+            as those in ``ix:hidden``, get ``element_id=None``.
+
+    Returns:
+        FactTable with one row per fact in document order.
+    """
+    element_ids = element_ids or {}
+    contexts: Dict[str, XbrlContext] = {}
+    units: Dict[str, str] = {}
+    continuations: Dict[str, Tag] = {}
+    fact_tags: List[Tag] = []
+
+    for el in soup.find_all(True):
+        local = _local(el.name)
+        if local in ("nonfraction", "nonnumeric"):
+            fact_tags.append(el)
+        elif local == "context":
+            ctx = XbrlContext.from_tag(el)
+            contexts[ctx.id] = ctx
+        elif local == "unit" and el.get("id"):
+            units[el["id"]] = _unit_label(el)
+        elif local == "continuation" and el.get("id"):
+            continuations[el["id"]] = el
+
+    table = FactTable()
+    for el in fact_tags:
+        numeric = _local(el.name) == "nonfraction"
+        fmt = el.get("format")
+        scale = _int_or_none(el.get("scale")) or 0
+        sign = el.get("sign")
+        nil = el.get("xsi:nil", "").lower() == "true"
+        text = el.get_text(" ", strip=True) if numeric else _fact_text(el, continuations)
+
+        value = None
+        if numeric and not nil:
+            value = parse_number(text, fmt)
+            if value is not None:
+                value = value * 10 ** scale if scale >= 0 else value / 10 ** -scale
+                if sign == "-":
+                    value = -value
+
+        context_ref = el.get("contextref")
+        ctx = contexts.get(context_ref or "")
+        unit_ref = el.get("unitref")
+
+        table.fact_id.append(el.get("id"))
+        table.concept.append(el.get("name", ""))
+        table.numeric.append(numeric)
+        table.value.append(value)
+        table.text.append(text)
+        table.context_ref.append(context_ref)
+        table.unit_ref.append(unit_ref)
+        table.unit.append(units.get(unit_ref) if unit_ref else None)
+        table.decimals.append(el.get("decimals"))
+        table.scale.append(scale)
+        table.sign.append(sign)
+        table.format.append(fmt)
+        table.period_start.append(ctx.period_start if ctx else None)
+        table.period_end.append(ctx.period_end if ctx else None)
+        table.instant.append(ctx.instant if ctx else None)
+        table.dimensions.append(dict(ctx.dimensions) if ctx and ctx.dimensions else None)
+        table.element_id.append(element_ids.get(id(el)))
+
+    return table
@@ -155,3 +155,66 @@ class TestClusterByEps:
         clusters = parser._cluster_by_eps([10.0, 50.0, 100.0], eps=5)
         assert len(set(clusters.values())) == 3
 
+
+
+class TestSweepClusters:
+    """Single-pass row/column id assignment."""
+
+    def test_ids_aligned_with_input(self):
+        ids, n = AbsolutelyPositionedTableParser._sweep_clusters([50.0, 10.0, 12.0, 100.0, 51.0], eps=5)
+        assert ids == [1, 0, 0, 2, 1]
+        assert n == 3
+
+    def test_matches_cluster_by_eps(self):
+        values = [3.0, 17.5, 1.0, 16.0, 30.0, 3.0, 44.9]
+        elements = _make_elements(['<div style="position:absolute; left:10px; top:10px">X</div>'])
+        parser = AbsolutelyPositionedTableParser(elements)
+        ids, _ = parser._sweep_clusters(values, eps=12)
+        clusters = parser._cluster_by_eps(values, eps=12)
+        assert ids == [clusters[v] for v in values]
+
+    def test_empty(self):
+        assert AbsolutelyPositionedTableParser._sweep_clusters([], eps=5) == ([], 0)
+
+
+class TestSharedLayout:
+    """Detection, grid building and markdown reuse one clustering pass."""
+
+    @staticmethod
+    def _statement(n_rows):
+        rows = []
+        for r in range(n_rows):
+            y = 20 + r * 18
+            rows.append(f'<div style="position:absolute; left:10px; top:{y}px">Line {r}</div>')
+            rows.append(f'<div style="position:absolute; left:250px; top:{y}px">{r * 7:,}</div>')
+            rows.append(f'<div style="position:absolute; left:400px; top:{y}px">({r * 3:,})</div>')
+        return _make_elements(rows)
+
+    def test_layout_computed_once(self, monkeypatch):
+        parser = AbsolutelyPositionedTableParser(self._statement(10))
+        calls = []
+        original = AbsolutelyPositionedTableParser._sweep_clusters
+
+        def _counting(values, eps):
+            calls.append(eps)
+            return original(values, eps)
+
+        monkeypatch.setattr(AbsolutelyPositionedTableParser, "_sweep_clusters", staticmethod(_counting))
+        assert parser.is_table_like()
+        md = parser.to_markdown()
+        parser.to_grid()
+        # Caption filter (rows) + grid rows + grid columns, once each
+        assert sorted(calls) == [12, 15, 50]
+        assert "| Line 9 | 63 | (27) |" in md
+
+    def test_grid_shape(self):
+        grid = AbsolutelyPositionedTableParser(self._statement(8)).to_grid()
+        assert len(grid) == 8
+        assert all(len(row) == 3 for row in grid)
+        assert grid[3][1][0][2].text == "21"
+
+    def test_large_multi_page_statement(self):
+        parser = AbsolutelyPositionedTableParser(self._statement(5000))
+        md = parser.to_markdown()
+        assert md.count("\n") == 5000
+        assert "| Line 4999 | 34,993 | (14,997) |" in md
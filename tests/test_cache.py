@@ -0,0 +1,255 @@
+"""Tests for content-addressed caches (cache.py)."""
+
+import pytest
+from bs4 import BeautifulSoup
+
+from sec2md.cache import TableCache, CacheStats, ParseCache, ParsedFiling, normalize_table_html
+from sec2md.core import load_filing, parse_filing
+from sec2md.models import Page
+from sec2md.sections import extract_sections
+from sec2md.parser import Parser
+from sec2md.table_parser import TableParser
+
+
+TABLE = """<table>
+<tr><td>Name</td><td>Value</td></tr>
+<tr><td>Revenue</td><td>100</td></tr>
+<tr><td>Costs</td><td>40</td></tr>
+</table>"""
+
+TABLE_RESTYLED = """<table class="x" style="width:100%">
+<tr id="r1"><td style="padding:0">Name</td><td>Value</td></tr>
+<tr><td>Revenue</td>   <td>
+  100</td></tr><tr><td>Costs</td><td>40</td></tr>
+</table>"""
+
+TABLE_IX = """<table><tr><td>Name</td><td>Value</td></tr>
+<tr><td>Revenue</td><td><ix:nonfraction name="us-gaap:Revenues" contextref="{ctx}" id="{ctx}-f">100</ix:nonfraction></td></tr>
+<tr><td>Costs</td><td>40</td></tr></table>"""
+
+
+def _html(table: str) -> str:
+    return f"<html><body><p>Intro</p>{table}</body></html>"
+
+
+class TestNormalizeTableHtml:
+    def test_drops_presentational_attributes(self):
+        a = normalize_table_html('<td style="color:red" id="x">A</td>')
+        b = normalize_table_html("<td>A</td>")
+        assert a == b
+
+    def test_keeps_spans(self):
+        a = normalize_table_html('<td colspan="2">A</td>')
+        b = normalize_table_html("<td>A</td>")
+        assert a != b
+        assert "colspan=2" in a
+
+    def test_ignores_whitespace_around_tags(self):
+        assert normalize_table_html("<tr>\n  <td> A </td>\n</tr>") == normalize_table_html("<tr><td>A</td></tr>")
+
+    def test_keeps_whitespace_inside_text(self):
+        assert normalize_table_html("<td>A\n\nB</td>") != normalize_table_html("<td>A B</td>")
+
+
+class TestTableCache:
+    def test_miss_then_hit(self):
+        cache = TableCache()
+        assert cache.get("k") is None
+        cache.put("k", "| a |")
+        assert cache.get("k") == "| a |"
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 1
+        assert cache.stats.hit_rate == 0.5
+
+    def test_lru_eviction(self):
+        cache = TableCache(max_entries=2)
+        cache.put("a", "A")
+        cache.put("b", "B")
+        cache.get("a")          # refresh a
+        cache.put("c", "C")     # evicts b
+        assert cache.get("b") is None
+        assert cache.get("a") == "A"
+        assert len(cache) == 2
+        assert cache.stats.evictions == 1
+
+    def test_invalid_size(self):
+        with pytest.raises(ValueError):
+            TableCache(max_entries=0)
+
+    def test_disk_tier_persists(self, tmp_path):
+        first = TableCache(cache_dir=tmp_path)
+        first.put("abcdef", "| x |")
+
+        second = TableCache(cache_dir=tmp_path)
+        assert second.get("abcdef") == "| x |"
+        assert second.stats.disk_hits == 1
+        # Promoted to memory
+        assert second.get("abcdef") == "| x |"
+        assert second.stats.disk_hits == 1
+
+    def test_key_ignores_styling(self):
+        table_a = BeautifulSoup(TABLE, "lxml").find("table")
+        table_b = BeautifulSoup(TABLE_RESTYLED, "lxml").find("table")
+        assert TableCache.key_for(table_a) == TableCache.key_for(table_b)
+
+    def test_clear_resets(self):
+        cache = TableCache()
+        cache.put("a", "A")
+        cache.get("a")
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.stats == CacheStats()
+
+
+class TestParserIntegration:
+    def test_output_identical_with_cache(self):
+        uncached = Parser(_html(TABLE)).markdown()
+        cache = TableCache()
+        assert Parser(_html(TABLE), table_cache=cache).markdown() == uncached
+        assert Parser(_html(TABLE), table_cache=cache).markdown() == uncached
+        assert cache.stats.misses == 1
+        assert cache.stats.hits == 1
+
+    def test_hit_skips_table_parser(self, monkeypatch):
+        cache = TableCache()
+        Parser(_html(TABLE), table_cache=cache).markdown()
+
+        def _fail(*args, **kwargs):
+            raise AssertionError("TableParser should not run on cache hit")
+
+        monkeypatch.setattr(TableParser, "__init__", _fail)
+        md = Parser(_html(TABLE), table_cache=cache).markdown()
+        assert "Revenue" in md
+
+    def test_restyled_table_hits(self):
+        cache = TableCache()
+        Parser(_html(TABLE), table_cache=cache).markdown()
+        Parser(_html(TABLE_RESTYLED), table_cache=cache).markdown()
+        assert cache.stats.hits == 1
+
+    def test_xbrl_context_ids_do_not_affect_key(self):
+        cache = TableCache()
+        first = Parser(_html(TABLE_IX.format(ctx="c-2023")), table_cache=cache).markdown()
+        second = Parser(_html(TABLE_IX.format(ctx="c-2024")), table_cache=cache).markdown()
+        assert first == second
+        assert cache.stats.hits == 1
+
+
+LONG = "The Company has outstanding fixed-rate notes with varying maturities for an aggregate principal amount. "
+
+FILING = f"""<html><body>
+<p>ITEM 1. Business</p><p>The company makes widgets. {LONG * 3}</p>
+<div style="page-break-before:always"><p>ITEM 1A. Risk Factors</p><p>Widgets may break. {LONG * 3}</p></div>
+<div><ix:nonnumeric name="us-gaap:DebtDisclosureTextBlock" contextref="c1">
+<p><b>Note 1 – Debt</b></p><p>{LONG * 6}</p></ix:nonnumeric></div>
+</body></html>"""
+
+
+class TestParseCache:
+    @pytest.fixture(autouse=True)
+    def _fast_tokens(self, monkeypatch):
+        monkeypatch.setattr("sec2md.models._count_tokens", lambda text: len(text) // 4)
+
+    def test_key_depends_on_html_and_options(self):
+        key = ParseCache.key_for(FILING, include_elements=True)
+        assert key == ParseCache.key_for(FILING.encode("utf-8"), include_elements=True)
+        assert key != ParseCache.key_for(FILING, include_elements=False)
+        assert key != ParseCache.key_for(FILING + " ", include_elements=True)
+
+    def test_hit_returns_equal_fresh_pages(self):
+        cache = ParseCache()
+        first = parse_filing(FILING, parse_cache=cache)
+        second = parse_filing(FILING, parse_cache=cache)
+        assert [p.model_dump() for p in second] == [p.model_dump() for p in first]
+        assert second[0] is not first[0]
+        assert cache.stats.misses == 1
+        assert cache.stats.hits == 1
+
+    def test_hit_skips_parser(self, monkeypatch):
+        cache = ParseCache()
+        parse_filing(FILING, parse_cache=cache)
+
+        def _fail(*args, **kwargs):
+            raise AssertionError("Parser should not run on cache hit")
+
+        monkeypatch.setattr(Parser, "__init__", _fail)
+        assert parse_filing(FILING, parse_cache=cache)[0].elements
+
+    def test_text_block_elements_shared_with_page(self):
+        cache = ParseCache()
+        parse_filing(FILING, parse_cache=cache)
+        page = parse_filing(FILING, parse_cache=cache)[-1]
+        tb = page.text_blocks[0]
+        assert tb.elements[0] is next(e for e in page.elements if e.id == tb.elements[0].id)
+
+    def test_disk_tier_persists_sections_and_sidecars(self, tmp_path):
+        first = load_filing(FILING, parse_cache=ParseCache(cache_dir=tmp_path), filing_type="10-K", sidecars=True)
+
+        cache = ParseCache(cache_dir=tmp_path)
+        second = load_filing(FILING, parse_cache=cache, filing_type="10-K", sidecars=True)
+        assert cache.stats.disk_hits == 1
+        assert [s.item for s in second.sections["10-K"]] == ["ITEM 1", "ITEM 1A"]
+        assert second.sections["10-K"][1].spans is not None
+        assert second.sections["10-K"][1].markdown() == first.sections["10-K"][1].markdown()
+        assert second.html == first.html
+        assert second.source_map == first.source_map
+
+    def test_missing_sections_added_to_entry(self):
+        cache = ParseCache()
+        parse_filing(FILING, parse_cache=cache)
+        filing = load_filing(FILING, parse_cache=cache, filing_type="10-K")
+        assert filing.sections["10-K"]
+        assert load_filing(FILING, parse_cache=cache).sections["10-K"]
+        assert cache.stats.hits == 2
+
+    def test_sidecars_reparse_keeps_sections_and_counts_miss(self, tmp_path):
+        cache = ParseCache(cache_dir=tmp_path)
+        load_filing(FILING, parse_cache=cache, filing_type="10-K")
+        filing = load_filing(FILING, parse_cache=cache, sidecars=True)
+        assert filing.html is not None
+        assert cache.stats.hits == 0
+        assert cache.stats.misses == 2
+
+        reloaded = ParseCache(cache_dir=tmp_path).get(ParseCache.key_for(FILING, include_elements=True,
+                                                                            embed_images=False))
+        assert [s.item for s in reloaded.sections["10-K"]] == ["ITEM 1", "ITEM 1A"]
+        assert reloaded.html == filing.html
+
+    @pytest.mark.parametrize("filing_type, items, html", [
+        ("8-K", ["ITEM 2.02", "ITEM 9.01"],
+         "<html><body><p>FORM 8-K Current Report</p><div style=\"page-break-before:always\"></div>"
+         f"<p>Item 2.02 Results of Operations</p><p>Revenue grew. {LONG}</p>"
+         f"<p>Item 9.01 Financial Statements and Exhibits</p><p>None. {LONG}</p></body></html>"),
+        ("SC 13D", ["ITEM 1", "ITEM 2"],
+         f"<html><body><p>Item 1. Security and Issuer</p><p>Common stock. {LONG}</p>"
+         f"<p>Item 2. Identity and Background</p><p>Reporting person. {LONG}</p>"
+         "<p>SIGNATURE</p><p>John Doe</p></body></html>"),
+    ])
+    def test_sections_round_trip(self, filing_type, items, html):
+        cache = ParseCache()
+        first = load_filing(html, parse_cache=cache, filing_type=filing_type)
+        second = load_filing(html, parse_cache=cache, filing_type=filing_type)
+        assert cache.stats.hits == 1
+        assert [s.item for s in second.sections[filing_type]] == items
+        assert [s.markdown() for s in second.sections[filing_type]] == [s.markdown() for s in first.sections[filing_type]]
+
+    def test_13d_signature_page_offsets_round_trip(self):
+        pages = [Page(number=1, content=(
+            "  \n\nITEM 1. Security and Issuer\n\nCommon stock.\n\n"
+            "ITEM 2. Identity and Background\n\nReporting person.\n\nSIGNATURE\n\nJohn Doe"
+        ))]
+        cache = ParseCache()
+        cache.put("k", ParsedFiling(pages=pages, sections={"SC 13D": extract_sections(pages, "SC 13D")}))
+        sections = cache.get("k").sections["SC 13D"]
+        assert [s.markdown() for s in sections] == ["Common stock.", "Reporting person."]
+
+    def test_lru_eviction(self):
+        cache = ParseCache(max_entries=1)
+        parse_filing(FILING, parse_cache=cache)
+        parse_filing(FILING, parse_cache=cache, include_elements=False)
+        assert len(cache) == 1
+        assert cache.stats.evictions == 1
+
+    def test_invalid_size(self):
+        with pytest.raises(ValueError):
+            ParseCache(max_entries=0)
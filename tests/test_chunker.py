@@ -10,7 +10,7 @@ from sec2md.chunker.blocks import (
     split_sentences, estimate_tokens,
 )
 from sec2md.chunker.chunk import Chunk
-from sec2md.chunking import chunk_pages, chunk_section, merge_text_blocks, chunk_text_block
+from sec2md.chunking import chunk_filing, chunk_pages, chunk_section, merge_text_blocks, chunk_text_block
 from sec2md.models import Page, Section, Element, TextBlock as ModelTextBlock
 
 
@@ -240,6 +240,163 @@ class TestChunkerTableSplitting:
         assert len(chunks) == 1
 
 
+class TestChunkerWideTableSplitting:
+    """Column-group splitting when row splitting alone cannot meet the budget."""
+
+    @pytest.fixture(autouse=True)
+    def _fast_tokens(self):
+        # Deterministic, offline token estimate (len // 4) keeps these tests fast
+        with patch("sec2md.chunker.chunker.estimate_tokens", side_effect=lambda t: max(1, len(t) // 4)):
+            yield
+
+    @staticmethod
+    def _wide_table(num_cols=12, num_rows=3):
+        header = ["Item"] + [f"FY{2000 + c} Amount" for c in range(1, num_cols)]
+        rows = ["| " + " | ".join(header) + " |", "|" + "|".join(["---"] * num_cols) + "|"]
+        for r in range(num_rows):
+            cells = [f"Line item {r}"] + [f"{r * 1000 + c:,}" for c in range(1, num_cols)]
+            rows.append("| " + " | ".join(cells) + " |")
+        return "\n".join(rows)
+
+    def _split(self, content, max_table_tokens):
+        elem = Element(id="wide", content=content, kind="table", page_start=1, page_end=1)
+        chunker = Chunker(chunk_size=512, chunk_overlap=0, max_table_tokens=max_table_tokens)
+        return chunker._split_table_element(elem, 1)
+
+    def test_wide_table_split_by_columns(self):
+        parts = self._split(self._wide_table(), max_table_tokens=60)
+        assert len(parts) > 1
+        for elem, block in parts:
+            assert len(elem.content) // 4 <= 60
+            assert elem.table_columns is not None
+            # Row-label column is repeated in every part
+            assert elem.content.startswith("| Item |")
+            assert "Line item 2" in elem.content
+
+    def test_column_ranges_cover_all_columns(self):
+        parts = self._split(self._wide_table(num_cols=12), max_table_tokens=60)
+        ranges = sorted({elem.table_columns for elem, _ in parts})
+        assert ranges[0][0] == 1
+        assert ranges[-1][1] == 12
+        for (_, end), (start, _) in zip(ranges, ranges[1:]):
+            assert end == start
+
+    def test_part_ids_sequential(self):
+        parts = self._split(self._wide_table(), max_table_tokens=60)
+        assert [e.id for e, _ in parts] == [f"wide:part-{i}" for i in range(len(parts))]
+        assert all(b.element_ids == [e.id] for e, b in parts)
+
+    def test_narrow_table_keeps_row_split(self):
+        rows = ["| A | B |", "| --- | --- |"] + [f"| Row {i} | {i} |" for i in range(40)]
+        parts = self._split("\n".join(rows), max_table_tokens=40)
+        assert len(parts) > 1
+        assert all(e.table_columns is None for e, _ in parts)
+
+    def test_oversized_cell_wrapped(self):
+        long_text = " ".join(["word"] * 200)
+        content = f"| Label | Note |\n| --- | --- |\n| Risk | {long_text} |"
+        parts = self._split(content, max_table_tokens=80)
+        assert len(parts) > 1
+        for elem, _ in parts:
+            assert len(elem.content) // 4 <= 80
+            assert "| Risk |" in elem.content
+        total_words = sum(e.content.count("word") for e, _ in parts)
+        assert total_words == 200
+
+
+def _reference_row_split(header_line, separator_line, data_rows, budget, count):
+    """Row-by-row packing that re-counts the whole candidate for each row."""
+    ellipsis_row = "|" + "|".join(["..."] * len([c for c in header_line.split("|") if c.strip()])) + "|"
+    parts, row_idx = [], 0
+    while row_idx < len(data_rows):
+        base = [header_line, separator_line] + ([ellipsis_row] if row_idx > 0 else [])
+        rows = []
+        while row_idx < len(data_rows):
+            candidate = base + rows + [data_rows[row_idx]]
+            if row_idx < len(data_rows) - 1:
+                candidate.append(ellipsis_row)
+            over = count("\n".join(candidate)) > budget
+            if over and rows:
+                break
+            rows.append(data_rows[row_idx])
+            row_idx += 1
+            if over:
+                break
+        lines = base + rows + ([ellipsis_row] if row_idx < len(data_rows) else [])
+        parts.append("\n".join(lines))
+    return parts
+
+
+class TestChunkerRowPacking:
+    """Prefix-sum row packing matches row-by-row packing."""
+
+    @staticmethod
+    def _count(text):
+        # Non-additive across lines, like BPE merges
+        return max(1, len(text) // 4)
+
+    def _rows(self, n):
+        return [f"| Row {i} {'x' * (i * 7 % 23)} | {i * 37:,} |" for i in range(n)]
+
+    @pytest.mark.parametrize("budget", [20, 45, 80, 200])
+    def test_identical_to_row_by_row(self, budget):
+        rows = self._rows(150)
+        with patch("sec2md.chunker.chunker.estimate_tokens", side_effect=self._count):
+            chunker = Chunker(chunk_size=512, chunk_overlap=0, max_table_tokens=budget)
+            packed = chunker._pack_table_rows("| Name | Value |", "| --- | --- |", rows)
+        expected = _reference_row_split("| Name | Value |", "| --- | --- |", rows, budget, self._count)
+        assert [content for content, _ in packed] == expected
+        assert all(tokens == self._count(content) for content, tokens in packed)
+
+    def test_tokenizer_calls_linear(self):
+        rows = self._rows(2000)
+        counter = MagicMock(side_effect=self._count)
+        with patch("sec2md.chunker.chunker.estimate_tokens", counter):
+            chunker = Chunker(chunk_size=512, chunk_overlap=0, max_table_tokens=100)
+            packed = chunker._pack_table_rows("| Name | Value |", "| --- | --- |", rows)
+        # One call per row plus a small constant per part
+        assert counter.call_count <= len(rows) + 4 * len(packed) + 4
+
+
+class TestChunkerTableFormat:
+    """Table rendering modes in chunks."""
+
+    def test_rows_format_in_chunks(self):
+        table_content = "| Item | 2024 | 2023 |\n| --- | --- | --- |\n| Revenue | $ 100 | $ 90 |"
+        elem = Element(id="t", content=table_content, kind="table", page_start=1, page_end=1)
+        page = Page(number=1, content=table_content, elements=[elem])
+        chunks = Chunker(chunk_size=512, chunk_overlap=0, table_format="rows").split(pages=[page])
+        assert chunks[0].content == "Item: 2024; 2023\nRevenue: $100; $90"
+        assert chunks[0].element_ids == ["t"]
+
+    def test_split_budgeted_in_chosen_format(self):
+        rows = "\n".join(f"| Row {i} | {i} | {i + 1} |" for i in range(40))
+        table_content = f"| Item | 2024 | 2023 |\n| --- | --- | --- |\n{rows}"
+        elem = Element(id="t", content=table_content, kind="table", page_start=1, page_end=1)
+        page = Page(number=1, content=table_content, elements=[elem])
+
+        # A tokenizer for which the rows rendering costs more than the markdown
+        def tokens(text):
+            return max(1, len(text) // 4) + 10 * text.count(";")
+
+        with patch("sec2md.chunker.blocks.estimate_tokens", side_effect=tokens), \
+                patch("sec2md.chunker.chunker.estimate_tokens", side_effect=tokens):
+            assert tokens(table_content) <= 300
+            markdown = Chunker(chunk_size=4096, chunk_overlap=0, max_table_tokens=300).split(pages=[page])
+            split = Chunker(chunk_size=4096, chunk_overlap=0, max_table_tokens=300,
+                            table_format="rows").split(pages=[page])
+            blocks = [b for c in split for b in c.blocks]
+            assert len([b for c in markdown for b in c.blocks]) == 1
+            assert len(blocks) > 1
+            assert all(b.tokens <= 300 for b in blocks)
+
+    def test_text_fallback_uses_format(self):
+        content = "Intro\n| A | B |\n| --- | --- |\n| x | 1 |"
+        page = Page(number=1, content=content)
+        chunks = Chunker(chunk_size=512, chunk_overlap=0, table_format="tsv").split(pages=[page])
+        assert "A\tB\nx\t1" in chunks[0].content
+
+
 class TestChunkerDisplayPages:
     """Display page mapping in chunks."""
 
@@ -334,6 +491,69 @@ class TestChunkSection:
         assert len(chunks) >= 1
 
 
+def _approx_tokens(text):
+    return max(1, len(text) // 4)
+
+
+class TestChunkFiling:
+    def _pages(self):
+        p1 = "ITEM 1 Business\n\nThe company operates globally.\n\nITEM 1A Risk Factors\n\nRisks begin here."
+        elements = [
+            Element(id="e1", content="ITEM 1 Business\n\nThe company operates globally.", kind="paragraph",
+                    page_start=1, page_end=1, content_start_offset=0, content_end_offset=47),
+            Element(id="e2", content="ITEM 1A Risk Factors\n\nRisks begin here.", kind="paragraph",
+                    page_start=1, page_end=1, content_start_offset=49, content_end_offset=len(p1)),
+        ]
+        return [
+            Page(number=1, content=p1, elements=elements),
+            Page(number=2, content="More risks on the next page."),
+            Page(number=3, content="ITEM 2 Properties\n\nWe lease offices."),
+        ]
+
+    def _chunk(self, pages, **kwargs):
+        with patch("sec2md.chunker.blocks.estimate_tokens", side_effect=_approx_tokens), \
+                patch("sec2md.chunker.chunker.estimate_tokens", side_effect=_approx_tokens):
+            return chunk_filing(pages, "10-K", **kwargs)
+
+    def test_chunks_labelled_with_items(self):
+        chunks = self._chunk(self._pages())
+        assert [c.item for c in chunks] == ["ITEM 1", "ITEM 1A", "ITEM 2"]
+        assert all(c.part == "PART I" for c in chunks)
+        assert [b.page for b in chunks[1].blocks] == [1, 2]
+
+    def test_global_indices(self):
+        chunks = self._chunk(self._pages())
+        assert [c.index for c in chunks] == list(range(len(chunks)))
+
+    def test_chunks_do_not_cross_sections(self):
+        chunks = self._chunk(self._pages())
+        assert "Risks" not in chunks[0].content
+        assert "globally" not in chunks[1].content
+
+    def test_shared_page_elements_split_between_sections(self):
+        chunks = self._chunk(self._pages())
+        assert chunks[0].element_ids == ["e1"]
+        assert chunks[1].element_ids == ["e2"]
+
+    def test_desired_items(self):
+        chunks = self._chunk(self._pages(), desired_items=["ITEM 1A"])
+        assert [c.item for c in chunks] == ["ITEM 1A"]
+        assert chunks[0].index == 0
+
+    def test_13d_signature_page_with_leading_whitespace(self):
+        pages = [Page(number=1, content=(
+            "  \n\nITEM 1. Security and Issuer\n\nCommon stock of Foo.\n\n"
+            "ITEM 2. Identity and Background\n\nReporting person is Bar.\n\nSIGNATURE\n\nJohn Doe"
+        ))]
+        with patch("sec2md.chunker.blocks.estimate_tokens", side_effect=_approx_tokens), \
+                patch("sec2md.chunker.chunker.estimate_tokens", side_effect=_approx_tokens):
+            chunks = chunk_filing(pages, "SC 13D")
+        assert [(c.item, c.content) for c in chunks] == [
+            ("ITEM 1", "Common stock of Foo."),
+            ("ITEM 2", "Reporting person is Bar."),
+        ]
+
+
 class TestMergeTextBlocks:
     def test_merges_same_name_across_pages(self):
         elem1 = Element(id="e1", content="Part 1", kind="paragraph", page_start=1, page_end=1)
@@ -0,0 +1,86 @@
+"""Tests for the cross-reference graph (cross_references.py)."""
+
+import pytest
+
+from sec2md.cross_references import CrossReferenceGraph
+from sec2md.models import Element, Page
+from sec2md.parser import Parser
+
+LONG = "The Company has outstanding fixed-rate notes with varying maturities for an aggregate principal amount. "
+
+HTML = f"""<html><body>
+<p><b>Item 7. Management's Discussion and Analysis</b></p>
+<p>Liquidity is discussed below. For details of our borrowings, see Note 9 – Debt. {LONG * 5}</p>
+<p>Quantitative disclosures are in Part II, Item 7A of this Form 10-K. {LONG * 5}</p>
+<div style="page-break-before:always"><p><b>Item 7A. Quantitative and Qualitative Disclosures About Market Risk</b></p>
+<p>Interest rate risk relates to the notes described in Note 9. {LONG * 5}</p></div>
+<div style="page-break-before:always"><div><ix:nonnumeric name="us-gaap:DebtDisclosureTextBlock" contextref="c1">
+<p><b>Note 9 – Debt</b></p><p>{LONG * 6}</p><p>{LONG * 6}</p></ix:nonnumeric></div></div>
+</body></html>"""
+
+
+@pytest.fixture(autouse=True)
+def _fast_tokens(monkeypatch):
+    monkeypatch.setattr("sec2md.models._count_tokens", lambda text: len(text) // 4)
+
+
+def _element_with(pages, text):
+    return next(e for p in pages for e in p.elements if text in e.content)
+
+
+class TestFromParser:
+    def test_note_reference_resolves_to_text_block(self):
+        parser = Parser(HTML)
+        pages = parser.get_pages()
+        graph = parser.get_cross_references()
+        source = _element_with(pages, "see Note 9")
+        [ref] = graph.references(source.id)
+        assert ref.kind == "note"
+        assert ref.target == "us-gaap:DebtDisclosureTextBlock"
+        assert ref.target_ids == parser.get_text_block("us-gaap:DebtDisclosureTextBlock").element_ids
+
+    def test_item_reference_resolves_to_header(self):
+        parser = Parser(HTML)
+        pages = parser.get_pages()
+        graph = parser.get_cross_references()
+        source = _element_with(pages, "Part II, Item 7A")
+        header = _element_with(pages, "Item 7A. Quantitative")
+        assert graph.neighbors(source.id) == [header.id]
+        assert source.id in graph.referenced_by(header.id)
+
+    def test_self_references_ignored(self):
+        parser = Parser(HTML)
+        pages = parser.get_pages()
+        graph = parser.get_cross_references()
+        header = _element_with(pages, "Item 7A. Quantitative")
+        assert all(ref.kind == "note" for ref in graph.references(header.id))
+
+    def test_cached_per_parse(self):
+        parser = Parser(HTML)
+        parser.get_pages(lazy_elements=True)
+        graph = parser.get_cross_references()
+        assert parser.get_cross_references() is graph
+        assert parser.deferred_pages == []
+
+
+class TestFromPages:
+    def test_header_element_fallback_without_text_blocks(self):
+        elements = [
+            Element(id="a", content="Amounts are described in Note 3.", kind="text", page_start=1, page_end=1),
+            Element(id="b", content="**Note 3. Leases**\n\nLease terms.", kind="section", page_start=1, page_end=1),
+            Element(id="c", content="Please note that nothing refers here.", kind="text", page_start=1, page_end=1),
+        ]
+        graph = CrossReferenceGraph.from_pages([Page(number=1, content="", elements=elements)])
+        assert graph.neighbors("a") == ["b"]
+        assert graph.references("a")[0].target == "NOTE 3"
+        assert graph.neighbors("c") == []
+
+    def test_table_of_contents_not_a_target(self):
+        toc = "Item 1. Business\nItem 1A. Risk Factors\nItem 2. Properties\nItem 3. Legal"
+        elements = [
+            Element(id="toc", content=toc, kind="text", page_start=1, page_end=1),
+            Element(id="ref", content="As described in Item 1A, risks exist.", kind="text", page_start=2, page_end=2),
+        ]
+        graph = CrossReferenceGraph.from_pages([Page(number=1, content="", elements=elements)])
+        assert graph.items == {}
+        assert len(graph) == 0
@@ -0,0 +1,97 @@
+"""Tests for element grouping and IDs (element_builder.py)."""
+
+from bs4 import BeautifulSoup
+
+from sec2md.element_builder import _group_segments_into_blocks, _merge_small_blocks, _is_bold_header
+from sec2md.parser import Parser
+
+LONG = (
+    "The Company designs, manufactures and markets smartphones, personal computers, tablets, "
+    "wearables and accessories, and sells a variety of related services. "
+)
+
+HTML = f"""<html><body>
+<p><b>Overview</b></p>
+<p>{LONG * 2}</p>
+<p>{LONG * 3}</p>
+<table><tr><td>Item</td><td>2024</td></tr><tr><td>Revenue</td><td><ix:nonfraction name="us-gaap:Revenues" contextref="c1">391</ix:nonfraction></td></tr></table>
+<p><b>Risk Factors</b></p>
+<p>Short.</p>
+<p><span>x</span> and <span>x</span></p>
+<h2>Item 7</h2>
+<p>{LONG * 4}</p>
+</body></html>"""
+
+
+class TestElementIds:
+    def test_ids_stable(self):
+        """Stored citations depend on these exact IDs."""
+        elements = [e for p in Parser(HTML).get_pages() for e in (p.elements or [])]
+        assert [(e.id, e.kind, e.tags) for e in elements] == [
+            ("sec2md-p1-t0-649f4d1d", "text", None),
+            # Standalone tables keep their pre-merge block index
+            ("sec2md-p1-t3-28b01932", "table", ["us-gaap:Revenues"]),
+            ("sec2md-p1-s2-b72e56c7", "section", None),
+        ]
+
+    def test_identical_looking_nodes_all_annotated(self):
+        html = Parser(HTML)
+        html.get_pages()
+        soup = BeautifulSoup(html.html(), "lxml")
+        spans = [s for s in soup.find_all("span") if s.get_text() == "x"]
+        assert len(spans) == 2
+        assert all(s.get("data-sec2md-block") for s in spans)
+
+
+class TestGrouping:
+    def _blocks(self, soup_html):
+        soup = BeautifulSoup(soup_html, "lxml")
+        a, b = soup.find_all("p")
+        segments = [("**Title**", a, None, ()), ("\n", None, None, ()), ("\n", None, None, ()), ("Body text", b, None, ())]
+        return _group_segments_into_blocks(segments, 1)
+
+    def test_split_on_blank_line(self):
+        blocks = self._blocks("<p>A</p><p>B</p>")
+        assert [b.content for b in blocks] == ["**Title**", "Body text"]
+        assert [b.idx for b in blocks] == [0, 1]
+        assert blocks[0].bold_header and not blocks[1].bold_header
+
+    def test_header_kept_with_content(self):
+        merged = _merge_small_blocks(self._blocks("<p>A</p><p>B</p>"), 1)
+        assert len(merged) == 1
+        element, nodes, _, _ = merged[0]
+        assert element.content == "**Title**\n\nBody text"
+        assert element.id.startswith("sec2md-p1-p0-")
+        assert [n.name for n in nodes] == ["p", "p"]
+
+    def test_is_bold_header(self):
+        assert _is_bold_header("**Item 1. Business**")
+        assert not _is_bold_header("**A sentence. With. Periods.**")
+        assert not _is_bold_header("plain")
+
+
+FACT_HTML = f"""<html><body>
+<p>Net sales were <span><ix:nonfraction name="us-gaap:Revenues" contextref="c1">391</ix:nonfraction></span> billion. {LONG * 2}</p>
+<p>{LONG * 3}</p>
+<p>Shares outstanding: <ix:nonfraction name="dei:EntityCommonStockSharesOutstanding" contextref="c2">15</ix:nonfraction>. {LONG * 3}</p>
+<div style="display:none"><ix:nonnumeric name="dei:DocumentType" contextref="c1">10-K</ix:nonnumeric></div>
+</body></html>"""
+
+
+class TestConceptIndex:
+    def test_nested_facts_tag_element(self):
+        elements = [e for p in Parser(FACT_HTML).get_pages() for e in (p.elements or [])]
+        assert elements[0].tags == ["us-gaap:Revenues"]
+        assert any(e.tags == ["dei:EntityCommonStockSharesOutstanding"] for e in elements)
+
+    def test_lookup_by_concept(self):
+        parser = Parser(FACT_HTML)
+        pages = parser.get_pages()
+        ids = parser.get_elements_for_concept("us-gaap:Revenues")
+        assert ids == [pages[0].elements[0].id]
+        assert parser.get_elements_for_concept("us-gaap:Missing") == []
+
+    def test_hidden_facts_not_indexed(self):
+        parser = Parser(FACT_HTML)
+        parser.get_pages()
+        assert "dei:DocumentType" not in parser.concept_index
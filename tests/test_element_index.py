@@ -0,0 +1,77 @@
+"""Tests for the element interval index (element_index.py)."""
+
+import json
+import random
+
+from sec2md.element_index import ElementIndex
+from sec2md.models import Element, Page
+
+
+def _element(eid, page, start, end):
+    return Element(
+        id=eid, content="x" * (end - start), kind="text",
+        page_start=page, page_end=page,
+        content_start_offset=start, content_end_offset=end,
+    )
+
+
+def _pages():
+    return [
+        Page(number=1, content="", elements=[
+            _element("a", 1, 0, 10), _element("b", 1, 12, 30), _element("c", 1, 30, 45),
+        ]),
+        Page(number=2, content="", elements=[
+            _element("d", 2, 0, 50),
+            Element(id="nooffset", content="y", kind="text", page_start=2, page_end=2),
+        ]),
+    ]
+
+
+class TestQueries:
+    def test_locate(self):
+        index = ElementIndex.from_pages(_pages())
+        assert index.locate(1, 0) == "a"
+        assert index.locate(1, 9) == "a"
+        assert index.locate(1, 10) is None   # gap between a and b
+        assert index.locate(1, 30) == "c"    # end is exclusive
+        assert index.locate(2, 49) == "d"
+        assert index.locate(3, 0) is None
+
+    def test_overlapping(self):
+        index = ElementIndex.from_pages(_pages())
+        assert index.overlapping(1, 5, 13) == ["a", "b"]
+        assert index.overlapping(1, 10, 12) == []
+        assert index.overlapping(1, 0, 100) == ["a", "b", "c"]
+
+    def test_within(self):
+        index = ElementIndex.from_pages(_pages())
+        assert index.within(1, 0, 30) == ["a", "b"]
+        assert index.within(1, 1, 45) == ["b", "c"]
+
+    def test_elements_without_offsets_skipped(self):
+        assert len(ElementIndex.from_pages(_pages())) == 4
+
+    def test_matches_linear_scan(self):
+        rng = random.Random(7)
+        rows = []
+        for i in range(300):
+            start = rng.randrange(0, 2000)
+            rows.append((start, start + rng.randrange(1, 120), f"e{i}"))
+        page = Page(number=1, content="", elements=[_element(eid, 1, s, e) for s, e, eid in rows])
+        index = ElementIndex.from_pages([page])
+        ordered = sorted(rows, key=lambda r: r[0])
+        for _ in range(200):
+            a = rng.randrange(0, 2100)
+            b = a + rng.randrange(1, 200)
+            hits = [r for r in ordered if r[0] <= a < r[1]]
+            assert index.locate(1, a) == (hits[-1][2] if hits else None)
+            assert index.overlapping(1, a, b) == [r[2] for r in ordered if r[0] < b and r[1] > a]
+            assert index.within(1, a, b) == [r[2] for r in ordered if a <= r[0] and r[1] <= b]
+
+
+class TestSerialization:
+    def test_round_trip_json(self):
+        index = ElementIndex.from_pages(_pages())
+        restored = ElementIndex.from_dict(json.loads(json.dumps(index.to_dict())))
+        assert restored.to_dict() == index.to_dict()
+        assert restored.locate(1, 20) == "b"
@@ -0,0 +1,87 @@
+"""Tests for chunked HTML serialization (html_writer.py)."""
+
+import io
+
+import pytest
+
+from sec2md.html_writer import iter_html, write_html
+from sec2md.parser import Parser
+
+LONG = "Revenue & other income rose <5%> year over year — driven by “Services”. "
+
+HTML = f"""<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>10-K</title>
+<script>if (a < b && c > d) {{ run(); }}</script></head>
+<body class="filing main" data-x='say "hi"'>
+<!-- cover page -->
+<div><p style="font-weight:bold"><b>Overview</b></p><p>{LONG * 4}</p>
+<div><ix:nonNumeric name="us-gaap:DebtDisclosureTextBlock" contextRef="c1"><p>{LONG * 3}</p>
+<p>Total <ix:nonFraction name="us-gaap:Revenues" contextRef="c1" unitRef="usd">391,035</ix:nonFraction></p>
+</ix:nonNumeric></div></div>
+<table><tr><td>Revenue</td><td>391</td></tr></table><br/><hr>
+<div style="page-break-before:always"><ul><li>{LONG}</li><li><div>{LONG * 2}</div></li></ul></div>
+<div style="page-break-before:always"><p>{LONG * 5}</p></div>
+</body></html>"""
+
+
+@pytest.fixture(autouse=True)
+def _fast_tokens(monkeypatch):
+    monkeypatch.setattr("sec2md.models._count_tokens", lambda text: len(text) // 4)
+
+
+class TestIterHtml:
+    def test_matches_str(self):
+        parser = Parser(HTML)
+        parser.get_pages()
+        assert "".join(iter_html(parser.soup)) == str(parser.soup)
+
+    def test_split_at_block_level(self):
+        parser = Parser(HTML)
+        pieces = list(iter_html(parser.soup))
+        assert len(pieces) > 20
+        assert any(piece.startswith("<table>") and piece.endswith("</table>") for piece in pieces)
+        assert max(len(piece) for piece in pieces) < len(str(parser.soup)) / 4
+
+    def test_subtree(self):
+        parser = Parser(HTML)
+        ul = parser.soup.find("ul")
+        assert "".join(iter_html(ul)) == str(ul)
+
+
+class TestWriteHtml:
+    def test_text_stream_equals_html(self):
+        parser = Parser(HTML)
+        parser.get_pages()
+        buf = io.StringIO()
+        written = parser.write_html(buf)
+        assert buf.getvalue() == parser.html()
+        assert written == len(buf.getvalue())
+
+    def test_binary_stream_is_utf8(self):
+        parser = Parser(HTML)
+        parser.get_pages()
+        buf = io.BytesIO()
+        parser.write_html(buf)
+        assert buf.getvalue() == parser.html().encode("utf-8")
+
+    def test_buffered_writes(self):
+        parser = Parser(HTML)
+        chunks = []
+
+        class Sink:
+            def write(self, data):
+                chunks.append(data)
+
+        write_html(parser.soup, Sink(), buffer_size=256)
+        assert len(chunks) >= 4
+        assert "".join(chunks) == str(parser.soup)
+
+    def test_lazy_pages_materialized(self):
+        eager, lazy = Parser(HTML), Parser(HTML)
+        eager.get_pages()
+        lazy.get_pages(lazy_elements=True)
+        buf = io.StringIO()
+        lazy.write_html(buf)
+        assert lazy.deferred_pages == []
+        assert buf.getvalue() == eager.html()
+        assert 'data-sec2md-block="' in buf.getvalue()
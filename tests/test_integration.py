@@ -181,6 +181,21 @@ class TestChunking:
         for chunk in chunks:
             assert chunk.embedding_text.startswith("Apple Inc.")
 
+    def test_table_format_token_reduction(self):
+        _skip_if_missing()
+        html = _load_html()
+        pages = sec2md.parse_filing(html, include_elements=True)
+
+        def table_tokens(fmt):
+            chunks = sec2md.chunk_pages(pages, chunk_size=512, table_format=fmt)
+            return sum(b.tokens for c in chunks for b in c.blocks if b.block_type == "Table")
+
+        baseline = table_tokens("markdown")
+        assert 0 < table_tokens("compact") < baseline
+        assert 0 < table_tokens("tsv") < baseline
+        # "rows" is roughly flat against markdown; it must not grow the tables
+        assert 0 < table_tokens("rows") <= baseline
+
 
 # ---------------------------------------------------------------------------
 # Invariants
@@ -0,0 +1,84 @@
+"""Tests for the positioned-layout index (layout.py)."""
+
+from bs4 import BeautifulSoup, Tag
+
+from sec2md.layout import LayoutIndex, PositionedBox, extract_top_px, is_spacer
+from sec2md.parser import Parser
+
+
+def _container(inner: str) -> Tag:
+    soup = BeautifulSoup(f'<html><body><div id="page" style="position:relative">{inner}</div></body></html>', "lxml")
+    return soup.find("div", id="page")
+
+
+def _box(html: str) -> PositionedBox:
+    return PositionedBox.from_tag(BeautifulSoup(html, "lxml").find("div"))
+
+
+class TestPositionedBox:
+    def test_coordinates_and_text(self):
+        box = _box('<div style="position:absolute; left:12.5px; top:40px; font-weight:bold">  Net\xa0sales </div>')
+        assert box.position == (12.5, 40.0)
+        assert box.y == 40.0
+        assert box.text == "Net sales"
+        assert box.bold
+        assert not box.spacer
+
+    def test_bottom_anchor_sets_y_only(self):
+        box = _box('<div style="position:absolute; left:10px; bottom:100px">Footer</div>')
+        assert box.top is None
+        assert box.position is None
+        assert box.y == extract_top_px("bottom:100px") == 9900.0
+
+    def test_spacer(self):
+        box = _box('<div style="position:absolute; display:inline-block; width:5px; left:50px; top:10px">&nbsp;</div>')
+        assert box.spacer
+        assert not box.text
+
+    def test_wide_inline_block_not_spacer(self):
+        el = BeautifulSoup('<div style="display:inline-block; width:80px">&nbsp;</div>', "lxml").find("div")
+        assert not is_spacer(el)
+
+    def test_spacer_check_skips_serialization_for_text_boxes(self, monkeypatch):
+        el = BeautifulSoup('<div style="position:absolute; left:1px; top:1px">Text</div>', "lxml").find("div")
+
+        def _fail(self, *args, **kwargs):
+            raise AssertionError("node should not be serialized")
+
+        monkeypatch.setattr(Tag, "decode", _fail)
+        assert not is_spacer(el)
+
+
+class TestLayoutIndex:
+    def test_from_container_keeps_text_and_spacers(self):
+        container = _container(
+            '<div style="position:absolute; left:10px; top:10px">Hello</div>'
+            '<div style="position:absolute; display:inline-block; width:5px; left:60px; top:10px">&nbsp;</div>'
+            '<div style="position:absolute; left:70px; top:10px"></div>'
+            '<div style="left:80px; top:10px">Static</div>'
+        )
+        index = LayoutIndex.from_container(container)
+        assert len(index) == 2
+        assert [box.spacer for box in index] == [False, True]
+
+    def test_each_box_measured_once(self, monkeypatch):
+        rows = []
+        for r in range(1000):
+            y = 20 + r * 18
+            rows.append(f'<div style="position:absolute; left:10px; top:{y}px">Item {r}</div>')
+            rows.append(f'<div style="position:absolute; display:inline-block; width:5px; left:150px; top:{y}px">&nbsp;</div>')
+            for c in range(3):
+                rows.append(f'<div style="position:absolute; left:{250 + c * 120}px; top:{y}px">{r * 10 + c:,}</div>')
+        html = '<html><body><div style="position:relative">' + "".join(rows) + "</div></body></html>"
+
+        calls = []
+        original = PositionedBox.from_tag.__func__
+
+        def _counting(cls, el):
+            calls.append(el)
+            return original(cls, el)
+
+        monkeypatch.setattr(PositionedBox, "from_tag", classmethod(_counting))
+        md = Parser(html).markdown()
+        assert len(calls) == 5000
+        assert "Item 999" in md
@@ -0,0 +1,135 @@
+"""Tests for the structured markdown table view (markdown_table.py)."""
+
+from pathlib import Path
+
+import pytest
+
+from sec2md.markdown_table import (
+    MarkdownTable, TableFormat, compact_cell, render_tables,
+    split_row, is_separator_row, render_row,
+)
+from sec2md.chunker.blocks import TableBlock, estimate_tokens
+
+GOLDEN_FULL = Path(__file__).parent / "golden" / "full.md"
+
+FINANCIAL = """|  | 2024 | 2023 |  |
+| --- | --- | --- | --- |
+| Operating activities: |  |  |  |
+| Net income | $ 93,736 | ( 2,266 ) |  |
+| Margin | 45.2 % |  |  |"""
+
+
+class TestRowHelpers:
+    def test_split_row(self):
+        assert split_row("| a | b |") == ["a", "b"]
+
+    def test_split_row_keeps_escaped_pipe(self):
+        assert split_row(r"| a \| b | c |") == [r"a \| b", "c"]
+
+    def test_separator_detection(self):
+        assert is_separator_row("| --- | :---: |")
+        assert not is_separator_row("| - | x |")
+
+    def test_render_row(self):
+        assert render_row(["a", "b"]) == "| a | b |"
+
+
+class TestMarkdownTable:
+    def test_round_trip(self):
+        md = "| A | B |\n| --- | --- |\n| 1 | 2 |"
+        assert MarkdownTable.from_markdown(md).to_markdown() == md
+
+    def test_pads_ragged_rows(self):
+        table = MarkdownTable.from_markdown("| A | B | C |\n| --- | --- | --- |\n| 1 |")
+        assert table.rows == [["1", "", ""]]
+        assert table.num_columns == 3
+
+    def test_select_columns(self):
+        table = MarkdownTable.from_markdown("| A | B | C |\n| --- | --- | --- |\n| 1 | 2 | 3 |")
+        sub = table.select_columns([0, 2])
+        assert sub.header == ["A", "C"]
+        assert sub.rows == [["1", "3"]]
+
+    def test_empty(self):
+        assert MarkdownTable.from_markdown("").to_markdown() == ""
+
+
+class TestCompactCell:
+    @pytest.mark.parametrize("raw,expected", [
+        ("$ 93,736", "$93,736"),
+        ("( 2,266 )", "(2,266)"),
+        ("45.2 %", "45.2%"),
+        ("  Net   income ", "Net income"),
+        ("Total $", "Total $"),
+    ])
+    def test_compact_cell(self, raw, expected):
+        assert compact_cell(raw) == expected
+
+
+class TestRenderModes:
+    def test_compact_drops_empty_columns(self):
+        table = MarkdownTable.from_markdown(FINANCIAL).compacted()
+        assert table.header == ["", "2024", "2023"]
+        assert table.rows[1] == ["Net income", "$93,736", "(2,266)"]
+
+    def test_compact_markdown(self):
+        out = MarkdownTable.from_markdown(FINANCIAL).render(TableFormat.COMPACT)
+        assert out.split("\n")[:2] == ["||2024|2023|", "|-|-|-|"]
+        assert "|Net income|$93,736|(2,266)|" in out
+
+    def test_rows(self):
+        out = MarkdownTable.from_markdown(FINANCIAL).render("rows")
+        assert out.split("\n") == [
+            "2024; 2023",
+            "Operating activities:",
+            "Net income: $93,736; (2,266)",
+            "Margin: 45.2%",
+        ]
+
+    def test_rows_keep_inner_empty_slots(self):
+        md = "| A | X | Y | Z |\n| --- | --- | --- | --- |\n| r | 1 |  | 3 |"
+        assert MarkdownTable.from_markdown(md).to_rows().split("\n")[1] == "r: 1; ; 3"
+
+    def test_tsv(self):
+        out = MarkdownTable.from_markdown(FINANCIAL).render("tsv")
+        assert out.split("\n")[2] == "Net income\t$93,736\t(2,266)"
+
+    def test_ellipsis_rows(self):
+        md = "| A | B |  |\n| --- | --- | --- |\n| ... | ... | ... |\n| r | 1 |  |"
+        assert MarkdownTable.from_markdown(md).to_rows().split("\n") == ["A: B", "...", "r: 1"]
+
+    def test_invalid_format(self):
+        with pytest.raises(ValueError):
+            MarkdownTable.from_markdown(FINANCIAL).render("html")
+
+    def test_render_tables_leaves_text(self):
+        text = "Intro line\n" + FINANCIAL + "\nClosing line"
+        out = render_tables(text, "rows")
+        assert out.startswith("Intro line\n2024; 2023")
+        assert out.endswith("Closing line")
+
+    def test_markdown_is_identity(self):
+        assert render_tables(FINANCIAL, TableFormat.MARKDOWN) == FINANCIAL
+
+    def test_table_block_renders_format(self):
+        block = TableBlock(content=FINANCIAL, page=1, table_format="tsv")
+        assert "\t" in block.content
+        assert "|" not in block.content
+
+    @pytest.mark.skipif(not GOLDEN_FULL.exists(), reason="golden markdown not present")
+    def test_token_reduction_on_golden(self):
+        text = GOLDEN_FULL.read_text(encoding="utf-8")
+        tables = [t for t in text.split("\n\n") if t.lstrip().startswith("|")]
+        assert tables
+
+        def tokens(render):
+            return estimate_tokens("\n\n".join(render(t) for t in tables))
+
+        minified = tokens(TableBlock._to_minified_markdown_static)
+        # Measured on the 54 golden tables (char/4 estimate): markdown 9433,
+        # compact 9105 (-3.5%), tsv 8686 (-7.9%), rows 8976. "rows" trades
+        # pipes for labels and is roughly flat under cl100k_base, so it is
+        # only required not to grow the tables.
+        assert tokens(lambda t: render_tables(t, TableFormat.COMPACT)) < minified
+        assert tokens(lambda t: render_tables(t, TableFormat.TSV)) < minified
+        assert tokens(lambda t: render_tables(t, TableFormat.ROWS)) <= minified
@@ -10,6 +10,7 @@ from sec2md.models import (
     ITEM_10K_MAPPING, ITEM_10Q_MAPPING, ITEM_8K_TITLES,
     _count_tokens,
 )
+from sec2md.text_buffer import PageSpan
 
 
 class TestCountTokens:
@@ -32,6 +33,13 @@ class TestElement:
         assert elem.char_count == 11
         assert elem.tokens >= 1
 
+    def test_formatted_table(self):
+        content = "| Item | 2024 |\n| --- | --- |\n| Revenue | $ 100 |"
+        elem = Element(id="t1", content=content, kind="table", page_start=1, page_end=1)
+        assert elem.formatted() == content
+        assert elem.formatted("rows") == "Item: 2024\nRevenue: $100"
+        assert elem.formatted("tsv") == "Item\t2024\nRevenue\t$100"
+
 
 class TestPage:
     def test_tokens_computed(self):
@@ -82,6 +90,47 @@ class TestSection:
         assert "---" in section.content
         assert "---" not in section.markdown()
 
+    def _view(self):
+        pages = [Page(number=1, content="Intro.\n\nITEM 1 Business\n\nText."), Page(number=2, content="More text.")]
+        spans = [PageSpan(pages[0], 8, len(pages[0].content)), PageSpan(pages[1], 0, 10)]
+        return pages, Section.from_spans(spans, part="PART I", item="ITEM 1")
+
+    def test_view_builds_pages_lazily(self):
+        pages, section = self._view()
+        assert "pages" not in section.__dict__
+        assert section.page_range == (1, 2)
+        assert section.markdown() == "ITEM 1 Business\n\nText.\n\nMore text."
+        assert section.content == "ITEM 1 Business\n\nText.\n\n---\n\nMore text."
+        assert "pages" not in section.__dict__
+        assert [p.content for p in section.pages] == ["ITEM 1 Business\n\nText.", "More text."]
+        assert section.pages[1] is not pages[1]
+
+    def test_view_tokens_counted_once(self):
+        _, section = self._view()
+        with patch("sec2md.models._count_tokens", return_value=3) as count:
+            assert section.tokens == 6
+            assert section.tokens == 6
+        assert count.call_count == 2
+
+    def test_view_serializes_pages(self):
+        _, section = self._view()
+        data = section.model_dump()
+        assert [p["content"] for p in data["pages"]] == ["ITEM 1 Business\n\nText.", "More text."]
+        assert data["page_range"] == (1, 2)
+
+    def test_cleaned_span_reads_page_content(self):
+        page = Page(number=1, content="Intro.\nITEM 1 Business\n12\nText.\nApple | 2024 Form 10-K | 3")
+        span = PageSpan(page, 7, 31, trim_start=5, trim_end=1, clean=lambda text: text.replace("\n12", ""))
+        section = Section.from_spans([span], part="PART I", item="ITEM 1")
+        assert section.markdown() == "1 Business\nText"
+
+    def test_assigning_pages_resets_caches(self):
+        _, section = self._view()
+        assert section.markdown().startswith("ITEM 1")
+        section.pages = [Page(number=4, content="Replaced")]
+        assert section.markdown() == "Replaced"
+        assert section.page_range == (4, 4)
+
 
 class TestTextBlock:
     def test_element_ids(self):
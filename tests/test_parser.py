@@ -3,6 +3,7 @@
 import re
 
 import pytest
+from bs4 import BeautifulSoup
 
 from sec2md.parser import Parser
 from sec2md.absolute_table_parser import AbsolutelyPositionedTableParser
@@ -232,6 +233,71 @@ class TestOneRowTable:
         assert "PART II" in pages[0].content
 
 
+class TestLayoutTables:
+    """One-cell wrapper tables are streamed as normal flow, not parsed as data."""
+
+    NOTE = """<html><body>
+    <table><tr><td>
+        <div><b>Note 7 - Debt</b></div>
+        <p>The Company issued notes during the year.</p>
+        <table>
+            <tr><td>Maturity</td><td>Amount</td></tr>
+            <tr><td>2026</td><td>1,000</td></tr>
+            <tr><td>2027</td><td>2,000</td></tr>
+        </table>
+        <p>Interest is payable semi-annually.</p>
+    </td></tr></table>
+    </body></html>"""
+
+    def test_wrapper_content_keeps_block_structure(self):
+        content = Parser(self.NOTE).get_pages(include_elements=False)[0].content
+        assert "**Note 7 - Debt**\n\nThe Company issued notes during the year." in content
+        assert "| Maturity | Amount |" in content
+        assert content.rstrip().endswith("Interest is payable semi-annually.")
+
+    def test_only_inner_table_is_parsed(self, monkeypatch):
+        from sec2md import parser as parser_module
+        parsed = []
+        original = parser_module.TableParser
+
+        class RecordingTableParser(original):
+            def __init__(self, table_element):
+                parsed.append(table_element)
+                super().__init__(table_element)
+
+        monkeypatch.setattr(parser_module, "TableParser", RecordingTableParser)
+        Parser(self.NOTE).get_pages(include_elements=False)
+        assert len(parsed) == 1
+        assert "Maturity" in parsed[0].get_text()
+
+    def test_sole_wrapper_div_is_descended(self):
+        html = """<html><body><table><tbody><tr><td><div>
+            <p>First paragraph.</p><p>Second paragraph.</p>
+        </div></td></tr></tbody></table></body></html>"""
+        content = Parser(html).get_pages(include_elements=False)[0].content
+        assert "First paragraph.\n\nSecond paragraph." in content
+
+    def test_spacer_rows_do_not_disqualify(self):
+        html = """<html><body><table>
+            <tr><td style="height:10px"></td></tr>
+            <tr><td><p>Alpha.</p><p>Beta.</p></td></tr>
+        </table></body></html>"""
+        content = Parser(html).get_pages(include_elements=False)[0].content
+        assert "Alpha.\n\nBeta." in content
+
+    def test_single_text_cell_unchanged(self):
+        html = "<html><body><table><tr><td><p>Just one line</p></td></tr></table></body></html>"
+        content = Parser(html).get_pages(include_elements=False)[0].content
+        assert content == "Just one line"
+
+    def test_data_table_not_unwrapped(self):
+        parser = Parser("<html><body></body></html>")
+        table = BeautifulSoup(
+            "<table><tr><td>A</td><td>1</td></tr><tr><td><p>x</p><p>y</p></td></tr></table>", "lxml"
+        ).find("table")
+        assert parser._layout_cell(table) is None
+
+
 class TestSpacerPreservation:
     """Regression: spacer divs with &nbsp; must not be dropped before table parsing."""
 
@@ -247,3 +313,56 @@ class TestSpacerPreservation:
         container = parser.soup.find("div", style=re.compile("position:relative"))
         children = parser._extract_absolutely_positioned_children(container)
         assert len(children) == 3, f"Expected 3 children (including spacer), got {len(children)}"
+
+
+LAZY_HTML = """<html><body>
+<p>First page paragraph with enough words to stand alone as an element.</p>
+<div style="page-break-before:always"><p>Second page <ix:nonfraction name="us-gaap:Revenues" contextref="c1">391</ix:nonfraction> text.</p></div>
+<div style="page-break-before:always"><p>Third page text.</p></div>
+</body></html>"""
+
+
+class TestLazyElements:
+    """get_pages(lazy_elements=True) builds elements per page on first access."""
+
+    @pytest.fixture(autouse=True)
+    def _fast_tokens(self, monkeypatch):
+        monkeypatch.setattr("sec2md.models._count_tokens", lambda text: len(text) // 4)
+
+    def test_deferred_until_access(self):
+        pages = Parser(LAZY_HTML).get_pages(lazy_elements=True)
+        assert not any(p.elements_loaded for p in pages)
+        assert pages[1].elements
+        assert [p.elements_loaded for p in pages] == [False, True, False]
+
+    def test_same_result_as_eager(self):
+        eager, lazy = Parser(LAZY_HTML), Parser(LAZY_HTML)
+        eager_pages = eager.get_pages()
+        lazy_pages = lazy.get_pages(lazy_elements=True)
+        assert [p.model_dump() for p in lazy_pages] == [p.model_dump() for p in eager_pages]
+        assert lazy.html() == eager.html()
+
+    def test_only_accessed_pages_annotated(self):
+        parser = Parser(LAZY_HTML)
+        pages = parser.get_pages(lazy_elements=True)
+        pages[0].elements
+        annotated = parser.soup.find_all(attrs={"data-sec2md-block": True})
+        assert {tag["data-sec2md-block"].split("-")[1] for tag in annotated} == {"p1"}
+
+    def test_materialize_all(self):
+        parser = Parser(LAZY_HTML)
+        pages = parser.get_pages(lazy_elements=True)
+        parser.materialize_all()
+        assert all(p.elements_loaded for p in pages)
+        assert parser.deferred_pages == []
+
+    def test_concept_lookup_materializes(self):
+        parser = Parser(LAZY_HTML)
+        pages = parser.get_pages(lazy_elements=True)
+        assert parser.get_elements_for_concept("us-gaap:Revenues") == [pages[1].elements[0].id]
+
+    def test_assignment_replaces_deferred(self):
+        page = Parser(LAZY_HTML).get_pages(lazy_elements=True)[0]
+        page.elements = []
+        assert page.elements == []
+        assert page.elements_loaded
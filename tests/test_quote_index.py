@@ -0,0 +1,106 @@
+"""Tests for quote-to-element lookup (quote_index.py)."""
+
+import os
+import pickle
+import subprocess
+import sys
+
+import pytest
+
+from sec2md.models import Element, Page
+from sec2md.quote_index import QuoteIndex, tokenize
+
+
+def _element(eid, content, page=1):
+    return Element(id=eid, content=content, kind="text", page_start=page, page_end=page)
+
+
+PAGES = [
+    Page(number=1, content="", elements=[
+        _element("e1", "**Net sales** increased 2% to $391.0 billion during 2024 compared to 2023, "
+                       "driven primarily by higher net sales of Services."),
+        _element("e2", "The Company is exposed to credit risk on its trade accounts receivable "
+                       "and vendor non-trade receivables."),
+    ]),
+    Page(number=2, content="", elements=[
+        _element("e3", "| Segment | 2024 |\n| --- | --- |\n| Americas | $ 167,045 |\n| Europe | 101,328 |", page=2),
+    ]),
+]
+
+
+@pytest.fixture
+def index():
+    idx = QuoteIndex()
+    idx.add_pages(PAGES, source="0000320193-24-000123")
+    return idx
+
+
+class TestTokenize:
+    def test_drops_markdown_and_keeps_numbers(self):
+        assert [t for t, _, _ in tokenize("**Net sales** of $391.0 | 1,234")] == ["net", "sales", "of", "391.0", "1,234"]
+
+    def test_offsets_point_into_text(self):
+        text = "A  **Bold**"
+        assert [text[s:e] for _, s, e in tokenize(text)] == ["A", "Bold"]
+
+
+class TestSearch:
+    def test_verbatim_quote(self, index):
+        [match] = index.search("net sales increased 2% to $391.0 billion", top_k=1)
+        assert match.element_id == "e1"
+        assert match.source == "0000320193-24-000123"
+        assert match.score == 1.0
+        assert match.element.content[match.start:match.end] == "Net sales** increased 2% to $391.0 billion"
+
+    def test_near_verbatim_quote(self, index):
+        quote = "The company is exposed to credit risk on trade accounts receivable and vendor receivables"
+        match = index.search(quote)[0]
+        assert match.element_id == "e2"
+        assert 0.3 <= match.score < 1.0
+
+    def test_table_cells(self, index):
+        assert index.search("Americas $167,045 Europe")[0].element_id == "e3"
+
+    def test_short_quote_uses_postings(self, index, monkeypatch):
+        seen = []
+        monkeypatch.setattr("sec2md.quote_index.tokenize", lambda text: seen.append(text) or tokenize(text))
+        assert [m.element_id for m in index.search("Europe")] == ["e3"]
+        # The quote and the matched element only; other elements are not re-read
+        assert len(seen) == 2
+
+    def test_short_quotes(self, index):
+        assert [m.element_id for m in index.search("net sales")] == ["e1"]
+        [match] = index.search("Services")
+        assert match.element.content[match.start:match.end] == "Services"
+        assert [m.element_id for m in index.search("receivable", top_k=5)] == ["e2"]
+        assert index.search("sales net") == []
+        [match] = index.search("net sales")
+        assert (match.start, match.end) == (2, 11)
+
+    def test_pickled_index_loads_in_another_process(self, index, tmp_path):
+        path = tmp_path / "index.pkl"
+        path.write_bytes(pickle.dumps(index))
+        code = (
+            "import pickle, sys\n"
+            "idx = pickle.loads(open(sys.argv[1], 'rb').read())\n"
+            "print(idx.search('trade accounts receivable')[0].element_id, idx.search('Europe')[0].element_id)\n"
+        )
+        env = dict(os.environ, PYTHONHASHSEED="12345")
+        out = subprocess.run([sys.executable, "-c", code, str(path)], env=env,
+                             capture_output=True, text=True, check=True)
+        assert out.stdout.split() == ["e2", "e3"]
+
+    def test_no_match(self, index):
+        assert index.search("completely unrelated sentence about weather patterns") == []
+        assert index.search("   ") == []
+
+    def test_multiple_filings(self):
+        idx = QuoteIndex()
+        idx.add_pages(PAGES, source="a")
+        idx.add_elements([_element("e1", "Operating income was $123.2 billion in fiscal 2024.")], source="b")
+        match = idx.search("operating income was $123.2 billion")[0]
+        assert (match.source, match.element_id) == ("b", "e1")
+
+    def test_invalid_ngram(self):
+        with pytest.raises(ValueError):
+            QuoteIndex(ngram=0)
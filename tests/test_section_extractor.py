@@ -3,7 +3,7 @@
 import pytest
 
 from sec2md.section_extractor import SectionExtractor, ITEM_PATTERN, PART_PATTERN
-from sec2md.sections import extract_sections, get_section
+from sec2md.sections import extract_sections, iter_sections, get_section
 from sec2md.models import Page, Section, Item10K, Item10Q, Item13D, Item13G
 
 
@@ -140,6 +140,54 @@ class TestSectionExtractorStandard:
         item7_sections = [s for s in sections if s.item == "ITEM 7"]
         assert len(item7_sections) <= 1
 
+    def test_part_promoted_to_first_item(self):
+        pages = self._make_pages([
+            "PART II\n\nIntro text.\n\nITEM 5 Market\n\nMarket info.\n\nITEM 6 Reserved\n\nNothing."
+        ])
+        sections = SectionExtractor(pages, filing_type="10-K").get_sections()
+        assert [(s.part, s.item) for s in sections] == [("PART II", "ITEM 5"), ("PART II", "ITEM 6")]
+        assert sections[0].pages[0].content == "ITEM 5 Market\n\nMarket info."
+
+    def test_intra_page_part_transition(self):
+        pages = self._make_pages([
+            "ITEM 4 Mine Safety\n\nNot applicable.\n\nPART II\n\nITEM 5 Market\n\nMarket info."
+        ])
+        sections = SectionExtractor(pages, filing_type="10-K").get_sections()
+        assert [s.item for s in sections] == ["ITEM 4", "ITEM 5"]
+        assert sections[0].pages[0].content == "ITEM 4 Mine Safety\n\nNot applicable."
+
+    def test_header_index_skips_pages_without_headers(self):
+        pages = self._make_pages([
+            "ITEM 1 Business\n\nIntro.",
+            "Plain continuation text.",
+            "PART II\n\nITEM 5 Market\n\nMarket info.",
+        ])
+        index = list(SectionExtractor(pages, filing_type="10-K")._iter_page_headers())
+        assert [len(e.items) for e in index] == [1, 0, 1]
+        assert [len(e.parts) for e in index] == [0, 0, 1]
+
+    def test_spans_index_page_content(self):
+        pages = self._make_pages([
+            "Intro.\n**ITEM 1A.\u200b Risk Factors**\n\nRisks.\nApple Inc. | 2024 Form 10-K | 12\n12\nMore risks.\nITEM 2 Properties\n\nOffices."
+        ])
+        sections = SectionExtractor(pages, filing_type="10-K").get_sections()
+        [risk] = [s for s in sections if s.item == "ITEM 1A"]
+        [span] = risk.spans
+        raw = span.page.content[span.start:span.end]
+        assert raw.startswith("**ITEM 1A.") and raw.endswith("More risks.")
+        assert risk.markdown() == "ITEM 1A. Risk Factors\n\nRisks.\nMore risks."
+
+    def test_tag_spanning_lines_matches_tail_scan(self):
+        """A '<' line can make a PART match start before the current ITEM; the tail is rescanned."""
+        background = "Company background text that is long enough to be kept as its own PART section."
+        pages = self._make_pages([
+            f"ITEM 3 - Legal\n\nLitigation.\n<x\nItem 5 >\nPART II\n\n{background}"
+        ])
+        sections = SectionExtractor(pages, filing_type="10-Q").get_sections()
+        assert [(s.item, s.pages[0].content) for s in sections] == [
+            ("ITEM 5", "Item 5 >"), (None, f"PART II\n\n{background}"),
+        ]
+
 
 class TestSectionExtractor8K:
     """8-K section extraction."""
@@ -197,6 +245,24 @@ class TestSectionExtractor8K:
         # Page with TABLE OF CONTENTS
         assert extractor._is_8k_boilerplate_page("TABLE OF CONTENTS here", 2) is True
 
+    def test_many_items_on_one_page(self):
+        body = "\n\n".join(f"ITEM {1 + k % 8}.0{1 + k % 9} Event {k}\n\nDetails {k}." for k in range(300))
+        sections = SectionExtractor(self._make_pages(["Cover", body]), filing_type="8-K").get_sections()
+        assert len(sections) == 300
+        assert sections[-1].item_title == "Event 299"
+        assert sections[-1].pages[0].content == "Details 299."
+
+    def test_table_rows_kept_as_content(self):
+        pages = self._make_pages([
+            "Cover",
+            "ITEM 9.01 Financial Statements and Exhibits\n\n(d) Exhibits\n\n"
+            "| Exhibit No. | Description |\n| --- | --- |\n| 99.1 | Item 2.02 press release |",
+            "ITEM 2.02 Results\n\nRevenue grew.",
+        ])
+        sections = SectionExtractor(pages, filing_type="8-K").get_sections()
+        assert [s.item for s in sections] == ["ITEM 9.01", "ITEM 2.02"]
+        assert [(e.exhibit_no, e.description) for e in sections[0].exhibits] == [("99.1", "Item 2.02 press release")]
+
 
 class TestGetSection:
     """get_section function for retrieving specific sections."""
@@ -264,6 +330,117 @@ class TestExtractSections:
         sections = extract_sections([], filing_type="10-K")
         assert sections == []
 
+    def test_desired_items_only(self):
+        pages = [
+            Page(number=1, content="ITEM 1 Business\n\nContent here."),
+            Page(number=2, content="ITEM 1A Risk Factors\n\nRisk content."),
+            Page(number=3, content="ITEM 2 Properties\n\nOffices."),
+        ]
+        sections = extract_sections(pages, "10-K", desired_items=[Item10K.RISK_FACTORS, "ITEM 2"])
+        assert [s.item for s in sections] == ["ITEM 1A", "ITEM 2"]
+        assert sections[0].pages[0].content == "ITEM 1A Risk Factors\n\nRisk content."
+
+    def test_desired_items_stop_after_closing_header(self, monkeypatch):
+        pages = [
+            Page(number=1, content="ITEM 1 Business\n\nContent here."),
+            Page(number=2, content="More business."),
+            Page(number=3, content="ITEM 1A Risk Factors\n\nRisk content."),
+            Page(number=4, content="ITEM 2 Properties\n\nOffices."),
+        ]
+        scanned = []
+        original = SectionExtractor.page_text
+        monkeypatch.setattr(SectionExtractor, "page_text",
+                            lambda self, page: scanned.append(page.number) or original(self, page))
+        sections = extract_sections(pages, "10-K", desired_items=[Item10K.BUSINESS])
+        assert [s.item for s in sections] == ["ITEM 1"]
+        assert [p.number for p in sections[0].pages] == [1, 2]
+        assert scanned == [1, 2, 3]
+
+    def test_desired_items_part_specific(self):
+        pages = [
+            Page(number=1, content="PART I\n\nITEM 1 Financial Statements\n\nBalance sheet."),
+            Page(number=2, content="PART II\n\nITEM 1 Legal Proceedings\n\nNone."),
+        ]
+        sections = extract_sections(pages, "10-Q", desired_items=[Item10Q.LEGAL_PROCEEDINGS_P2])
+        assert [(s.part, s.item) for s in sections] == [("PART II", "ITEM 1")]
+
+    def test_desired_item_repeated_across_parts(self):
+        pages = [
+            Page(number=1, content="PART I\n\nITEM 1 Financial Statements\n\nBalance sheet."),
+            Page(number=2, content="ITEM 2 Management's Discussion and Analysis\n\nResults."),
+            Page(number=3, content="ITEM 3 Quantitative and Qualitative Disclosures\n\nRates."),
+            Page(number=4, content="PART II\n\nITEM 1 Legal Proceedings\n\nNone."),
+            Page(number=5, content="ITEM 2 Unregistered Sales of Equity Securities\n\nNone."),
+            Page(number=6, content="ITEM 6 Exhibits\n\nList."),
+        ]
+        expected = [(s.part, s.item) for s in extract_sections(pages, "10-Q") if s.item == "ITEM 2"]
+        sections = extract_sections(pages, "10-Q", desired_items=["ITEM 2"])
+        assert [(s.part, s.item) for s in sections] == expected == [("PART I", "ITEM 2"), ("PART II", "ITEM 2")]
+
+    def test_desired_8k_items_stop_early(self):
+        pages = [
+            Page(number=1, content="Cover"),
+            Page(number=2, content="ITEM 2.02 Results of Operations\n\nRevenue grew."),
+            Page(number=3, content="ITEM 7.01 Regulation FD\n\nPresentation."),
+            Page(number=4, content="ITEM 9.01 Financial Statements and Exhibits\n\nNone."),
+        ]
+        extractor = SectionExtractor(pages, filing_type="8-K", desired_items={"2.02"}, debug=True)
+        sections = extractor.get_sections()
+        assert [s.item for s in sections] == ["ITEM 2.02"]
+        assert sections[0].pages[0].content == "Revenue grew."
+
+    def test_get_section_from_pages(self):
+        pages = [
+            Page(number=1, content="ITEM 1 Business\n\nContent here."),
+            Page(number=2, content="ITEM 1A Risk Factors\n\nRisk content."),
+            Page(number=3, content="ITEM 2 Properties\n\nOffices."),
+        ]
+        section = get_section(pages, Item10K.RISK_FACTORS)
+        assert section.item == "ITEM 1A"
+        assert get_section(pages, "ITEM 7") is None
+
+
+class TestIterSections:
+    """Incremental extraction over a page iterator."""
+
+    def _stream(self, contents: list[str], pulled: list[int]):
+        for i, c in enumerate(contents):
+            pulled.append(i + 1)
+            yield Page(number=i + 1, content=c)
+
+    def test_section_yielded_when_closed(self):
+        pulled = []
+        contents = [
+            "ITEM 1 Business\n\nContent here.",
+            "ITEM 1A Risk Factors\n\nRisk content.",
+            "More risks.",
+            "ITEM 2 Properties\n\nOffices.",
+        ]
+        sections = iter_sections(self._stream(contents, pulled), filing_type="10-K")
+        first = next(sections)
+        assert first.item == "ITEM 1" and pulled == [1, 2]
+        second = next(sections)
+        assert [p.number for p in second.pages] == [2, 3] and pulled == [1, 2, 3, 4]
+        assert [s.item for s in sections] == ["ITEM 2"]
+
+    def test_matches_extract_sections(self):
+        contents = [
+            "PART I\n\nITEM 1 Business\n\nIntro.\n\nITEM 1A Risk Factors\n\nRisks.",
+            "ITEM 3 Legal Proceedings\n\nNone.",
+            "PART II\n\nITEM 5 Market\n\nMarket info.\n\nITEM 17 Bogus\n\nDropped by validation.",
+        ]
+        pages = [Page(number=i + 1, content=c) for i, c in enumerate(contents)]
+        streamed = list(iter_sections(self._stream(contents, []), filing_type="10-K"))
+        listed = extract_sections(pages, filing_type="10-K")
+        assert [(s.part, s.item, [p.content for p in s.pages]) for s in streamed] == \
+            [(s.part, s.item, [p.content for p in s.pages]) for s in listed]
+
+    def test_8k_stream(self):
+        pulled = []
+        contents = ["Cover", "ITEM 2.02 Results\n\nRevenue grew.", "ITEM 9.01 Exhibits\n\nNone.", "SIGNATURES"]
+        sections = iter_sections(self._stream(contents, pulled), filing_type="8-K")
+        assert next(sections).item == "ITEM 2.02" and pulled == [1, 2, 3]
+
 
 class TestSectionExtractor13D:
     """SC 13D section extraction."""
@@ -0,0 +1,131 @@
+"""Tests for the element -> source HTML sidecar map (source_map.py)."""
+
+import json
+
+import pytest
+
+from sec2md.parser import Parser
+from sec2md.source_map import scan_start_tags
+
+LONG = "Net sales increased 2% compared to 2023, driven by higher sales of Services — and iPhone. "
+
+HTML = f"""<!DOCTYPE html>
+<html><head><title>10-K <b>not a tag</b></title><!-- <p>commented out</p> -->
+<style>p > b {{ color: red }}</style></head><body>
+<p style="font-weight:bold"><b>Overview</b></p>
+<div><p>{LONG * 4}<ix:nonFraction name="us-gaap:Revenues" contextRef="c1" unitRef="usd">391,035</ix:nonFraction></p></div>
+<table><tr><td>Revenue</td><td>391</td></tr><tr><td>Cost</td><td>210</td></tr></table>
+<div style="page-break-before:always"><div><p>{LONG * 5}</p></div></div>
+</body></html>"""
+
+
+@pytest.fixture(autouse=True)
+def _fast_tokens(monkeypatch):
+    monkeypatch.setattr("sec2md.models._count_tokens", lambda text: len(text) // 4)
+
+
+def _element(pages, text):
+    return next(e for p in pages for e in p.elements if text in e.content)
+
+
+class TestScanStartTags:
+    def test_skips_comments_and_raw_text(self):
+        names = [name for name, _ in scan_start_tags(HTML)]
+        assert names[:5] == ["html", "head", "title", "style", "body"]
+        assert "b" not in names[:5]
+        assert names.count("p") == 3
+
+    def test_quoted_gt_in_attribute(self):
+        html = '<p title="a > b">x</p><span>y</span>'
+        assert scan_start_tags(html) == [("p", 0), ("span", 22)]
+
+
+class TestSourceFragment:
+    def test_fragment_is_raw_slice(self):
+        parser = Parser(HTML)
+        pages = parser.get_pages()
+        element = _element(pages, "Overview")
+        start, end = HTML.index("<b>Overview"), HTML.index("</table>") + len("</table>")
+        assert parser.get_source_fragment(element.id) == HTML[start:end]
+
+    def test_one_range_per_source_node(self):
+        parser = Parser(HTML)
+        pages = parser.get_pages()
+        ranges = parser.source_map.char_ranges(_element(pages, "Overview").id)
+        fragments = [HTML[start:end] for start, end in ranges]
+        assert fragments[0] == "<b>Overview</b>"
+        assert fragments[2] == '<ix:nonFraction name="us-gaap:Revenues" contextRef="c1" unitRef="usd">391,035</ix:nonFraction>'
+        assert fragments[3].startswith("<table>") and fragments[3].endswith("</table>")
+
+    def test_nested_same_name_tags(self):
+        html = f"<body><div><div>{LONG * 4}</div></div><div><span>{LONG}</span></div></body>"
+        parser = Parser(html)
+        pages = parser.get_pages()
+        first, _ = parser.source_map.char_ranges(pages[0].elements[0].id)
+        assert html[first[0]:first[1]] == f"<div>{LONG * 4}</div>"
+
+    def test_unknown_id(self):
+        parser = Parser(HTML)
+        parser.get_pages()
+        assert parser.get_source_fragment("sec2md-p1-x9-deadbeef") is None
+
+    def test_unclosed_paragraphs(self):
+        html = f"<body><div><p>{LONG * 3}<p>{LONG * 4}</div><p>After.</body>"
+        parser = Parser(html)
+        pages = parser.get_pages()
+        fragment = parser.get_source_fragment(pages[0].elements[0].id)
+        assert fragment.startswith("<p>")
+        assert "</div>" not in fragment and "After." not in fragment
+
+    def test_dom_not_reserialized(self, monkeypatch):
+        parser = Parser(HTML)
+        pages = parser.get_pages()
+        monkeypatch.setattr(type(parser.soup), "__str__", lambda self: pytest.fail("DOM serialized"))
+        assert parser.get_source_fragment(pages[0].elements[0].id)
+
+    def test_lazy_page_materialized_on_demand(self):
+        eager, lazy = Parser(HTML), Parser(HTML)
+        element = eager.get_pages()[1].elements[0]
+        pages = lazy.get_pages(lazy_elements=True)
+        assert lazy.get_source_fragment(element.id) == eager.get_source_fragment(element.id)
+        assert pages[1].elements_loaded and not pages[0].elements_loaded
+
+
+class TestByteRanges:
+    def test_ranges_are_utf8_byte_offsets(self):
+        parser = Parser(HTML)
+        pages = parser.get_pages()
+        raw = HTML.encode("utf-8")
+        for page in pages:
+            for element in page.elements:
+                start, end = parser.source_map.span(element.id)
+                assert raw[start:end].decode("utf-8") == parser.get_source_fragment(element.id)
+
+    def test_ranges_count_original_bytes_of_cp1252_input(self):
+        html = HTML.replace("<head>", '<head><meta charset="windows-1252">').replace("—", "–")
+        raw = html.encode("cp1252")
+        parser = Parser(raw)
+        pages = parser.get_pages()
+        for page in pages:
+            for element in page.elements:
+                start, end = parser.source_map.span(element.id)
+                fragment = parser.get_source_fragment(element.id)
+                assert "\ufffd" not in fragment
+                assert raw[start:end].decode("cp1252") == fragment
+
+    def test_ranges_past_checkpoints(self):
+        html = HTML.replace(LONG * 5, LONG * 200)
+        raw = html.encode("utf-8")
+        for parser in (Parser(html), Parser(raw)):
+            pages = parser.get_pages()
+            for page in pages:
+                for element in page.elements:
+                    start, end = parser.source_map.span(element.id)
+                    assert raw[start:end].decode("utf-8") == parser.get_source_fragment(element.id)
+
+    def test_to_dict_sidecar(self):
+        parser = Parser(HTML)
+        pages = parser.get_pages()
+        sidecar = json.loads(json.dumps(parser.source_map.to_dict()))
+        assert set(sidecar) == {e.id for p in pages for e in p.elements}
+        assert all(start < end for ranges in sidecar.values() for start, end in ranges)
@@ -0,0 +1,90 @@
+"""Tests for the TextBlock registry (text_block_registry.py)."""
+
+import pytest
+
+from sec2md.chunking import merge_text_blocks
+from sec2md.parser import Parser
+from sec2md.text_block_registry import TextBlockRegistry
+
+LONG = "The Company has outstanding fixed-rate notes with varying maturities for an aggregate principal amount. "
+
+HTML = f"""<html><body>
+<p>Cover page.</p>
+<div style="page-break-before:always"><div><ix:nonnumeric name="us-gaap:DebtDisclosureTextBlock" contextref="c1" continuedat="cont1">
+<p><b>Note 9 – Debt</b></p><p>{LONG * 6}</p></ix:nonnumeric></div></div>
+<div style="page-break-before:always"><div><ix:continuation id="cont1"><p>{LONG * 6}</p></ix:continuation></div></div>
+<div><div><ix:nonnumeric name="us-gaap:LeasesOfLesseeDisclosureTextBlock" contextref="c1"><p><b>Note 10 – Leases</b></p><p>{LONG * 4}</p></ix:nonnumeric></div></div>
+<div style="page-break-before:always"><p>Unrelated final page.</p></div>
+</body></html>"""
+
+
+@pytest.fixture(autouse=True)
+def _fast_tokens(monkeypatch):
+    monkeypatch.setattr("sec2md.models._count_tokens", lambda text: len(text) // 4)
+
+
+class TestRegistry:
+    def test_recorded_during_walk(self):
+        parser = Parser(HTML)
+        parser.get_pages()
+        registry = parser.text_block_registry
+        assert registry.names() == ["us-gaap:DebtDisclosureTextBlock", "us-gaap:LeasesOfLesseeDisclosureTextBlock"]
+        assert registry.entry("us-gaap:DebtDisclosureTextBlock").pages == [2, 3]
+        assert registry.entry("us-gaap:LeasesOfLesseeDisclosureTextBlock").page_span == (3, 3)
+
+    def test_matches_merge_text_blocks(self):
+        parser = Parser(HTML)
+        pages = parser.get_pages()
+        for merged in merge_text_blocks(pages):
+            found = parser.get_text_block(merged.name)
+            assert found.model_dump() == merged.model_dump()
+
+    def test_cached_and_unknown(self):
+        parser = Parser(HTML)
+        parser.get_pages()
+        name = "us-gaap:DebtDisclosureTextBlock"
+        assert parser.get_text_block(name) is parser.get_text_block(name)
+        assert parser.get_text_block("us-gaap:Missing") is None
+
+    def test_lazy_pages_only_note_pages_materialized(self):
+        parser = Parser(HTML)
+        pages = parser.get_pages(lazy_elements=True)
+        note = parser.get_text_block("us-gaap:LeasesOfLesseeDisclosureTextBlock")
+        assert note.source_pages == [3]
+        assert [p.elements_loaded for p in pages] == [False, False, True, False]
+
+    def test_record_out_of_order_pages(self):
+        registry = TextBlockRegistry()
+        for page in (4, 4, 2, 4, 3):
+            registry.record("us-gaap:X", "X", page)
+        assert registry.entry("us-gaap:X").pages == [2, 3, 4]
+
+    def test_element_ids_recorded_per_page(self):
+        parser = Parser(HTML)
+        pages = parser.get_pages()
+        entry = parser.text_block_registry.entry("us-gaap:DebtDisclosureTextBlock")
+        merged = next(tb for tb in merge_text_blocks(pages) if tb.name == entry.name)
+        assert entry.element_ids == merged.element_ids
+        assert sorted(entry.elements_by_page) == [2, 3]
+
+    def test_lookup_does_not_rescan_pages(self, monkeypatch):
+        parser = Parser(HTML)
+        pages = parser.get_pages()
+        for page in pages:
+            page.text_blocks = None
+        note = parser.get_text_block("us-gaap:DebtDisclosureTextBlock")
+        assert note.source_pages == [2, 3]
+
+    def test_chunk_from_entry_matches_merged(self, monkeypatch):
+        from sec2md.chunking import chunk_text_block
+
+        for target in ("sec2md.chunker.blocks.estimate_tokens", "sec2md.chunker.chunker.estimate_tokens"):
+            monkeypatch.setattr(target, lambda text: max(1, len(text) // 4))
+        parser = Parser(HTML)
+        pages = parser.get_pages(lazy_elements=True)
+        entry = parser.get_text_block_entry("us-gaap:DebtDisclosureTextBlock")
+        assert [p.elements_loaded for p in pages] == [False, True, True, False]
+        from_entry = chunk_text_block(entry, chunk_size=256)
+        from_merged = chunk_text_block(parser.get_text_block(entry.name), chunk_size=256)
+        assert [c.content for c in from_entry] == [c.content for c in from_merged]
+        assert [c.element_ids for c in from_entry] == [c.element_ids for c in from_merged]
@@ -0,0 +1,87 @@
+"""Tests for offset-backed text storage (text_buffer.py)."""
+
+import copy
+import pickle
+
+import pytest
+
+from sec2md.models import Section
+from sec2md.parser import Parser
+from sec2md.text_buffer import TextBuffer, TextSpan, share_page_text, joined_span
+
+LONG = (
+    "The Company designs, manufactures and markets smartphones, personal computers, tablets, "
+    "wearables and accessories, and sells a variety of related services. "
+)
+
+HTML = f"""<html><body>
+<p><b>Overview</b></p>
+<p>{LONG * 4}</p>
+<table><tr><td>Item</td><td>2024</td></tr><tr><td>Revenue</td><td>391</td></tr></table>
+<div style="page-break-before:always"><p>{LONG * 5}</p><p>{LONG * 2}</p></div>
+<div style="page-break-before:always"><p>Last page.</p></div>
+</body></html>"""
+
+
+def _pages(shared: bool):
+    return Parser(HTML).get_pages(shared_text=shared)
+
+
+class TestSharedText:
+    @pytest.fixture(autouse=True)
+    def _fast_tokens(self, monkeypatch):
+        monkeypatch.setattr("sec2md.models._count_tokens", lambda text: len(text) // 4)
+
+    def test_content_identical(self):
+        plain, shared = _pages(False), _pages(True)
+        assert [p.content for p in shared] == [p.content for p in plain]
+        assert [e.content for p in shared for e in p.elements] == [e.content for p in plain for e in p.elements]
+
+    def test_serialization_identical(self):
+        plain, shared = _pages(False), _pages(True)
+        for a, b in zip(plain, shared):
+            assert b.model_dump() == a.model_dump()
+            assert list(b.model_dump()) == list(a.model_dump())
+            assert b.model_dump_json() == a.model_dump_json()
+            assert b.to_dict(include_only_essentials=True) == a.to_dict(include_only_essentials=True)
+            assert "content" not in b.model_dump(exclude={"content"})
+
+    def test_one_buffer_backs_pages_and_elements(self):
+        shared = _pages(True)
+        buffers = {id(p._text_span.buffer) for p in shared}
+        buffers |= {id(e._text_span.buffer) for p in shared for e in p.elements if e._text_span}
+        assert len(buffers) == 1
+        assert all("content" not in p.__dict__ for p in shared)
+
+    def test_assignment_replaces_span(self):
+        page = _pages(True)[0]
+        page.content = "edited"
+        assert page.content == "edited"
+        assert page.model_dump()["content"] == "edited"
+
+    def test_copy_and_pickle(self):
+        page = _pages(True)[0]
+        assert copy.deepcopy(page).content == page.content
+        assert pickle.loads(pickle.dumps(page)).content == page.content
+
+    def test_section_markdown_from_buffer(self):
+        plain, shared = _pages(False), _pages(True)
+        assert Section(pages=shared).markdown() == Section(pages=plain).markdown()
+        assert Section(pages=shared).content == Section(pages=plain).content
+
+
+class TestJoinedSpan:
+    def test_adjacent(self):
+        buf = TextBuffer("ab\n\ncd")
+        span = joined_span([TextSpan(buf, 0, 2), TextSpan(buf, 4, 6)])
+        assert span.text() == "ab\n\ncd"
+
+    def test_gap_or_missing(self):
+        buf = TextBuffer("ab\n\ncd\n\nef")
+        assert joined_span([TextSpan(buf, 0, 2), TextSpan(buf, 8, 10)]) is None
+        assert joined_span([TextSpan(buf, 0, 2), None]) is None
+
+    def test_share_returns_buffer(self):
+        pages = _pages(False)
+        expected = "\n\n".join(p.content for p in pages)
+        assert share_page_text(pages).text == expected
@@ -0,0 +1,115 @@
+"""Tests for iXBRL fact extraction (xbrl.py)."""
+
+from bs4 import BeautifulSoup
+
+from sec2md.parser import Parser
+from sec2md.xbrl import FactTable, extract_facts, parse_number
+
+LONG = (
+    "The Company designs, manufactures and markets smartphones, personal computers, tablets, "
+    "wearables and accessories, and sells a variety of related services. "
+)
+
+HTML = f"""<html><body>
+<div style="display:none"><ix:header><ix:hidden>
+<ix:nonnumeric name="dei:DocumentType" contextref="FY2024">10-K</ix:nonnumeric>
+</ix:hidden><ix:resources>
+<xbrli:context id="FY2024"><xbrli:entity><xbrli:identifier scheme="http://www.sec.gov/CIK">0000320193</xbrli:identifier></xbrli:entity>
+<xbrli:period><xbrli:startdate>2023-10-01</xbrli:startdate><xbrli:enddate>2024-09-28</xbrli:enddate></xbrli:period></xbrli:context>
+<xbrli:context id="FY2024_iPhone"><xbrli:entity><xbrli:identifier scheme="http://www.sec.gov/CIK">0000320193</xbrli:identifier>
+<xbrli:segment><xbrldi:explicitmember dimension="srt:ProductOrServiceAxis">us-gaap:IPhoneMember</xbrldi:explicitmember></xbrli:segment></xbrli:entity>
+<xbrli:period><xbrli:startdate>2023-10-01</xbrli:startdate><xbrli:enddate>2024-09-28</xbrli:enddate></xbrli:period></xbrli:context>
+<xbrli:context id="AsOf2024"><xbrli:entity><xbrli:identifier scheme="http://www.sec.gov/CIK">0000320193</xbrli:identifier></xbrli:entity>
+<xbrli:period><xbrli:instant>2024-09-28</xbrli:instant></xbrli:period></xbrli:context>
+<xbrli:unit id="usd"><xbrli:measure>iso4217:USD</xbrli:measure></xbrli:unit>
+<xbrli:unit id="usdPerShare"><xbrli:divide><xbrli:unitnumerator><xbrli:measure>iso4217:USD</xbrli:measure></xbrli:unitnumerator>
+<xbrli:unitdenominator><xbrli:measure>xbrli:shares</xbrli:measure></xbrli:unitdenominator></xbrli:divide></xbrli:unit>
+</ix:resources></ix:header></div>
+<p>Net sales were $<ix:nonfraction name="us-gaap:Revenues" contextref="FY2024" unitref="usd" decimals="-6" scale="6" id="f1">391,035</ix:nonfraction> million. {LONG * 3}</p>
+<p>{LONG * 4}</p>
+<table><tr><td>Item</td><td>2024</td></tr>
+<tr><td>iPhone</td><td><ix:nonfraction name="us-gaap:Revenues" contextref="FY2024_iPhone" unitref="usd" decimals="-6" scale="6" id="f2">201,183</ix:nonfraction></td></tr>
+<tr><td>Other income</td><td>(<ix:nonfraction name="us-gaap:NonoperatingIncomeExpense" contextref="FY2024" unitref="usd" decimals="-6" scale="6" sign="-" id="f3">269</ix:nonfraction>)</td></tr>
+<tr><td>EPS</td><td><ix:nonfraction name="us-gaap:EarningsPerShareDiluted" contextref="FY2024" unitref="usdPerShare" decimals="2" id="f4">6.08</ix:nonfraction></td></tr>
+<tr><td>Impairment</td><td><ix:nonfraction name="us-gaap:GoodwillImpairmentLoss" contextref="AsOf2024" unitref="usd" format="ixt:fixed-zero" scale="6" id="f5">—</ix:nonfraction></td></tr>
+</table>
+<p><ix:nonnumeric name="us-gaap:CommitmentsTextBlock" contextref="FY2024" continuedat="c1" id="f6">Commitments start.</ix:nonnumeric> {LONG * 4}</p>
+<p><ix:continuation id="c1">Commitments end.</ix:continuation> {LONG * 4}</p>
+</body></html>"""
+
+
+def _facts():
+    parser = Parser(HTML)
+    pages = parser.get_pages()
+    return parser, pages, parser.get_facts()
+
+
+class TestParseNumber:
+    def test_dot_decimal(self):
+        assert parse_number("1,234.50") == 1234.5
+
+    def test_comma_decimal(self):
+        assert parse_number("1.234,50", "ixt:num-comma-decimal") == 1234.5
+
+    def test_zero_dash(self):
+        assert parse_number("—") == 0.0
+        assert parse_number("none", "ixt:fixed-zero") == 0.0
+
+    def test_words_not_numeric(self):
+        assert parse_number("three", "ixt-sec:numwordsen") is None
+
+
+class TestExtractFacts:
+    def test_all_facts_in_document_order(self):
+        _, _, facts = _facts()
+        assert facts.fact_id == [None, "f1", "f2", "f3", "f4", "f5", "f6"]
+        assert len(facts) == 7
+
+    def test_scale_and_sign_applied(self):
+        _, _, facts = _facts()
+        values = dict(zip(facts.fact_id, facts.value))
+        assert values["f1"] == 391_035_000_000
+        assert values["f3"] == -269_000_000
+        assert values["f4"] == 6.08
+        assert values["f5"] == 0.0
+        assert values["f6"] is None
+
+    def test_context_and_units_resolved(self):
+        _, _, facts = _facts()
+        row = facts.where(concept="us-gaap:Revenues").to_records()
+        assert row[0]["period_start"] == "2023-10-01"
+        assert row[0]["period_end"] == "2024-09-28"
+        assert row[0]["unit"] == "iso4217:USD"
+        assert row[0]["dimensions"] is None
+        assert row[1]["dimensions"] == {"srt:ProductOrServiceAxis": "us-gaap:IPhoneMember"}
+        eps = facts.where(concept="us-gaap:EarningsPerShareDiluted").to_records()[0]
+        assert eps["unit"] == "iso4217:USD/xbrli:shares"
+        assert eps["decimals"] == "2"
+        assert facts.where(concept="us-gaap:GoodwillImpairmentLoss")["instant"] == ["2024-09-28"]
+
+    def test_continuation_text_joined(self):
+        _, _, facts = _facts()
+        text = facts.where(concept="us-gaap:CommitmentsTextBlock").text[0]
+        assert text.startswith("Commitments start.")
+        assert "Commitments end." in text
+
+    def test_linked_to_elements(self):
+        _, pages, facts = _facts()
+        elements = {e.id: e for p in pages for e in (p.elements or [])}
+        ids = dict(zip(facts.fact_id, facts.element_id))
+        assert ids[None] is None  # ix:hidden
+        table = elements[ids["f2"]]
+        assert table.kind == "table"
+        assert ids["f3"] == ids["f2"]
+        assert "391,035" in elements[ids["f1"]].content
+
+    def test_columns_equal_length(self):
+        _, _, facts = _facts()
+        columns = facts.to_dict()
+        assert list(columns) == FactTable.column_names()
+        assert {len(c) for c in columns.values()} == {len(facts)}
+
+    def test_without_parsing_elements(self):
+        facts = extract_facts(BeautifulSoup(HTML, "lxml"))
+        assert len(facts) == 7
+        assert set(facts.element_id) == {None}